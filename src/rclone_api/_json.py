@@ -0,0 +1,35 @@
+"""
+JSON decoding for rclone output, and encoding of our own state files.
+
+lsjson listings, rc replies and the multipart upload state are handled by
+orjson when it is installed, which is several times faster than the stdlib
+on large arrays. Falls back to the stdlib json module otherwise. Install with
+`pip install rclone_api[fast]`.
+"""
+
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+
+    def loads(data: str | bytes) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+    def dumps(data: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    HAS_ORJSON = True
+
+except ImportError:
+
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(data: Any, indent: bool = False) -> bytes:
+        return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+    HAS_ORJSON = False
@@ -0,0 +1,124 @@
+"""
+In-process cache of ls results.
+
+Repeated exists/ls/scan calls over the same paths each fork an rclone
+lsjson. When enabled, listings are kept for a short ttl in an LRU bounded
+both by entry count and by the total number of listed paths, and dropped as
+soon as this process writes to or deletes anything under them.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+from rclone_api.rpath import RPath
+
+
+def _is_under(path: str, prefix: str) -> bool:
+    if path == prefix:
+        return True
+    if not prefix.endswith(("/", ":")):
+        prefix += "/"
+    return path.startswith(prefix)
+
+
+def overlaps(a: str, b: str) -> bool:
+    """True if either path contains the other."""
+    a = a.rstrip("/")
+    b = b.rstrip("/")
+    return _is_under(a, b) or _is_under(b, a)
+
+
+class ListingCache:
+    def __init__(
+        self, maxsize: int = 256, ttl: float = 60.0, max_items: int = 1_000_000
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        # key -> (expire time, listed path, paths)
+        self._entries: OrderedDict[Hashable, tuple[float, str, list[RPath]]] = (
+            OrderedDict()
+        )
+        self._items = 0
+
+    def get(self, key: Hashable) -> list[RPath] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, _, paths = entry
+            if expires < time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return list(paths)
+
+    def put(self, key: Hashable, path: str, paths: list[RPath]) -> None:
+        if len(paths) > self.max_items:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, path, list(paths))
+            self._items += len(paths)
+            while self._entries and (
+                len(self._entries) > self.maxsize or self._items > self.max_items
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop listings of or under path, everything if path is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._items = 0
+                return
+            stale = [k for k, e in self._entries.items() if overlaps(e[1], path)]
+            for key in stale:
+                self._pop(key)
+
+    def _pop(self, key: Hashable) -> None:
+        _, _, paths = self._entries.pop(key)
+        self._items -= len(paths)
+
+
+class MissingCache:
+    """Paths recently found not to exist, kept for a few seconds.
+
+    Collapses exists() polling of an absent path into one stat per ttl. Like
+    ListingCache, entries are dropped when this process writes under them.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            expires = self._entries.get(path)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._entries[path]
+                return False
+            return True
+
+    def add(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = time.monotonic() + self.ttl
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if overlaps(k, path)]:
+                del self._entries[key]
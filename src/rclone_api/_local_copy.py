@@ -0,0 +1,106 @@
+"""
+Copies between two local paths without going through rclone.
+
+When both ends of a copy are on the local filesystem, spawning rclone only
+adds a process and a trip of every byte through user space. Here the
+kernel moves the data with copy_file_range, or on Linux sendfile where that
+isn't supported, falling back to a plain buffered copy.
+"""
+
+import errno
+import os
+import re
+import sys
+from pathlib import Path
+
+_WINDOWS_DRIVE = re.compile(r"^[A-Za-z]:[\\/]")
+_BLOCK = 1 << 30
+# Read size of the plain copy used when the kernel can't do it.
+_BUFSIZE = 1 << 20
+_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+# Only Linux sendfile takes a regular file as the destination, elsewhere it
+# wants a socket.
+_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+# Errors that mean "this file pair can't use the fast path", not a real failure.
+_UNSUPPORTED = {
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTSOCK,
+}
+
+
+def local_path(path: str) -> Path | None:
+    """The local Path an rclone style path refers to, None for remotes."""
+    if path.startswith(":local:"):
+        return Path(path[len(":local:") :])
+    if ":" not in path or (os.name == "nt" and _WINDOWS_DRIVE.match(path)):
+        return Path(path)
+    return None
+
+
+def _copy_in_kernel(fin: int, fout: int, offset: int, length: int) -> int:
+    """Copy with copy_file_range or sendfile, returns the bytes copied."""
+    copied = 0
+    use_copy_file_range = _COPY_FILE_RANGE
+    os.lseek(fout, 0, os.SEEK_SET)
+    while copied < length:
+        count = min(_BLOCK, length - copied)
+        try:
+            if use_copy_file_range:
+                n = os.copy_file_range(fin, fout, count, offset + copied)
+            else:
+                n = os.sendfile(fout, fin, offset + copied, count)
+        except OSError as e:
+            if (
+                copied == 0
+                and use_copy_file_range
+                and _SENDFILE
+                and e.errno in _UNSUPPORTED
+            ):
+                use_copy_file_range = False
+                continue
+            raise
+        if n == 0:  # end of file
+            break
+        copied += n
+    return copied
+
+
+def copy_range(src: Path, dst: Path, offset: int = 0, length: int = -1) -> int:
+    """Copy length bytes of src starting at offset into dst, -1 copies to the end.
+
+    dst is created or truncated, its parent directories are created.
+    Returns the number of bytes copied.
+    """
+    size = src.stat().st_size
+    if length < 0 or offset + length > size:
+        length = max(0, size - offset)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        if _COPY_FILE_RANGE or _SENDFILE:
+            try:
+                return _copy_in_kernel(fin.fileno(), fout.fileno(), offset, length)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED:
+                    raise
+                fout.seek(0)
+                fout.truncate()
+        fin.seek(offset)
+        copied = 0
+        while copied < length:
+            chunk = fin.read(min(_BUFSIZE, length - copied))
+            if not chunk:
+                break
+            fout.write(chunk)
+            copied += len(chunk)
+        return copied
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy a whole file and keep its modification time, like rclone copyto."""
+    copy_range(src, dst)
+    st = src.stat()
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
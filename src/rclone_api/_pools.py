@@ -0,0 +1,58 @@
+"""
+Process-wide thread pools.
+
+Creating a ThreadPoolExecutor per call costs thread startup and teardown on
+every copy_files/delete_files. These pools are created on first use, grow when
+a caller asks for more workers and are shut down at exit.
+"""
+
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, Semaphore
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_IO_POOL: ThreadPoolExecutor | None = None
+_IO_POOL_SIZE = 0
+_IO_POOL_LOCK = Lock()
+
+
+def get_io_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Get the shared io pool, with room for at least max_workers threads."""
+    global _IO_POOL, _IO_POOL_SIZE
+    with _IO_POOL_LOCK:
+        if _IO_POOL is None or _IO_POOL_SIZE < max_workers:
+            old = _IO_POOL
+            _IO_POOL = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="rclone-io"
+            )
+            _IO_POOL_SIZE = max_workers
+            if old is not None:
+                # Work already queued on the old pool still runs to completion.
+                old.shutdown(wait=False)
+        return _IO_POOL
+
+
+def submit_io_tasks(tasks: list[Callable[[], T]], max_workers: int) -> list[Future[T]]:
+    """Run tasks on the shared io pool, at most max_workers of them at once."""
+    max_workers = max(1, max_workers)
+    pool = get_io_pool(max_workers)
+    semaphore = Semaphore(max_workers)
+
+    def _run(task: Callable[[], T]) -> T:
+        with semaphore:
+            return task()
+
+    return [pool.submit(_run, task) for task in tasks]
+
+
+def _shutdown() -> None:
+    global _IO_POOL
+    with _IO_POOL_LOCK:
+        if _IO_POOL is not None:
+            _IO_POOL.shutdown(wait=False, cancel_futures=True)
+            _IO_POOL = None
+
+
+atexit.register(_shutdown)
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+DEFAULT_CONFIG = Path("rclone.conf")
+
+
+def resolve_config(config: Path | None) -> Path:
+    """The --config path, rclone.conf in the working directory if not given."""
+    if config is not None:
+        return config
+    if not DEFAULT_CONFIG.exists():
+        raise FileNotFoundError(f"Config file not found: {DEFAULT_CONFIG}")
+    return DEFAULT_CONFIG
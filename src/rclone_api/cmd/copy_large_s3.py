@@ -1,9 +1,11 @@
 import argparse
 import sys
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 from rclone_api import Rclone, SizeSuffix
+from rclone_api.cmd._cli_common import resolve_config
 
 
 @dataclass
@@ -11,8 +13,9 @@ class Args:
     config_path: Path
     src: str
     dst: str
-    chunk_size: SizeSuffix
+    chunk_size: SizeSuffix | None  # None picks it from the file size
     threads: int
+    read_threads: int | None
     retries: int
     save_state_json: Path
     verbose: bool
@@ -25,7 +28,8 @@ def list_files(rclone: Rclone, path: str):
             print(file.path)
 
 
-def _parse_args() -> Args:
+@cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="List files in a remote path.")
     parser.add_argument("src", help="File to copy")
     parser.add_argument("dst", help="Destination file")
@@ -35,9 +39,9 @@ def _parse_args() -> Args:
     )
     parser.add_argument(
         "--chunk-size",
-        help="Chunk size that will be read and uploaded in SizeSuffix form, too low or too high will cause issues",
+        help="Chunk size that will be read and uploaded in SizeSuffix form, too low or too high will cause issues. auto picks 64MiB to 256MiB from the file size",
         type=str,
-        default="128MB",  # if this is too low or too high an s3 service
+        default="auto",
     )
     parser.add_argument(
         "--threads",
@@ -45,6 +49,12 @@ def _parse_args() -> Args:
         type=int,
         default=8,
     )
+    parser.add_argument(
+        "--read-threads",
+        help="Max number of chunks to read from the source in parallel, defaults to --threads",
+        type=int,
+        default=None,
+    )
     parser.add_argument("--retries", help="Number of retries", type=int, default=3)
     parser.add_argument(
         "--resume-json",
@@ -52,20 +62,25 @@ def _parse_args() -> Args:
         type=Path,
         default="resume.json",
     )
+    return parser
+
 
-    args = parser.parse_args()
-    config: Path | None = args.config
-    if config is None:
-        config = Path("rclone.conf")
-        if not config.exists():
-            raise FileNotFoundError(f"Config file not found: {config}")
-    assert config is not None
+def _choose_chunk(chunk_size: str) -> SizeSuffix | None:
+    """The --chunk-size value, None for auto so it's picked from the file size."""
+    if chunk_size.lower() == "auto":
+        return None
+    return SizeSuffix(chunk_size)
+
+
+def _parse_args(argv: list[str] | None = None) -> Args:
+    args = _build_parser().parse_args(argv)
     out = Args(
-        config_path=config,
+        config_path=resolve_config(args.config),
         src=args.src,
         dst=args.dst,
         threads=args.threads,
-        chunk_size=SizeSuffix(args.chunk_size),
+        read_threads=args.read_threads,
+        chunk_size=_choose_chunk(args.chunk_size),
         retries=args.retries,
         save_state_json=args.resume_json,
         verbose=args.verbose,
@@ -91,6 +106,9 @@ def main() -> int:
     err: Exception | None = rclone.copy_file_s3_resumable(
         src=args.src,
         dst=args.dst,
+        upload_threads=args.threads,
+        read_threads=args.read_threads,
+        chunk_size=args.chunk_size,
     )
     if err is not None:
         print(f"Error: {err}")
@@ -99,7 +117,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-
+    if len(sys.argv) > 1:
+        sys.exit(main())
     sys.argv.append("--config")
     sys.argv.append("rclone.conf")
     sys.argv.append(
@@ -1,21 +1,32 @@
 import argparse
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from rclone_api import Rclone
-from rclone_api.s3.multipart.upload_parts_server_side_merge import (
-    s3_server_side_multi_part_merge,
-)
+from rclone_api.cmd._cli_common import resolve_config
+
+# Finishes in flight at once in batch mode, each runs its own part copy pool.
+_BATCH_WORKERS = 4
 
 
 @dataclass
 class Args:
     config_path: Path
-    src: str  # like dst:TorrentBooks/aa_misc_data/aa_misc_data/world_lending_library_2024_11.tar.zst-parts/ (info.json will be located here)
+    # like dst:TorrentBooks/aa_misc_data/aa_misc_data/world_lending_library_2024_11.tar.zst-parts/ (info.json will be located here)
+    src: str | None
     verbose: bool
+    max_workers: int | None
+    batch: list[str] = field(default_factory=list)
+
+    @property
+    def srcs(self) -> list[str]:
+        return ([self.src] if self.src else []) + self.batch
 
     def __repr__(self):
-        return f"Args(config_path={self.config_path}, src={self.src}, verbose={self.verbose})"
+        return f"Args(config_path={self.config_path}, src={self.src}, verbose={self.verbose}, max_workers={self.max_workers}, batch={len(self.batch)} srcs)"
 
     def __str__(self):
         return repr(self)
@@ -28,51 +39,102 @@ def list_files(rclone: Rclone, path: str):
             print(file.path)
 
 
-def _parse_args() -> Args:
+@cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="List files in a remote path.")
-    parser.add_argument("src", help="Directory that holds the info.json file")
+    parser.add_argument(
+        "src", help="Directory that holds the info.json file", nargs="?"
+    )
     parser.add_argument("--no-verbose", help="Verbose output", action="store_true")
     parser.add_argument(
         "--config", help="Path to rclone config file", type=Path, required=False
     )
-    args = parser.parse_args()
-    config: Path | None = args.config
-    if config is None:
-        config = Path("rclone.conf")
-        if not config.exists():
-            raise FileNotFoundError(f"Config file not found: {config}")
-    assert config is not None
+    parser.add_argument(
+        "--max-workers",
+        help="Parallel part copies, tuned to the part count and latency by default",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--batch-from-file",
+        help="File with one src directory per line to finish in one run, - for stdin",
+        type=str,
+        default=None,
+    )
+    return parser
+
+
+def _read_batch(path: str) -> list[str]:
+    """The src directories listed in path, skipping blank lines and # comments."""
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        text = Path(path).read_text(encoding="utf-8")
+    out: list[str] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            out.append(line)
+    return out
+
+
+def _parse_args(argv: list[str] | None = None) -> Args:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.src is None and args.batch_from_file is None:
+        parser.error("either src or --batch-from-file is required")
     out = Args(
-        config_path=config,
+        config_path=resolve_config(args.config),
         src=args.src,
         verbose=not args.no_verbose,
+        max_workers=args.max_workers,
+        batch=_read_batch(args.batch_from_file) if args.batch_from_file else [],
     )
     return out
 
 
-def _get_info_path(src: str) -> str:
-    if src.endswith("/"):
-        src = src[:-1]
-    info_path = f"{src}/info.json"
-    return info_path
-
-
 def main() -> int:
     """Main entry point."""
     print("Starting...")
     args = _parse_args()
     print(f"args: {args}")
-    rclone = Rclone(rclone_conf=args.config_path)
-    info_path = _get_info_path(src=args.src)
-    s3_server_side_multi_part_merge(
-        rclone=rclone.impl, info_path=info_path, max_workers=5, verbose=args.verbose
+    # boto3 and the merge code are only imported once the arguments are valid.
+    from rclone_api.s3.multipart.info_json import info_json_path
+    from rclone_api.s3.multipart.upload_parts_server_side_merge import (
+        s3_server_side_multi_part_merge,
     )
-    return 0
 
+    # One rclone and, through get_s3_client, one boto3 client per bucket are
+    # shared by every finish in the batch.
+    rclone = Rclone(rclone_conf=args.config_path)
 
-if __name__ == "__main__":
-    import sys
+    def finish(src: str) -> Exception | None:
+        return s3_server_side_multi_part_merge(
+            rclone=rclone.impl,
+            info_path=info_json_path(src),
+            max_workers=args.max_workers,
+            verbose=args.verbose,
+        )
+
+    srcs = args.srcs
+    if len(srcs) == 1:
+        errors = [finish(srcs[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+            errors = list(executor.map(finish, srcs))
+    failed = 0
+    for src, err in zip(srcs, errors):
+        if err is not None:
+            failed += 1
+            print(f"Error: {src}: {err}")
+    if len(srcs) > 1:
+        print(f"Finished {len(srcs) - failed} of {len(srcs)} uploads")
+    return 1 if failed else 0
 
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
     sys.argv.append("--config")
     sys.argv.append("rclone.conf")
     sys.argv.append(
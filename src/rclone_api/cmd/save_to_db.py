@@ -1,11 +1,13 @@
 import argparse
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 from rclone_api import Rclone
+from rclone_api.file_stream import DEFAULT_PAGE_SIZE
 
 # load_dotenv()
 
@@ -15,6 +17,7 @@ from rclone_api import Rclone
 # os.environ["DB_URL"] = "sqlite:///data.db"
 
 
+@lru_cache(maxsize=1)
 def _db_url_from_env_or_raise() -> str:
     load_dotenv(Path(".env"))
     db_url = os.getenv("DB_URL")
@@ -29,17 +32,33 @@ class Args:
     path: str
     db_url: str
     fast_list: bool
+    batch_size: int
+    defer_indexes: bool
 
     def __post_init__(self):
         if not self.config.exists():
             raise FileNotFoundError(f"Config file not found: {self.config}")
 
 
-def fill_db(rclone: Rclone, path: str, fast_list: bool) -> None:
-    """List files in a remote path."""
+def fill_db(
+    rclone: Rclone,
+    path: str,
+    fast_list: bool,
+    batch_size: int = DEFAULT_PAGE_SIZE,
+    defer_indexes: bool = True,
+    db_url: str | None = None,
+) -> None:
+    """List files in a remote path, db_url defaults to DB_URL from the env."""
     # db = DB(_db_url_from_env_or_raise())
-    db_url = _db_url_from_env_or_raise()
-    rclone.save_to_db(src=path, db_url=db_url, fast_list=fast_list)
+    if db_url is None:
+        db_url = _db_url_from_env_or_raise()
+    rclone.save_to_db(
+        src=path,
+        db_url=db_url,
+        fast_list=fast_list,
+        batch_size=batch_size,
+        defer_indexes=defer_indexes,
+    )
 
 
 def _parse_args() -> Args:
@@ -49,6 +68,18 @@ def _parse_args() -> Args:
     )
     parser.add_argument("--db", help="Database URL", type=str, default=None)
     parser.add_argument("--fast-list", help="Use fast list", action="store_true")
+    parser.add_argument(
+        "--batch-size",
+        "--page-size",
+        help="Rows written to the database per transaction",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+    )
+    parser.add_argument(
+        "--no-defer-indexes",
+        help="Keep the secondary indexes up to date while filling an empty table",
+        action="store_true",
+    )
     parser.add_argument("path", help="Remote path to list")
     tmp = parser.parse_args()
     return Args(
@@ -56,6 +87,8 @@ def _parse_args() -> Args:
         path=tmp.path,
         db_url=tmp.db if tmp.db is not None else _db_url_from_env_or_raise(),
         fast_list=tmp.fast_list,
+        batch_size=tmp.batch_size,
+        defer_indexes=not tmp.no_defer_indexes,
     )
 
 
@@ -64,7 +97,14 @@ def main() -> int:
     args = _parse_args()
     path = args.path
     rclone = Rclone(Path(args.config))
-    fill_db(rclone=rclone, path=path, fast_list=args.fast_list)
+    fill_db(
+        rclone=rclone,
+        path=path,
+        fast_list=args.fast_list,
+        batch_size=args.batch_size,
+        defer_indexes=args.defer_indexes,
+        db_url=args.db_url,
+    )
     return 0
 
 
@@ -2,13 +2,13 @@ import subprocess
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletedProcess:
     completed: list[subprocess.CompletedProcess]
 
     @property
     def ok(self) -> bool:
-        return all([p.returncode == 0 for p in self.completed])
+        return all(p.returncode == 0 for p in self.completed)
 
     @staticmethod
     def from_subprocess(process: subprocess.CompletedProcess) -> "CompletedProcess":
@@ -22,21 +22,11 @@ class CompletedProcess:
 
     @property
     def stdout(self) -> str:
-        tmp: list[str] = []
-        for cp in self.completed:
-            stdout = cp.stdout
-            if stdout is not None:
-                tmp.append(stdout)
-        return "\n".join(tmp)
+        return "\n".join(cp.stdout for cp in self.completed if cp.stdout is not None)
 
     @property
     def stderr(self) -> str:
-        tmp: list[str] = []
-        for cp in self.completed:
-            stderr = cp.stderr
-            if stderr is not None:
-                tmp.append(stderr)
-        return "\n".join(tmp)
+        return "\n".join(cp.stderr for cp in self.completed if cp.stderr is not None)
 
     @property
     def returncode(self) -> int | None:
@@ -49,12 +39,9 @@ class CompletedProcess:
         return 0
 
     def __str__(self) -> str:
-
-        cmd_strs: list[str] = []
-        rtn_cods: list[int] = []
-        for cp in self.completed:
-            cmd_strs.append(subprocess.list2cmdline(cp.args))
-            rtn_cods.append(cp.returncode)
-        msg = f"CompletedProcess: {len(cmd_strs)} commands\n"
-        msg += "\n".join([f"{cmd} -> {rtn}" for cmd, rtn in zip(cmd_strs, rtn_cods)])
-        return msg
+        lines = [
+            f"{subprocess.list2cmdline(cp.args)} -> {cp.returncode}"
+            for cp in self.completed
+        ]
+        msg = f"CompletedProcess: {len(lines)} commands\n"
+        return msg + "\n".join(lines)
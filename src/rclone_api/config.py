@@ -2,10 +2,16 @@ import os
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Dict
 
+# Default config locations found by asking rclone, keyed on the environment
+# that decides where rclone looks. Finding them costs a subprocess call.
+_CONF_FILE_CACHE: dict[tuple[str | None, ...], Path] = {}
+_CONF_FILE_CACHE_LOCK = Lock()
 
-@dataclass
+
+@dataclass(slots=True)
 class Section:
     name: str
     data: Dict[str, str] = field(default_factory=dict)
@@ -38,7 +44,7 @@ class Section:
         return self.data.get("endpoint")
 
 
-@dataclass
+@dataclass(slots=True)
 class Parsed:
     # sections: List[ParsedSection]
     sections: dict[str, Section]
@@ -51,6 +57,8 @@ class Parsed:
 class Config:
     """Rclone configuration dataclass."""
 
+    __slots__ = ("text",)
+
     # text: str
     def __init__(self, text: str | dict | None) -> None:
         self.text: str
@@ -75,12 +83,17 @@ class Config:
         return Parsed.parse(self.text)
 
 
-def find_conf_file(rclone: Any | None = None) -> Path | None:
-    import subprocess
+def _conf_env_key() -> tuple[str | None, ...]:
+    return (
+        os.getcwd(),
+        os.environ.get("HOME"),
+        os.environ.get("XDG_CONFIG_HOME"),
+        os.environ.get("APPDATA"),
+        os.environ.get("PATH"),
+    )
 
-    from rclone_api import Rclone
-    from rclone_api.rclone_impl import RcloneImpl
 
+def find_conf_file(rclone: Any | None = None) -> Path | None:
     # if os.environ.get("RCLONE_CONFIG"):
     #     return Path(os.environ["RCLONE_CONFIG"])
     # return None
@@ -91,6 +104,24 @@ def find_conf_file(rclone: Any | None = None) -> Path | None:
     if (conf := Path.cwd() / "rclone.conf").exists():
         return conf
 
+    key = _conf_env_key()
+    with _CONF_FILE_CACHE_LOCK:
+        cached = _CONF_FILE_CACHE.get(key)
+    if cached is not None and cached.exists():
+        return cached
+    found = _find_default_conf_file(rclone)
+    if found is not None:
+        with _CONF_FILE_CACHE_LOCK:
+            _CONF_FILE_CACHE[key] = found
+    return found
+
+
+def _find_default_conf_file(rclone: Any | None = None) -> Path | None:
+    import subprocess
+
+    from rclone_api import Rclone
+    from rclone_api.rclone_impl import RcloneImpl
+
     if rclone is None:
         has_rclone = shutil.which("rclone")
         if not has_rclone:
@@ -148,28 +179,23 @@ def parse_rclone_config(content: str) -> Parsed:
     Each section in the file starts with a line like [section_name]
     followed by key=value pairs.
     """
-    sections: List[Section] = []
+    data: dict[str, Section] = {}
     current_section: Section | None = None
 
-    lines = content.splitlines()
-    for line in lines:
+    for line in content.splitlines():
         line = line.strip()
         # Skip empty lines and comments (assumed to start with '#' or ';')
-        if not line or line.startswith(("#", ";")):
+        if not line or line[0] in "#;":
             continue
         # New section header detected
-        if line.startswith("[") and line.endswith("]"):
-            section_name = line[1:-1].strip()
-            current_section = Section(name=section_name)
-            sections.append(current_section)
-        elif "=" in line and current_section is not None:
+        if line[0] == "[" and line[-1] == "]":
+            current_section = Section(name=line[1:-1].strip())
+            data[current_section.name] = current_section
+        elif current_section is not None:
             # Parse key and value, splitting only on the first '=' found
-            key, value = line.split("=", 1)
-            current_section.add(key.strip(), value.strip())
-
-    data: dict[str, Section] = {}
-    for section in sections:
-        data[section.name] = section
+            key, sep, value = line.partition("=")
+            if sep:
+                current_section.data[key.rstrip()] = value.lstrip()
     return Parsed(sections=data)
 
 
@@ -2,14 +2,88 @@
 Database module for rclone_api.
 """
 
+import csv
+import io
 import os
+from contextlib import contextmanager
+from operator import itemgetter
 from threading import Lock
-from typing import Optional
+from typing import Any, Generator, Optional
 
+from sqlalchemy import bindparam, event, func, insert, update
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from rclone_api.db.models import RepositoryMeta, create_file_entry_model
-from rclone_api.file import FileItem
+from rclone_api.file import FileBatch, FileItem, _get_suffix
+
+_INSERT_COLUMNS = ("path", "name", "size", "mime_type", "mod_time", "suffix")
+# Bulk loads of millions of rows split far fewer btree pages with 64KiB pages.
+_SQLITE_PAGE_SIZE = 65536
+# Negative is KiB, 64MiB of cache whatever the page size.
+_SQLITE_CACHE_SIZE = -65536
+# Reads of the file map straight into memory instead of copying through
+# read(), an upper bound so small databases don't reserve it.
+_SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _sqlite_page_size() -> int:
+    """DB_PAGE_SIZE overrides the page size used for new sqlite databases."""
+    return int(os.environ.get("DB_PAGE_SIZE", _SQLITE_PAGE_SIZE))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL + synchronous=NORMAL lets bulk ingest avoid an fsync per transaction.
+    cursor = dbapi_connection.cursor()
+    # Only takes effect while the file is still empty, and must come before
+    # WAL is enabled. Existing databases keep their page size.
+    cursor.execute(f"PRAGMA page_size={_sqlite_page_size()}")
+    cursor.execute(f"PRAGMA cache_size={_SQLITE_CACHE_SIZE}")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # The sorts of the deferred index builds stay off temp files.
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute(f"PRAGMA mmap_size={_SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def _pg_copy_rows(dbapi_connection: Any, table_name: str, rows: list[dict]) -> bool:
+    """Load rows with COPY FROM STDIN, returns False if the driver can't do it."""
+    columns = ", ".join(_INSERT_COLUMNS)
+    sql = f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv)'
+    cursor = dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row([row[c] for c in _INSERT_COLUMNS])
+            return True
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            for row in rows:
+                writer.writerow([row[c] for c in _INSERT_COLUMNS])
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)
+            return True
+        return False
+    finally:
+        cursor.close()
+
+
+def _sqlite_insert_rows(
+    dbapi_connection: Any, table_name: str, rows: list[dict]
+) -> None:
+    """Insert rows with the sqlite3 executemany, without sqlalchemy's per-row
+    parameter processing, which costs more than the insert itself.
+    """
+    columns = ", ".join(_INSERT_COLUMNS)
+    marks = ", ".join("?" * len(_INSERT_COLUMNS))
+    sql = f'INSERT INTO "{table_name}" ({columns}) VALUES ({marks})'
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.executemany(sql, map(itemgetter(*_INSERT_COLUMNS), rows))
+    finally:
+        cursor.close()
 
 
 def _to_table_name(remote_name: str) -> str:
@@ -36,6 +110,8 @@ class DB:
         for _ in range(retries):
             try:
                 self.engine = create_engine(db_path_url)
+                if self.engine.dialect.name == "sqlite":
+                    event.listen(self.engine, "connect", _set_sqlite_pragmas)
                 SQLModel.metadata.create_all(self.engine)
                 break
             except Exception as e:
@@ -70,6 +146,15 @@ class DB:
             repo = self.get_or_create_repo(remote_name)
             repo.insert_files(files)
 
+    def add_batch(self, batch: FileBatch) -> None:
+        """Add a column-wise batch of files from a single remote.
+
+        Args:
+            batch: Files from FilesStream.iter_batches()
+        """
+        repo = self.get_or_create_repo(batch.remote)
+        repo.insert_batch(batch)
+
     def query_all_files(self, remote_name: str) -> list[FileItem]:
         """Query files from the database.
 
@@ -155,24 +240,16 @@ class DBRepo:
         """
         Insert multiple file entries into the table.
 
-        Three bulk operations are performed:
-        1. Select: Determine which files already exist.
-        2. Insert: Bulk-insert new file entries.
+        Runs as a single transaction:
+        1. Select: Look up the ids of paths that already exist.
+        2. Insert: Bulk-insert new file entries (COPY on PostgreSQL).
         3. Update: Bulk-update existing file entries.
 
-        The FileEntryModel must define a unique constraint on (path, name) and have a primary key "id".
+        The FileEntryModel must define a unique constraint on path and have a primary key "id".
         """
-        # Step 1: Bulk select existing records.
-        # get_exists() returns a set of FileItem objects (based on path_no_remote and name) that already exist.
-        existing_files = self.get_exists(files)
-
-        # Determine which files need to be updated vs. inserted.
-        needs_update = existing_files
-        is_new = set(files) - existing_files
-
-        # Step 2: Bulk insert new rows.
-        new_values = [
-            {
+        # Last entry wins if the same path shows up twice in one batch.
+        rows: dict[str, dict[str, Any]] = {
+            file.path_no_remote: {
                 "path": file.path_no_remote,
                 "name": file.name,
                 "size": file.size,
@@ -180,45 +257,130 @@ class DBRepo:
                 "mod_time": file.mod_time,
                 "suffix": file.real_suffix,
             }
-            for file in is_new
-        ]
+            for file in files
+        }
+        self._upsert_rows(rows)
+
+    def is_empty(self) -> bool:
+        """True if the table has no file entries yet."""
         with Session(self.engine) as session:
-            if new_values:
-                session.bulk_insert_mappings(self.FileEntryModel, new_values)  # type: ignore
-                session.commit()
+            count = session.exec(
+                select(func.count()).select_from(self.FileEntryModel)
+            ).one()
+        return count == 0
+
+    @contextmanager
+    def deferred_indexes(self) -> Generator[None, None, None]:
+        """Drop the non-unique indexes for a bulk load and rebuild them after.
+
+        Building an index once over the loaded rows is much cheaper than
+        updating it row by row. Unique indexes stay, they guard the data.
+        """
+        table = self.FileEntryModel.__table__  # type: ignore
+        indexes = [index for index in table.indexes if not index.unique]
+        for index in indexes:
+            index.drop(self.engine, checkfirst=True)
+        try:
+            yield
+        finally:
+            for index in indexes:
+                index.create(self.engine, checkfirst=True)
+
+    def insert_batch(
+        self, batch: FileBatch, new_only: bool = False, presort: bool = True
+    ) -> None:
+        """Insert a column-wise batch, same semantics as insert_files().
+
+        With new_only the caller promises none of the paths are in the table
+        yet (like a first load into an empty table), the lookup of existing
+        rows is skipped and the batch becomes one bulk insert. With presort
+        new rows go in ordered by path, so the path index is filled left to
+        right instead of at the scattered spots of the listing order.
+        """
+        rows: dict[str, dict[str, Any]] = {
+            path: {
+                "path": path,
+                "name": name,
+                "size": size,
+                "mime_type": mime_type,
+                "mod_time": mod_time,
+                "suffix": _get_suffix(name),
+            }
+            for path, name, size, mime_type, mod_time in zip(
+                batch.paths,
+                batch.names,
+                batch.sizes,
+                batch.mime_types,
+                batch.mod_times,
+            )
+        }
+        self._upsert_rows(rows, new_only=new_only, presort=presort)
+
+    def _upsert_rows(
+        self,
+        by_path: dict[str, dict[str, Any]],
+        new_only: bool = False,
+        presort: bool = False,
+    ) -> None:
+        if not by_path:
+            return
+        table = self.FileEntryModel.__table__  # type: ignore
 
-        # Step 3: Bulk update existing rows.
-        # First, query the database for the primary keys of rows that match the unique keys in needs_update.
         with Session(self.engine) as session:
-            # Collect all unique paths from files needing update.
-            update_paths = [file.path_no_remote for file in needs_update]
-            # Query for existing rows matching any of these paths.
-            db_entries = session.exec(
-                select(self.FileEntryModel).where(
-                    self.FileEntryModel.path.in_(update_paths)  # type: ignore
+            # Step 1: Bulk select existing records.
+            id_map: dict[str, int] = {}
+            if not new_only:
+                id_map = dict(
+                    session.exec(
+                        select(self.FileEntryModel.path, self.FileEntryModel.id).where(  # type: ignore
+                            self.FileEntryModel.path.in_(by_path.keys())  # type: ignore
+                        )
+                    ).all()
                 )
-            ).all()
 
-            # Build a mapping from the unique key (path, name) to the primary key (id).
-            id_map = {(entry.path, entry.name): entry.id for entry in db_entries}
-
-            # Prepare bulk update mappings.
-            update_values = []
-            for file in needs_update:
-                key = (file.path_no_remote, file.name)
-                if key in id_map:
-                    update_values.append(
-                        {
-                            "id": id_map[key],
-                            "size": file.size,
-                            "mime_type": file.mime_type,
-                            "mod_time": file.mod_time,
-                            "suffix": file.real_suffix,
-                        }
+            # Step 2: Bulk insert new rows.
+            new_values = [row for path, row in by_path.items() if path not in id_map]
+            if presort:
+                new_values.sort(key=itemgetter("path"))
+            if new_values:
+                copied = False
+                dialect = self.engine.dialect.name
+                dbapi_connection = session.connection().connection.dbapi_connection
+                if dialect == "postgresql":
+                    copied = _pg_copy_rows(
+                        dbapi_connection, self.table_name, new_values
                     )
+                elif dialect == "sqlite":
+                    _sqlite_insert_rows(dbapi_connection, self.table_name, new_values)
+                    copied = True
+                if not copied:
+                    session.execute(insert(table), new_values)
+
+            # Step 3: Bulk update existing rows.
+            update_values = [
+                {
+                    "_id": id_map[path],
+                    "size": row["size"],
+                    "mime_type": row["mime_type"],
+                    "mod_time": row["mod_time"],
+                    "suffix": row["suffix"],
+                }
+                for path, row in by_path.items()
+                if path in id_map
+            ]
             if update_values:
-                session.bulk_update_mappings(self.FileEntryModel, update_values)  # type: ignore
-                session.commit()
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("_id"))
+                    .values(
+                        size=bindparam("size"),
+                        mime_type=bindparam("mime_type"),
+                        mod_time=bindparam("mod_time"),
+                        suffix=bindparam("suffix"),
+                    )
+                )
+                session.connection().execute(stmt, update_values)
+            session.commit()
 
     def get_exists(self, files: list[FileItem]) -> set[FileItem]:
         """Get file entries from the table that exist among the given files.
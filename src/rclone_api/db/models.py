@@ -5,7 +5,7 @@ Database models for rclone_api.
 from abc import ABC, abstractmethod
 from typing import Optional, Type
 
-from sqlalchemy import BigInteger, Column
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel
 
 
@@ -26,7 +26,9 @@ class FileEntry(SQLModel, ABC):
     path: str = Field(index=True, unique=True)
     suffix: str = Field(index=True)
     name: str
-    size: int = Field(sa_column=Column(BigInteger))
+    # sa_type rather than sa_column: a Column object can only belong to one
+    # table, and every remote gets its own table from this base.
+    size: int = Field(sa_type=BigInteger)
     mime_type: str
     mod_time: str
     hash: Optional[str] = Field(default=None)
@@ -37,6 +39,9 @@ class FileEntry(SQLModel, ABC):
         pass
 
 
+_FILE_ENTRY_MODELS: dict[str, Type[FileEntry]] = {}
+
+
 # Factory to dynamically create a FileEntry model with a given table name
 def create_file_entry_model(_table_name: str) -> Type[FileEntry]:
     """Create a file entry model with a given table name.
@@ -48,10 +53,15 @@ def create_file_entry_model(_table_name: str) -> Type[FileEntry]:
         Type[FileEntryBase]: File entry model class with specified table name
     """
 
+    # A table can only be declared once per MetaData, so reuse earlier models.
+    if _table_name in _FILE_ENTRY_MODELS:
+        return _FILE_ENTRY_MODELS[_table_name]
+
     class FileEntryConcrete(FileEntry, table=True):
         __tablename__ = _table_name  # type: ignore # dynamically set table name
 
         def table_name(self) -> str:
             return _table_name
 
+    _FILE_ENTRY_MODELS[_table_name] = FileEntryConcrete
     return FileEntryConcrete
@@ -1,6 +1,7 @@
 from rclone_api.rclone_impl import RcloneImpl
 from rclone_api.types import (
     PartInfo,
+    SizeSuffix,
 )
 
 
@@ -10,10 +11,13 @@ def copy_file_parts_resumable(
     dst_dir: str,  # dst:/Bucket/path/myfile.large.zst-parts/
     part_infos: list[PartInfo] | None = None,
     upload_threads: int = 10,
-    merge_threads: int = 5,
+    merge_threads: int | None = None,
     verbose: bool | None = None,
+    read_threads: int | None = None,
+    chunk_size: SizeSuffix | None = None,
 ) -> Exception | None:
     # _upload_parts
+    from rclone_api.s3.multipart.info_json import info_json_path
     from rclone_api.s3.multipart.upload_parts_resumable import upload_parts_resumable
     from rclone_api.s3.multipart.upload_parts_server_side_merge import (
         s3_server_side_multi_part_merge,
@@ -28,14 +32,16 @@ def copy_file_parts_resumable(
         dst_dir=dst_dir,
         part_infos=part_infos,
         threads=upload_threads,
+        read_threads=read_threads,
+        chunk_size=chunk_size,
     )
     if isinstance(err, Exception):
         return err
-    if dst_dir.endswith("/"):
-        dst_dir = dst_dir[:-1]
-    dst_info = f"{dst_dir}/info.json"
     err = s3_server_side_multi_part_merge(
-        rclone=self, info_path=dst_info, max_workers=merge_threads, verbose=verbose
+        rclone=self,
+        info_path=info_json_path(dst_dir),
+        max_workers=merge_threads,
+        verbose=verbose,
     )
     if isinstance(err, Exception):
         return err
@@ -0,0 +1,73 @@
+"""
+Manifests of a destination as (path, size, hash) rows in a csv file.
+
+Diffing against a manifest only lists the source, the destination is never
+touched. Files are compared by size and, when asked, the hashes of the files
+whose size matches are computed on the source side only.
+"""
+
+import csv
+import os
+from pathlib import Path
+from typing import Generator, Iterable
+
+from rclone_api.diff import DiffType
+
+_HEADER = ["path", "size", "hash"]
+
+
+def load_manifest(path: Path) -> dict[str, tuple[int, str]]:
+    """Read a manifest into path -> (size, hash), hash is "" when unknown."""
+    out: dict[str, tuple[int, str]] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or row == _HEADER:
+                continue
+            file_path, size = row[0], int(row[1])
+            out[file_path] = (size, row[2] if len(row) > 2 else "")
+    return out
+
+
+def write_manifest(path: Path, entries: dict[str, tuple[int, str]]) -> None:
+    """Write a manifest, replacing any previous one in a single rename."""
+    tmp = path.with_name(path.name + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_HEADER)
+        for file_path in sorted(entries):
+            size, hash = entries[file_path]
+            writer.writerow([file_path, size, hash])
+    os.replace(tmp, path)
+
+
+def parse_hashsum(text: str) -> dict[str, str]:
+    """Parse `rclone hashsum` output, lines of "<hash>  <path>"."""
+    out: dict[str, str] = {}
+    for line in text.splitlines():
+        hash, sep, file_path = line.partition("  ")
+        if sep:
+            out[file_path] = hash
+    return out
+
+
+def compare_to_manifest(
+    listing: Iterable[tuple[str, int]],
+    manifest: dict[str, tuple[int, str]],
+    seen: dict[str, int],
+    same_size: list[str],
+) -> Generator[tuple[DiffType, str], None, None]:
+    """Yield the source files that are new or changed in size.
+
+    Every listed (path, size) is recorded in seen, paths whose size matches
+    the manifest are appended to same_size for an optional hash check.
+    """
+    for file_path, size in listing:
+        seen[file_path] = size
+        entry = manifest.get(file_path)
+        if entry is None:
+            yield DiffType.MISSING_ON_DST, file_path
+        elif entry[0] != size:
+            yield DiffType.DIFFERENT, file_path
+        else:
+            same_size.append(file_path)
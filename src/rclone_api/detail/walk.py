@@ -1,14 +1,21 @@
+import posixpath
 import random
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from queue import Queue
 from threading import Thread
-from typing import Generator
+from typing import Generator, Iterable
 
 from rclone_api import Dir
 from rclone_api.dir_listing import DirListing
 from rclone_api.remote import Remote
+from rclone_api.rpath import RPath
 from rclone_api.types import Order
 
 _MAX_OUT_QUEUE_SIZE = 50
+# Each listing is its own rclone process (or rc call), so walks list one
+# directory at a time unless the caller asks for more.
+DEFAULT_STAT_THREADS = 1
 
 
 def walk_runner_breadth_first(
@@ -42,28 +49,199 @@ def walk_runner_breadth_first(
         _thread.interrupt_main()
 
 
-def walk_runner_depth_first(
+def walk_runner_breadth_first_parallel(
     dir: Dir,
     max_depth: int,
-    out_queue: Queue[DirListing | None],
+    out_queue: Queue[DirListing | Exception | None],
     order: Order = Order.NORMAL,
+    executor: ThreadPoolExecutor | None = None,
+    stat_threads: int = DEFAULT_STAT_THREADS,
 ) -> None:
+    """Breadth first walk that lists many directories at once.
+
+    Child directories are submitted as soon as their parent listing arrives, before
+    the parent is handed to the consumer, so the pool stays busy while the
+    consumer works. If no executor is given a private one with stat_threads
+    workers is used for the duration of the walk.
+    """
+
+    def _ls(d: Dir, depth: int) -> tuple[DirListing, int]:
+        return d.ls(max_depth=0, order=order), depth
+
+    def _run(executor: ThreadPoolExecutor) -> None:
+        pending: set[Future[tuple[DirListing, int]]] = {
+            executor.submit(_ls, dir, max_depth)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                dirlisting, depth = fut.result()
+                if depth != 0:
+                    next_depth = depth - 1 if depth > 0 else depth
+                    for child in dirlisting.dirs:
+                        pending.add(executor.submit(_ls, child, next_depth))
+                out_queue.put(dirlisting)
+
     try:
-        stack = [(dir, max_depth)]
-        while stack:
-            current_dir, depth = stack.pop()
-            dirlisting = current_dir.ls()
-            if order == Order.REVERSE:
-                dirlisting.dirs.reverse()
-            if order == Order.RANDOM:
+        if executor is not None:
+            _run(executor)
+        else:
+            with ThreadPoolExecutor(max_workers=stat_threads) as private_executor:
+                _run(private_executor)
+        out_queue.put(None)
+    except KeyboardInterrupt:
+        import _thread
+
+        out_queue.put(None)
+        _thread.interrupt_main()
+    except Exception as e:
+        out_queue.put(e)
+
+
+def walk_runner_depth_first_parallel(
+    dir: Dir,
+    max_depth: int,
+    out_queue: Queue[DirListing | Exception | None],
+    order: Order = Order.NORMAL,
+    executor: ThreadPoolExecutor | None = None,
+    stat_threads: int = DEFAULT_STAT_THREADS,
+) -> None:
+    """Depth first walk, in the same order as walk_runner_depth_first.
 
-                random.shuffle(dirlisting.dirs)
+    As soon as a listing arrives all of its subdirectories are submitted to the
+    pool, so sibling subtrees are being listed while the walk is still inside
+    the first one. Listings are still emitted children first, parent last.
+    """
+
+    def _ls(d: Dir) -> DirListing:
+        return d.ls(max_depth=0, order=order)
+
+    def _run(executor: ThreadPoolExecutor) -> None:
+        # (listing, pending child listings, depth of the children)
+        stack: list[tuple[DirListing, deque[Future[DirListing]], int]] = []
+
+        def _push(dirlisting: DirListing, depth: int) -> None:
+            children: deque[Future[DirListing]] = deque()
             if depth != 0:
-                for subdir in dirlisting.dirs:  # Process deeper directories first
-                    # stack.append((child, depth - 1 if depth > 0 else depth))
-                    next_depth = depth - 1 if depth > 0 else depth
-                    walk_runner_depth_first(subdir, next_depth, out_queue, order=order)
+                children.extend(executor.submit(_ls, d) for d in dirlisting.dirs)
+            next_depth = depth - 1 if depth > 0 else depth
+            stack.append((dirlisting, children, next_depth))
+
+        _push(_ls(dir), max_depth)
+        while stack:
+            dirlisting, children, depth = stack[-1]
+            if children:
+                _push(children.popleft().result(), depth)
+                continue
+            stack.pop()
             out_queue.put(dirlisting)
+
+    try:
+        if executor is not None:
+            _run(executor)
+        else:
+            with ThreadPoolExecutor(max_workers=stat_threads) as private_executor:
+                _run(private_executor)
+        out_queue.put(None)
+    except KeyboardInterrupt:
+        import _thread
+
+        out_queue.put(None)
+        _thread.interrupt_main()
+    except Exception as e:
+        out_queue.put(e)
+
+
+def walk_from_listing(
+    root: Dir,
+    listing: DirListing | Iterable[RPath],
+    breadth_first: bool,
+    max_depth: int = -1,
+    order: Order = Order.NORMAL,
+) -> Generator[DirListing, None, None]:
+    """Split one recursive listing of root into a DirListing per directory.
+
+    listing may be an iterable of entries, which are grouped as they come
+    in. Nothing is yielded before the last one, as any directory may still
+    get entries until then. Directories come in the same order as walk():
+    level by level breadth first, children before their parent depth first.
+    No further calls to rclone are made.
+    """
+    entries: Iterable[RPath]
+    if isinstance(listing, DirListing):
+        entries = [item.path for item in listing.dirs + listing.files]
+    else:
+        entries = listing
+    children: dict[str, list[RPath]] = {}
+    for rpath in entries:
+        children.setdefault(posixpath.dirname(rpath.path), []).append(rpath)
+
+    def _listing(path: str) -> DirListing:
+        paths = children.get(path, [])
+        if order == Order.REVERSE:
+            paths.reverse()
+        elif order == Order.RANDOM:
+            random.shuffle(paths)
+        return DirListing(paths)
+
+    root_path = root.path.path.rstrip("/")
+    if breadth_first:
+        queue: deque[tuple[str, int]] = deque([(root_path, max_depth)])
+        while queue:
+            path, depth = queue.popleft()
+            dirlisting = _listing(path)
+            yield dirlisting
+            if depth != 0:
+                next_depth = depth - 1 if depth > 0 else depth
+                queue.extend((d.path.path, next_depth) for d in dirlisting.dirs)
+        return
+
+    # (listing, subdirectories still to visit, depth of the subdirectories)
+    stack: list[tuple[DirListing, deque[str], int]] = []
+
+    def _push(path: str, depth: int) -> None:
+        dirlisting = _listing(path)
+        subdirs = deque(d.path.path for d in dirlisting.dirs) if depth != 0 else deque()
+        stack.append((dirlisting, subdirs, depth - 1 if depth > 0 else depth))
+
+    _push(root_path, max_depth)
+    while stack:
+        dirlisting, subdirs, depth = stack[-1]
+        if subdirs:
+            _push(subdirs.popleft(), depth)
+            continue
+        stack.pop()
+        yield dirlisting
+
+
+def _walk_depth_first(
+    dir: Dir,
+    depth: int,
+    out_queue: Queue[DirListing | None],
+    order: Order,
+) -> None:
+    dirlisting = dir.ls()
+    if order == Order.REVERSE:
+        dirlisting.dirs.reverse()
+    if order == Order.RANDOM:
+
+        random.shuffle(dirlisting.dirs)
+    if depth != 0:
+        next_depth = depth - 1 if depth > 0 else depth
+        for subdir in dirlisting.dirs:  # Process deeper directories first
+            _walk_depth_first(subdir, next_depth, out_queue, order)
+    out_queue.put(dirlisting)
+
+
+def walk_runner_depth_first(
+    dir: Dir,
+    max_depth: int,
+    out_queue: Queue[DirListing | None],
+    order: Order = Order.NORMAL,
+) -> None:
+    try:
+        # The end marker is only sent once the whole tree is done, not per subtree.
+        _walk_depth_first(dir, max_depth, out_queue, order)
         out_queue.put(None)
     except KeyboardInterrupt:
         import _thread
@@ -77,12 +255,18 @@ def walk(
     breadth_first: bool,
     max_depth: int = -1,
     order: Order = Order.NORMAL,
+    stat_threads: int = DEFAULT_STAT_THREADS,
+    executor: ThreadPoolExecutor | None = None,
+    maxsize: int | None = None,
 ) -> Generator[DirListing, None, None]:
     """Walk through the given directory recursively.
 
     Args:
         dir: Directory or Remote to walk through
         max_depth: Maximum depth to traverse (-1 for unlimited)
+        stat_threads: Number of directories listed concurrently, 1 lists them one at a time
+        executor: Optional shared pool to run the listings on
+        maxsize: Bound on listings waiting for the consumer, workers block when full
 
     Yields:
         DirListing: Directory listing for each directory encountered
@@ -91,13 +275,30 @@ def walk(
         # Convert Remote to Dir if needed
         if isinstance(dir, Remote):
             dir = Dir(dir)
-        out_queue: Queue[DirListing | None] = Queue(maxsize=_MAX_OUT_QUEUE_SIZE)
+        parallel = stat_threads > 1
+        if maxsize is None:
+            maxsize = 2 * stat_threads if parallel else _MAX_OUT_QUEUE_SIZE
+        out_queue: Queue[DirListing | Exception | None] = Queue(maxsize=maxsize)
 
         def _task() -> None:
-            if breadth_first:
-                walk_runner_breadth_first(dir, max_depth, out_queue, order)
+            if parallel:
+                runner = (
+                    walk_runner_breadth_first_parallel
+                    if breadth_first
+                    else walk_runner_depth_first_parallel
+                )
+                runner(
+                    dir,
+                    max_depth,
+                    out_queue,
+                    order,
+                    executor=executor,
+                    stat_threads=stat_threads,
+                )
+            elif breadth_first:
+                walk_runner_breadth_first(dir, max_depth, out_queue, order)  # type: ignore
             else:
-                walk_runner_depth_first(dir, max_depth, out_queue, order)
+                walk_runner_depth_first(dir, max_depth, out_queue, order)  # type: ignore
 
         # Start worker thread
         worker = Thread(
@@ -109,6 +310,8 @@ def walk(
         while dirlisting := out_queue.get():
             if dirlisting is None:
                 break
+            if isinstance(dirlisting, Exception):
+                raise dirlisting
             yield dirlisting
 
         worker.join()
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from enum import Enum
 from queue import Queue
 from threading import Thread
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
-from rclone_api.process import Process
+if TYPE_CHECKING:
+    from rclone_api.process import Process
 
 
 class DiffType(Enum):
@@ -28,7 +29,7 @@ class DiffOption(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffItem:
     type: DiffType
     path: str
@@ -51,6 +52,23 @@ class DiffItem:
         return f"{self.src_prefix}/{self.path}"
 
 
+# check --combined prints "<marker> <path>". Index the marker byte straight
+# into a table instead of testing each prefix in turn.
+_COMBINED_TABLE: list[DiffType | None] = [None] * 256
+for _diff_type in DiffType:
+    _COMBINED_TABLE[ord(_diff_type.value)] = _diff_type
+
+
+def parse_combined_line(line: bytes) -> tuple[DiffType, bytes] | None:
+    """Split a raw `check --combined` line into (type, path), None for other output."""
+    if len(line) < 3 or line[1] != 0x20:  # 0x20 == ord(" ")
+        return None
+    diff_type = _COMBINED_TABLE[line[0]]
+    if diff_type is None:
+        return None
+    return diff_type, line[2:].rstrip(b"\r\n")
+
+
 def _parse_missing_on_src_dst(line: str) -> str | None:
     if line.endswith("does-not-exist"):
         # 2025/02/17 14:43:38 ERROR : zachs_video/breaking_ai_mind.mp4: file not in S3 bucket rclone-api-unit-test path does-not-exist
@@ -97,7 +115,7 @@ def _classify_diff(
 
 
 def _async_diff_stream_from_running_process(
-    running_process: Process,
+    running_process: "Process",
     src_slug: str,
     dst_slug: str,
     diff_option: DiffOption,
@@ -108,6 +126,23 @@ def _async_diff_stream_from_running_process(
     try:
         assert running_process.stdout is not None
         n_max = 10
+        if diff_option == DiffOption.COMBINED:
+            for line in running_process.stdout:
+                parsed = parse_combined_line(line)
+                if parsed is None:
+                    # Some other output that we don't care about, debug print etc.
+                    continue
+                diff_type, path = parsed
+                output.put(
+                    DiffItem(
+                        diff_type,
+                        path.decode("utf-8", "surrogateescape"),
+                        src_prefix=src_slug,
+                        dst_prefix=dst_slug,
+                    )
+                )
+                count += 1
+            return
         for line in iter(running_process.stdout.readline, b""):
             try:
                 line_str = line.decode("utf-8").strip()
@@ -141,7 +176,7 @@ def _async_diff_stream_from_running_process(
 
 
 def diff_stream_from_running_process(
-    running_process: Process,
+    running_process: "Process",
     src_slug: str,
     dst_slug: str,
     diff_option: DiffOption,
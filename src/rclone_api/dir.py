@@ -11,6 +11,8 @@ from rclone_api.types import ListingOption, Order
 class Dir:
     """Remote file dataclass."""
 
+    __slots__ = ("path",)
+
     @property
     def remote(self) -> Remote:
         return self.path.remote
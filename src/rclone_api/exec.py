@@ -14,17 +14,32 @@ class RcloneExec:
     rclone_exe: Path
 
     def execute(
-        self, cmd: list[str], check: bool, capture: bool | Path | None = None
+        self,
+        cmd: list[str],
+        check: bool,
+        capture: bool | Path | None = None,
+        stdin: str | None = None,
+        binary: bool = False,
     ) -> subprocess.CompletedProcess:
         """Execute rclone command."""
         from rclone_api.util import rclone_execute
 
         return rclone_execute(
-            cmd, self.rclone_config, self.rclone_exe, check=check, capture=capture
+            cmd,
+            self.rclone_config,
+            self.rclone_exe,
+            check=check,
+            capture=capture,
+            stdin=stdin,
+            binary=binary,
         )
 
     def launch_process(
-        self, cmd: list[str], capture: bool | None, log: Path | None
+        self,
+        cmd: list[str],
+        capture: bool | None,
+        log: Path | None,
+        bufsize: int = -1,
     ) -> Process:
         """Launch rclone process."""
 
@@ -35,6 +50,7 @@ class RcloneExec:
             cmd_list=cmd,
             capture_stdout=capture,
             log=log,
+            bufsize=bufsize,
         )
         process = Process(args)
         return process
@@ -1,9 +1,12 @@
 import json
 import warnings
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Generator
 
+from rclone_api import _json
 from rclone_api.rpath import RPath
 
 _STRING_INTERNER: dict[str, str] = {}
@@ -42,6 +45,17 @@ def _suffix_clean_bad_parts(suffix: list[str]) -> list[str]:
 
 def _get_suffix(name: str, chop_compressed_suffixes: bool = True) -> str:
     # name.sql.gz -> sql.gz
+    ext = name.rpartition(".")[2]
+    if (
+        ext != name
+        and ext
+        and ext != "gz"
+        and " " not in ext
+        and "--" not in ext
+        and len(ext) <= _SUFFIX_LARGEST_SIZE
+    ):
+        # The common case, a plain extension survives the cleanup below as is.
+        return ext
     try:
         parts = name.split(".")
         if len(parts) == 1:
@@ -60,8 +74,14 @@ def _get_suffix(name: str, chop_compressed_suffixes: bool = True) -> str:
         return suffix
 
 
+def _parent_of(path: str) -> str:
+    """Path(path).parent.as_posix() without building a Path per listed entry."""
+    head, sep, _ = path.rpartition("/")
+    return head.rstrip("/") or ("/" if sep else ".")
+
+
 # File is too complex, this is a simple dataclass that can be streamed out.
-@dataclass
+@dataclass(slots=True)
 class FileItem:
     """Remote file dataclass."""
 
@@ -73,6 +93,7 @@ class FileItem:
     mod_time: str
     hash: str | None = None
     id: int | None = None
+    _suffix: str = field(init=False, repr=False, compare=False)
 
     @property
     def path(self) -> str:
@@ -102,11 +123,12 @@ class FileItem:
     def from_json(remote: str, data: dict) -> "FileItem | None":
         try:
             path_str: str = data["Path"]
-            parent_path = Path(path_str).parent.as_posix()
+            parent_path = _parent_of(path_str)
             name = data["Name"]
             size = data["Size"]
-            mime_type = data["MimeType"]
-            mod_time = data["ModTime"]
+            # absent when listed with --no-mimetype / --no-modtime
+            mime_type = data.get("MimeType", "")
+            mod_time = data.get("ModTime", "")
 
             return FileItem(
                 remote=remote,
@@ -121,11 +143,11 @@ class FileItem:
             return None
 
     @staticmethod
-    def from_json_str(remote: str, data: str) -> "FileItem | None":
+    def from_json_str(remote: str, data: str | bytes) -> "FileItem | None":
         try:
-            data_dict = json.loads(data)
+            data_dict = _json.loads(data)
             return FileItem.from_json(remote, data_dict)
-        except json.JSONDecodeError:
+        except _json.JSONDecodeError:
             warnings.warn(f"Invalid JSON data: {data}")
             return None
 
@@ -134,9 +156,59 @@ class FileItem:
         return hash(self.path_no_remote)
 
 
+class FileBatch:
+    """A chunk of a listing stored column-wise.
+
+    Large listings are kept as parallel columns instead of one FileItem per
+    path, sizes are packed into a single int64 array. Indexing returns a
+    FileItem view when one is needed.
+    """
+
+    def __init__(self, remote: str) -> None:
+        self.remote = remote
+        self.paths: list[str] = []
+        self.names: list[str] = []
+        self.sizes: array = array("q")
+        self.mime_types: list[str] = []
+        self.mod_times: list[str] = []
+
+    def append_json(self, data: dict) -> bool:
+        try:
+            path, name, size = data["Path"], data["Name"], data["Size"]
+        except KeyError:
+            warnings.warn(f"Invalid data: {data}")
+            return False
+        self.paths.append(path)
+        self.names.append(name)
+        self.sizes.append(size)
+        # absent when listed with --no-mimetype / --no-modtime
+        self.mime_types.append(_intern(data.get("MimeType", "")))
+        self.mod_times.append(data.get("ModTime", ""))
+        return True
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> FileItem:
+        return FileItem(
+            remote=self.remote,
+            parent=Path(self.paths[index]).parent.as_posix(),
+            name=self.names[index],
+            size=self.sizes[index],
+            mime_type=self.mime_types[index],
+            mod_time=self.mod_times[index],
+        )
+
+    def __iter__(self) -> Generator[FileItem, None, None]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 class File:
     """Remote file dataclass."""
 
+    __slots__ = ("path",)
+
     def __init__(
         self,
         path: RPath,
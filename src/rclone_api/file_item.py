@@ -1,8 +1,9 @@
-import json
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
 
+from rclone_api import _json
+
 _STRING_INTERNER: dict[str, str] = {}
 
 
@@ -61,8 +62,8 @@ class FileItem:
     @staticmethod
     def from_json_str(data: str) -> "FileItem | None":
         try:
-            data_dict = json.loads(data)
+            data_dict = _json.loads(data)
             return FileItem.from_json(data_dict)
-        except json.JSONDecodeError:
+        except _json.JSONDecodeError:
             warnings.warn(f"Invalid JSON data: {data}")
             return None
@@ -2,17 +2,53 @@
 Unit test file.
 """
 
-from typing import Generator
+import warnings
+from itertools import islice
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Generator, TypeVar
 
-from rclone_api.file import FileItem
+from rclone_api import _json
+from rclone_api.file import FileBatch, FileItem
 from rclone_api.process import Process
 
+_PUT_TIMEOUT = 0.1
+# Entries per page/batch, large enough to amortize a database transaction.
+DEFAULT_PAGE_SIZE = 10_000
+
+T = TypeVar("T")
+
+
+def lsjson_entry(line: bytes) -> bytes | None:
+    """The json object on one line of lsjson output, None for the brackets."""
+    # lsjson prints "[", then one object per line followed by a comma, then "]".
+    line = line.strip()
+    if line.startswith(b"["):
+        return None
+    if line.endswith(b","):
+        line = line[:-1]
+    if line.endswith(b"]"):
+        return None
+    return line or None
+
+
+def _put_until_stopped(queue: Queue, item: object, stop: Event) -> bool:
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except Full:
+            continue
+    return False
+
 
 class FilesStream:
 
-    def __init__(self, path: str, process: Process) -> None:
+    def __init__(self, path: str, process: Process, maxsize: int = 0) -> None:
+        """maxsize > 0 parses on a reader thread, at most maxsize items ahead."""
         self.path = path
         self.process = process
+        self.maxsize = maxsize
 
     def __enter__(self) -> "FilesStream":
         self.process.__enter__()
@@ -22,31 +58,104 @@ class FilesStream:
         self.process.__exit__(*exc_info)
 
     def files(self) -> Generator[FileItem, None, None]:
-        line: bytes
-        for line in self.process.stdout:
-            linestr: str = line.decode("utf-8").strip()
-            if linestr.startswith("["):
-                continue
-            if linestr.endswith(","):
-                linestr = linestr[:-1]
-            if linestr.endswith("]"):
-                continue
-            fileitem: FileItem | None = FileItem.from_json_str(self.path, linestr)
-            if fileitem is None:
-                continue
-            yield fileitem
+        if self.maxsize > 0:
+            return self._read_ahead(self._parse_lines(), self.maxsize)
+        return self._parse_lines()
+
+    def _read_ahead(
+        self, items: Generator[T, None, None], maxsize: int
+    ) -> Generator[T, None, None]:
+        """Run items on a reader thread, at most maxsize of them ahead."""
+        queue: Queue[T | Exception | None] = Queue(maxsize=maxsize)
+        stop = Event()
+
+        def _reader() -> None:
+            try:
+                for item in items:
+                    if not _put_until_stopped(queue, item, stop):
+                        return
+            except Exception as e:
+                _put_until_stopped(queue, e, stop)
+            _put_until_stopped(queue, None, stop)
+
+        reader = Thread(target=_reader, daemon=True)
+        reader.start()
+        exhausted = False
+        try:
+            while (item := queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item  # type: ignore
+            exhausted = True
+        finally:
+            stop.set()
+            if not exhausted:
+                # Stopped early, don't leave rclone listing the rest of the bucket.
+                self.process.dispose()
+
+    def _parse_lines(self) -> Generator[FileItem, None, None]:
+        # Each entry is parsed as soon as its line arrives, nothing is buffered.
+        exhausted = False
+        try:
+            for line in self.process.stdout:
+                entry = lsjson_entry(line)
+                if entry is None:
+                    continue
+                fileitem: FileItem | None = FileItem.from_json_str(self.path, entry)
+                if fileitem is None:
+                    continue
+                yield fileitem
+            exhausted = True
+        finally:
+            if not exhausted and self.maxsize <= 0:
+                self.process.dispose()
 
     def files_paged(
-        self, page_size: int = 1000
+        self, page_size: int = DEFAULT_PAGE_SIZE
     ) -> Generator[list[FileItem], None, None]:
-        page: list[FileItem] = []
-        for fileitem in self.files():
-            page.append(fileitem)
-            if len(page) >= page_size:
-                yield page
-                page = []
-        if len(page) > 0:
+        files = self.files()
+        while page := list(islice(files, page_size)):
             yield page
 
+    def iter_batches(
+        self, batch_size: int = DEFAULT_PAGE_SIZE, prefetch: int = 0
+    ) -> Generator[FileBatch, None, None]:
+        """Yield the listing as column-wise FileBatch chunks.
+
+        Skips building a FileItem per entry, which is most of the cost of
+        ingesting a listing with millions of objects. With prefetch > 0 the
+        listing is read and parsed on a reader thread up to prefetch batches
+        ahead, so rclone keeps listing while the caller works on a batch.
+        """
+        if prefetch > 0:
+            return self._read_ahead(self._parse_batches(batch_size, False), prefetch)
+        return self._parse_batches(batch_size, True)
+
+    def _parse_batches(
+        self, batch_size: int, dispose_early_exit: bool
+    ) -> Generator[FileBatch, None, None]:
+        batch = FileBatch(self.path)
+        exhausted = False
+        try:
+            for line in self.process.stdout:
+                entry = lsjson_entry(line)
+                if entry is None:
+                    continue
+                try:
+                    data = _json.loads(entry)
+                except _json.JSONDecodeError:
+                    warnings.warn(f"Invalid JSON data: {entry!r}")
+                    continue
+                batch.append_json(data)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = FileBatch(self.path)
+            if len(batch):
+                yield batch
+            exhausted = True
+        finally:
+            if not exhausted and dispose_early_exit:
+                self.process.dispose()
+
     def __iter__(self) -> Generator[FileItem, None, None]:
         return self.files()
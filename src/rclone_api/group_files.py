@@ -82,7 +82,8 @@ class TreeNode:
     def get_child_subpaths(self, parent_path: str | None = None) -> list[str]:
         paths: list[str] = []
         for child in self.child_nodes.values():
-            child_paths = child.get_child_subpaths(parent_path=child.name)
+            child_path = f"{parent_path}/{child.name}" if parent_path else child.name
+            child_paths = child.get_child_subpaths(parent_path=child_path)
             paths.extend(child_paths)
         for file in self.files:
             if parent_path:
@@ -140,8 +141,9 @@ def _make_tree(files: list[str]) -> dict[str, TreeNode]:
         remote = parts.remote
         node: TreeNode = tree.setdefault(remote, TreeNode(remote))
         if parts.parents:
-            for parent in parts.parents:
-                is_last = parent == parts.parents[-1]
+            last = len(parts.parents) - 1
+            for i, parent in enumerate(parts.parents):
+                is_last = i == last
                 node = node.child_nodes.setdefault(
                     parent, TreeNode(parent, parent=node)
                 )
@@ -171,9 +173,7 @@ def _fixup_rclone_paths(outpaths: dict[str, list[str]]) -> dict[str, list[str]]:
 def group_files(files: list[str], fully_qualified: bool = True) -> dict[str, list[str]]:
     """split between filename and parent directory path"""
     if fully_qualified is False:
-        for i, file in enumerate(files):
-            file = "root:" + file
-            files[i] = file
+        files = ["root:" + file for file in files]
     tree: dict[str, TreeNode] = _make_tree(files)
     outpaths: dict[str, list[str]] = {}
     for _, node in tree.items():
@@ -192,6 +192,45 @@ def group_files(files: list[str], fully_qualified: bool = True) -> dict[str, lis
     return out
 
 
+def pack_groups(groups: dict[str, list[str]], max_groups: int) -> dict[str, list[str]]:
+    """Merge prefix groups from group_files(fully_qualified=False) into at most max_groups.
+
+    Neighbouring prefixes (in sorted order) are packed together by file count
+    and re-rooted at their longest common directory, so each group still maps
+    to one `copy --files-from` call over a narrow subtree.
+    """
+    if len(groups) <= max_groups:
+        return groups
+    max_groups = max(1, max_groups)
+    prefixes = sorted(groups)
+    total = sum(len(files) for files in groups.values())
+    target = -(-total // max_groups)  # ceil
+    bins: list[list[str]] = [[]]
+    count = 0
+    for prefix in prefixes:
+        if count >= target and len(bins) < max_groups:
+            bins.append([])
+            count = 0
+        bins[-1].append(prefix)
+        count += len(groups[prefix])
+    out: dict[str, list[str]] = {}
+    for members in bins:
+        split = [m.split("/") if m else [] for m in members]
+        common: list[str] = []
+        for parts in zip(*split):
+            if len(set(parts)) != 1:
+                break
+            common.append(parts[0])
+        root = "/".join(common)
+        files_out: list[str] = []
+        for member, parts in zip(members, split):
+            rel = "/".join(parts[len(common) :])
+            for file in groups[member]:
+                files_out.append(f"{rel}/{file}" if rel else file)
+        out[root] = files_out
+    return out
+
+
 def group_under_remote_bucket(
     files: list[str], fully_qualified: bool = True
 ) -> dict[str, list[str]]:
@@ -257,4 +296,9 @@ def group_under_one_prefix(prefix: str, files: list[str]) -> tuple[str, list[str
     return result.prefix.replace(":/", ":"), result.files
 
 
-__all__ = ["group_files", "group_under_remote_bucket", "group_under_one_prefix"]
+__all__ = [
+    "group_files",
+    "group_under_remote_bucket",
+    "group_under_one_prefix",
+    "pack_groups",
+]
@@ -3,13 +3,14 @@ Unit test file for testing rclone mount functionality.
 """
 
 import logging
+import os
 import tempfile
 import time
 import warnings
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from threading import Semaphore
+from threading import Lock, Semaphore
 from typing import Any
 
 import httpx
@@ -20,6 +21,8 @@ from rclone_api.process import Process
 from rclone_api.types import Range, SizeSuffix, get_chunk_tmpdir
 
 _TIMEOUT = 10 * 60  # 10 minutes
+_MAX_CONNECTIONS = 32
+_CHUNK_SIZE = 1024 * 1024
 _PUT_WARNED = False
 
 logger = logging.getLogger(__name__)
@@ -65,6 +68,18 @@ class HttpServer:
         self.url = url
         self.subpath = subpath
         self.process: Process | None = process
+        self._client: httpx.Client | None = None
+        self._client_lock = Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Keep-alive client shared by all downloads against this server."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=_MAX_CONNECTIONS),
+                )
+            return self._client
 
     def _get_file_url(self, path: str | Path) -> str:
         # if self.subpath == "":
@@ -87,7 +102,7 @@ class HttpServer:
         try:
             assert self.process is not None
             url = self._get_file_url(path)
-            response = httpx.head(url)
+            response = self._get_client().head(url)
             return response.status_code == 200
         except Exception as e:
             warnings.warn(f"Failed to check if {self.url}/{path} exists: {e}")
@@ -98,7 +113,7 @@ class HttpServer:
         try:
             assert self.process is not None
             url = self._get_file_url(path)
-            response = httpx.head(url)
+            response = self._get_client().head(url)
             response.raise_for_status()
             size = int(response.headers["Content-Length"])
             return size
@@ -129,7 +144,7 @@ class HttpServer:
         try:
             assert self.process is not None
             url = self._get_file_url(path)
-            response = httpx.delete(url)
+            response = self._get_client().delete(url)
             response.raise_for_status()
             return None
         except Exception as e:
@@ -147,7 +162,7 @@ class HttpServer:
             if path:
                 url += f"/{path}"
             url += "/?list"
-            response = httpx.get(url, timeout=_TIMEOUT)
+            response = self._get_client().get(url)
             response.raise_for_status()
             files_and_dirs = _parse_files_and_dirs(response.content.decode())
             return files_and_dirs.files, files_and_dirs.dirs
@@ -169,16 +184,22 @@ class HttpServer:
                 headers.update(range.to_header())
             url = self._get_file_url(path)
             try:
-                with httpx.stream(
-                    "GET", url, headers=headers, timeout=_TIMEOUT
-                ) as response:
+                with self._get_client().stream("GET", url, headers=headers) as response:
                     response.raise_for_status()
                     with open(dst, "wb") as file:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+                        if range and hasattr(os, "posix_fallocate"):
+                            # Reserve the space up front instead of growing the file.
+                            length = (range.end - range.start).as_int()
+                            if length > 0:
+                                os.posix_fallocate(file.fileno(), 0, length)
+                        written = 0
+                        for chunk in response.iter_bytes(chunk_size=_CHUNK_SIZE):
                             if chunk:
                                 file.write(chunk)
+                                written += len(chunk)
                             else:
                                 assert response.is_closed
+                        file.truncate(written)
                     if range:
                         length = range.end - range.start
                         logger.info(
@@ -202,6 +223,40 @@ class HttpServer:
         else:
             return Exception(f"Failed to download {path} to {dst}")
 
+    def _download_into(
+        self, path: str, fd: int, range: Range, file_offset: int
+    ) -> Exception | None:
+        """Stream range of path into an open file at file_offset with os.pwrite.
+
+        Positional writes need no lock, so many ranges can land in the same
+        file at once. A retry rewrites the same bytes at the same offsets.
+        """
+        url = self._get_file_url(path)
+        headers = range.to_header()
+        err: Exception | None = None
+        for i in _range(3):
+            try:
+                with self._get_client().stream("GET", url, headers=headers) as response:
+                    response.raise_for_status()
+                    offset = file_offset
+                    for chunk in response.iter_bytes(chunk_size=_CHUNK_SIZE):
+                        view = memoryview(chunk)
+                        while view:
+                            n = os.pwrite(fd, view, offset)
+                            view = view[n:]
+                            offset += n
+                expected = (range.end - range.start).as_int()
+                if offset - file_offset != expected:
+                    raise EOFError(
+                        f"Got {offset - file_offset} of {expected} bytes for {url}"
+                    )
+                return None
+            except Exception as e:
+                err = e
+                warnings.warn(f"Failed to download {path} {range}: {e}, retrying ({i})")
+                time.sleep(10)
+        return Exception(f"Failed to download {path} {range}: {err}")
+
     def download_multi_threaded(
         self,
         src_path: str,
@@ -212,15 +267,60 @@ class HttpServer:
     ) -> Path | Exception:
         """Copy file from src to dst."""
 
-        finished: list[Path] = []
-        errors: list[Exception] = []
-
         if range is None:
             sz = self.size(src_path)
             if isinstance(sz, Exception):
                 return sz
             range = Range(0, sz)
 
+        if not hasattr(os, "pwrite"):
+            return self._download_multi_threaded_concat(
+                src_path, dst_path, chunk_size, n_threads, range
+            )
+
+        # Every chunk is written straight to its place in dst, all of them over
+        # the shared keep-alive client, with no temporary part files to join.
+        start = range.start.as_int()
+        end = range.end.as_int()
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(dst_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, end - start)
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_into,
+                        src_path,
+                        fd,
+                        Range(offset, min(offset + chunk_size, end)),
+                        offset - start,
+                    )
+                    for offset in _range(start, end, chunk_size)
+                ]
+                errors = [e for f in futures if (e := f.result()) is not None]
+        finally:
+            os.close(fd)
+        if errors:
+            try:
+                dst_path.unlink()
+            except Exception as e:
+                warnings.warn(f"Failed to delete file {dst_path}: {e}")
+            return Exception(f"Failed to download chunked: {errors}")
+        return dst_path
+
+    def _download_multi_threaded_concat(
+        self,
+        src_path: str,
+        dst_path: Path,
+        chunk_size: int,
+        n_threads: int,
+        range: Range,
+    ) -> Path | Exception:
+        """Fallback without os.pwrite: download parts to files, then join them."""
+
+        finished: list[Path] = []
+        errors: list[Exception] = []
+
         with ThreadPoolExecutor(max_workers=n_threads) as executor:
             try:
                 futures: list[Future[Path | Exception]] = []
@@ -291,6 +391,10 @@ class HttpServer:
 
     def shutdown(self) -> None:
         """Shutdown the server."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
         if self.process:
             self.process.dispose()
             self.process = None
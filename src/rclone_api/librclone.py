@@ -0,0 +1,134 @@
+"""
+In-process rc calls through librclone, the rclone Go shared library.
+
+A single metadata call to the rcd daemon still costs an http round trip,
+and without the daemon it costs a whole rclone process. librclone answers
+the same rc commands (operations/stat, operations/list, ...) with a plain
+function call. It is only used when the library can be found, see load().
+
+https://github.com/rclone/rclone/tree/master/librclone
+"""
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from rclone_api import _json
+from rclone_api.config import Config
+
+logger = logging.getLogger(__name__)
+
+_ENV_LIBRCLONE = "RCLONE_API_LIBRCLONE"
+
+_LOCK = threading.Lock()
+_LOADED: "LibRclone | None" = None
+_LOAD_FAILED = False
+
+
+class _RcloneRPCResult(ctypes.Structure):
+    # Output is freed with RcloneFreeString, so keep it as a raw pointer.
+    _fields_ = [("Output", ctypes.c_void_p), ("Status", ctypes.c_int)]
+
+
+def _find_library() -> str | None:
+    path = os.environ.get(_ENV_LIBRCLONE)
+    if path:
+        return path
+    return ctypes.util.find_library("rclone")
+
+
+class LibRclone:
+    """librclone loaded into this process, with the rcd style call api."""
+
+    def __init__(self, lib: ctypes.CDLL, config_path: Path, config_key: str) -> None:
+        self._lib = lib
+        self.config_path = config_path
+        self.config_key = config_key
+        lib.RcloneInitialize.restype = None
+        lib.RcloneInitialize.argtypes = []
+        lib.RcloneRPC.restype = _RcloneRPCResult
+        lib.RcloneRPC.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        lib.RcloneFreeString.restype = None
+        lib.RcloneFreeString.argtypes = [ctypes.c_void_p]
+        lib.RcloneInitialize()
+        out = self.call("config/setpath", {"path": str(config_path)})
+        if isinstance(out, Exception):
+            raise out
+
+    def _rpc(self, command: str, params: dict[str, Any]) -> tuple[int, Any]:
+        result = self._lib.RcloneRPC(
+            command.encode("utf-8"), json.dumps(params).encode("utf-8")
+        )
+        try:
+            output = ctypes.string_at(result.Output) if result.Output else b"{}"
+        finally:
+            if result.Output:
+                self._lib.RcloneFreeString(result.Output)
+        return result.Status, _json.loads(output)
+
+    def call(
+        self, command: str, params: dict[str, Any] | None = None
+    ) -> dict | Exception:
+        """Call an rc command, like "operations/list", and return the json reply."""
+        try:
+            status, data = self._rpc(command, params or {})
+        except Exception as e:
+            return e
+        if status != 200:
+            return Exception(f"rc {command} failed: {data.get('error', data)}")
+        return data
+
+    def call_job(
+        self, command: str, params: dict[str, Any] | None = None
+    ) -> dict | Exception:
+        """Long running commands simply block the calling thread in process."""
+        return self.call(command, params)
+
+    def shutdown(self) -> None:
+        # The Go runtime can't be unloaded, RcloneFinalize would end it for
+        # every other user in the process too, so the library stays loaded.
+        pass
+
+
+def _config_key(config: Path | Config) -> str:
+    return str(config.resolve()) if isinstance(config, Path) else config.text
+
+
+def load(config: Path | Config) -> LibRclone | None:
+    """The process wide librclone, or None if it can't be used.
+
+    The library is found through the RCLONE_API_LIBRCLONE environment
+    variable or the system library path. It holds one config for the whole
+    process, so callers with a different config get None and should fall
+    back to the rcd daemon.
+    """
+    global _LOADED, _LOAD_FAILED
+    key = _config_key(config)
+    with _LOCK:
+        if _LOADED is not None:
+            return _LOADED if _LOADED.config_key == key else None
+        if _LOAD_FAILED:
+            return None
+        path = _find_library()
+        if path is None:
+            _LOAD_FAILED = True
+            return None
+        if isinstance(config, Path):
+            config_path = config.resolve()
+        else:
+            from rclone_api.util import make_temp_config_file
+
+            config_path = make_temp_config_file()
+            config_path.write_text(config.text, encoding="utf-8")
+        try:
+            _LOADED = LibRclone(ctypes.CDLL(path), config_path, key)
+        except Exception as e:
+            logger.warning(f"librclone at {path} could not be used: {e}")
+            _LOAD_FAILED = True
+            return None
+        return _LOADED
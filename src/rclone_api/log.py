@@ -1,15 +1,26 @@
 import logging
 import sys
+import threading
 
 _INITIALISED = False
+_INIT_LOCK = threading.Lock()
 
 
 def setup_default_logging():
-    """Set up default logging configuration if none exists."""
+    """Set up default logging configuration if none exists.
+
+    Does nothing when the host application has already configured the root
+    logger, and only ever runs once.
+    """
     global _INITIALISED
-    if _INITIALISED:
+    if _INITIALISED or logging.root.handlers:
         return
-    if not logging.root.handlers:
+    with _INIT_LOCK:
+        if _INITIALISED:
+            return
+        _INITIALISED = True
+        if logging.root.handlers:
+            return
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -38,7 +49,3 @@ def configure_logging(level=logging.INFO, log_file=None):
         handlers=handlers,
         force=True,  # Override any existing configuration
     )
-
-
-# Call setup_default_logging when this module is imported
-setup_default_logging()
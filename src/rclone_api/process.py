@@ -21,6 +21,7 @@ class ProcessArgs:
     verbose: bool | None = None
     capture_stdout: bool | None = None
     log: Path | None = None
+    bufsize: int = -1
 
 
 class Process:
@@ -53,7 +54,7 @@ class Process:
         if verbose:
             cmd_str = subprocess.list2cmdline(self.cmd)
             print(f"Running: {cmd_str}")
-        kwargs: dict = {"shell": False}
+        kwargs: dict = {"shell": False, "bufsize": args.bufsize}
         if args.capture_stdout:
             kwargs["stdout"] = subprocess.PIPE
             kwargs["stderr"] = subprocess.STDOUT
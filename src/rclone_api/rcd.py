@@ -0,0 +1,170 @@
+"""
+Client for a persistent rclone remote control daemon (rclone rcd).
+
+Instead of spawning a fresh rclone process for every operation, a single
+rcd process is launched and commands are sent to it over HTTP with a
+keep-alive connection pool.
+
+https://rclone.org/rc/
+"""
+
+import logging
+import os
+import time
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rclone_api import _json
+from rclone_api.process import Process
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+_TIMEOUT = 60 * 60  # long running operations like copies can take a while
+_STARTUP_TIMEOUT = 10
+_JOB_POLL_INTERVAL = 0.25
+
+
+def split_fs_remote(src: str) -> tuple[str, str]:
+    """Split an rclone style path into the (fs, remote) pair used by the rc api.
+
+    Example:
+        "dst:bucket/path/file.txt" -> ("dst:", "bucket/path/file.txt")
+
+    Local paths are made absolute first, since the rcd may not share the
+    caller's working directory, and split at their root.
+    """
+    if ":" not in src:
+        # local path
+        path = Path(os.path.abspath(src))
+        return path.anchor, path.relative_to(path.anchor).as_posix()
+    fs, remote = src.split(":", 1)
+    return f"{fs}:", remote.lstrip("/")
+
+
+class RcdServer:
+    """A running rclone rcd process and an http client to talk to it."""
+
+    def __init__(self, url: str, user: str, password: str, process: Process) -> None:
+        import httpx
+
+        self.url = url
+        self.process: Process | None = process
+        self.client: "httpx.Client | None" = httpx.Client(
+            base_url=url,
+            auth=(user, password),
+            timeout=_TIMEOUT,
+            headers={"Connection": "keep-alive"},
+        )
+
+    def call(
+        self, command: str, params: dict[str, Any] | None = None
+    ) -> dict | Exception:
+        """Call an rc command, like "operations/list", and return the json reply."""
+        if self.client is None:
+            return Exception(f"rcd server at {self.url} has been shut down")
+        try:
+            response = self.client.post(f"/{command}", json=params or {})
+            data: dict = _json.loads(response.content)
+            if response.status_code != 200:
+                return Exception(f"rc {command} failed: {data.get('error', data)}")
+            return data
+        except Exception as e:
+            return e
+
+    def call_job(
+        self, command: str, params: dict[str, Any] | None = None
+    ) -> dict | Exception:
+        """Call a long running rc command asynchronously and poll until it is done."""
+        params = dict(params or {})
+        params["_async"] = True
+        out = self.call(command, params)
+        if isinstance(out, Exception):
+            return out
+        jobid = out["jobid"]
+        while True:
+            status = self.call("job/status", {"jobid": jobid})
+            if isinstance(status, Exception):
+                return status
+            if status.get("finished"):
+                if not status.get("success"):
+                    return Exception(f"rc {command} failed: {status.get('error')}")
+                return status.get("output") or {}
+            time.sleep(_JOB_POLL_INTERVAL)
+
+    def read_bytes(self, src: str) -> bytes | Exception:
+        """Fetch the contents of a remote object, needs rcd to run with --rc-serve."""
+        if self.client is None:
+            return Exception(f"rcd server at {self.url} has been shut down")
+        fs, remote = split_fs_remote(src)
+        try:
+            response = self.client.get(f"/[{fs}]/{remote}")
+            if response.status_code != 200:
+                return FileNotFoundError(
+                    f"rc serve {src} failed: {response.status_code} {response.text}"
+                )
+            return response.content
+        except Exception as e:
+            return e
+
+    def write_bytes(self, dst: str, data: bytes) -> Exception | None:
+        """Upload data to a remote path with operations/uploadfile."""
+        if self.client is None:
+            return Exception(f"rcd server at {self.url} has been shut down")
+        fs, remote = split_fs_remote(dst)
+        remote_dir, _, name = remote.rpartition("/")
+        try:
+            response = self.client.post(
+                "/operations/uploadfile",
+                params={"fs": fs, "remote": remote_dir},
+                files={"file0": (name, data)},
+            )
+            if response.status_code != 200:
+                return Exception(f"rc upload to {dst} failed: {response.text}")
+            return None
+        except Exception as e:
+            return e
+
+    def wait_until_ready(self, timeout: float = _STARTUP_TIMEOUT) -> Exception | None:
+        """Block until the daemon answers requests."""
+        assert self.process is not None
+        expire_time = time.time() + timeout
+        while time.time() < expire_time:
+            if self.process.poll() is not None:
+                return Exception("rcd process exited during startup")
+            out = self.call("rc/noop")
+            if not isinstance(out, Exception):
+                return None
+            time.sleep(0.1)
+        return TimeoutError(f"rcd server at {self.url} did not start in {timeout}s")
+
+    def shutdown(self) -> None:
+        """Ask the daemon to quit and then make sure the process is gone."""
+        if self.client is not None:
+            try:
+                self.client.post("/core/quit", json={}, timeout=5)
+            except Exception as e:
+                logger.debug(f"core/quit failed for {self.url}: {e}")
+            self.client.close()
+            self.client = None
+        if self.process is not None:
+            try:
+                self.process.dispose()
+            except Exception as e:
+                warnings.warn(f"Failed to dispose rcd process: {e}")
+            self.process = None
+
+    def __enter__(self) -> "RcdServer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def __del__(self) -> None:
+        try:
+            self.shutdown()
+        except Exception:
+            pass
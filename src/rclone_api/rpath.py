@@ -1,13 +1,27 @@
 import json
+import sys
 from datetime import datetime
 from typing import Any
 
+from rclone_api import _json
 from rclone_api.remote import Remote
 
 
 class RPath:
     """Remote file dataclass."""
 
+    # Listings hold millions of these, slots drop the per instance __dict__.
+    __slots__ = (
+        "remote",
+        "path",
+        "name",
+        "size",
+        "mime_type",
+        "mod_time",
+        "is_dir",
+        "rclone",
+    )
+
     def __init__(
         self,
         remote: Remote,
@@ -26,7 +40,7 @@ class RPath:
         self.path = path
         self.name = name
         self.size = size
-        self.mime_type = mime_type
+        self.mime_type = sys.intern(mime_type)
         self.mod_time = mod_time
         self.is_dir = is_dir
         self.rclone: RcloneImpl | None = None
@@ -74,10 +88,10 @@ class RPath:
 
     @staticmethod
     def from_json_str(
-        json_str: str, remote: Remote, parent_path: str | None = None
+        json_str: str | bytes, remote: Remote, parent_path: str | None = None
     ) -> list["RPath"]:
         """Create a File from a JSON string."""
-        json_obj = json.loads(json_str)
+        json_obj = _json.loads(json_str)
         if isinstance(json_obj, dict):
             return [RPath.from_dict(json_obj, remote, parent_path)]
         return RPath.from_array(json_obj, remote, parent_path)
@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Generator, Iterable
 
 from botocore.client import BaseClient
 
@@ -16,6 +19,66 @@ def list_bucket_contents(s3_client: BaseClient, bucket_name: str) -> None:
         print(f"Error listing bucket contents: {e}")
 
 
+def iter_object_pages(
+    s3_client: BaseClient, bucket_name: str, prefix: str, page_size: int = 1000
+) -> Generator[list[dict], None, None]:
+    """Yield the objects under prefix one ListObjectsV2 page at a time.
+
+    The request for the next page is already in flight while the caller
+    works on the current one.
+    """
+
+    def fetch(token: str | None) -> dict:
+        params: dict = {"Bucket": bucket_name, "Prefix": prefix, "MaxKeys": page_size}
+        if token:
+            params["ContinuationToken"] = token
+        return s3_client.list_objects_v2(**params)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fut = executor.submit(fetch, None)
+        while fut is not None:
+            response = fut.result()
+            token = response.get("NextContinuationToken")
+            more = response.get("IsTruncated") and token
+            fut = executor.submit(fetch, token) if more else None
+            yield response.get("Contents", [])
+
+
+def delete_objects(
+    s3_client: BaseClient,
+    bucket_name: str,
+    keys: Iterable[str],
+    max_workers: int = 8,
+) -> Exception | None:
+    """Delete keys with DeleteObjects, 1000 keys per request.
+
+    keys may be a generator, each batch is sent as soon as it fills up.
+    """
+
+    def delete(batch: list[str]) -> list[dict]:
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+        )
+        return response.get("Errors", [])
+
+    keys = iter(keys)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            while batch := list(islice(keys, 1000)):
+                futures.append(executor.submit(delete, batch))
+            errors = [e for fut in futures for e in fut.result()]
+    except Exception as e:
+        return e
+    if errors:
+        first = errors[0]
+        return Exception(
+            f"Failed to delete {len(errors)} objects, first {first.get('Key')}: {first.get('Code')} {first.get('Message')}"
+        )
+    return None
+
+
 def upload_file(
     s3_client: BaseClient,
     bucket_name: str,
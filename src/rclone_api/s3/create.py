@@ -1,4 +1,7 @@
+import atexit
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import boto3
@@ -11,6 +14,7 @@ _DEFAULT_BACKBLAZE_ENDPOINT = "https://s3.us-west-002.backblazeb2.com"
 _MAX_CONNECTIONS = 10
 _TIMEOUT_READ = 120
 _TIMEOUT_CONNECT = 60
+_MAX_CACHED_CLIENTS = 32
 
 
 @dataclass
@@ -19,6 +23,7 @@ class S3Config:
     timeout_connection: int | None = None
     timeout_read: int | None = None
     verbose: bool | None = None
+    retry_mode: str | None = None  # botocore retry mode, like "adaptive"
 
     def resolve_defaults(self) -> None:
         self.max_pool_connections = self.max_pool_connections or _MAX_CONNECTIONS
@@ -27,6 +32,12 @@ class S3Config:
         self.verbose = self.verbose or False
 
 
+def _retries(s3_config: S3Config) -> dict | None:
+    if s3_config.retry_mode is None:
+        return None
+    return {"mode": s3_config.retry_mode}
+
+
 # Create a Boto3 session and S3 client, this is back blaze specific.
 # Add a function if you want to use a different S3 provider.
 # If AWS support is added in a fork then please merge it back here.
@@ -53,6 +64,7 @@ def _create_backblaze_s3_client(
             max_pool_connections=s3_config.max_pool_connections,
             read_timeout=s3_config.timeout_read,
             connect_timeout=s3_config.timeout_connection,
+            retries=_retries(s3_config),
             # Note that BackBlase has a boko3 bug where it doesn't support the new
             # checksum header, the following line was an attempt of fix it on the newest
             # version of boto3, but it didn't work.
@@ -87,6 +99,7 @@ def _create_unknown_s3_client(
             max_pool_connections=s3_config.max_pool_connections,
             read_timeout=s3_config.timeout_read,
             connect_timeout=s3_config.timeout_connection,
+            retries=_retries(s3_config),
         ),
     )
 
@@ -105,3 +118,52 @@ def create_s3_client(
         if s3_config.verbose:
             print("Creating generic/unknown S3 client")
         return _create_unknown_s3_client(s3_creds=s3_creds, s3_config=s3_config)
+
+
+_clients_lock = threading.Lock()
+_clients: OrderedDict[tuple, BaseClient] = OrderedDict()
+
+
+def get_s3_client(
+    s3_creds: S3Credentials, s3_config: S3Config | None = None
+) -> BaseClient:
+    """A shared S3 client for these credentials and config, created once.
+
+    boto3 clients are thread safe, so repeated jobs against the same endpoint
+    reuse one client and its pool of open connections instead of paying for
+    new sessions and TLS handshakes each time.
+    """
+    s3_config = s3_config or S3Config()
+    s3_config.resolve_defaults()
+    # The client is the same for every bucket, so bucket_name isn't part of it.
+    key = (
+        s3_creds.provider,
+        s3_creds.access_key_id,
+        s3_creds.secret_access_key,
+        s3_creds.session_token,
+        s3_creds.region_name,
+        s3_creds.endpoint_url,
+        s3_config.max_pool_connections,
+        s3_config.timeout_connection,
+        s3_config.timeout_read,
+        s3_config.retry_mode,
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            return client
+        client = create_s3_client(s3_creds=s3_creds, s3_config=s3_config)
+        _clients[key] = client
+        while len(_clients) > _MAX_CACHED_CLIENTS:
+            _, old = _clients.popitem(last=False)
+            old.close()
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from rclone_api.types import EndOfStream
 
 
-@dataclass
+@dataclass(slots=True)
 class FinishedPiece:
     part_number: int
     etag: str
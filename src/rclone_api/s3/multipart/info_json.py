@@ -1,9 +1,10 @@
 import hashlib
 import json
-import os
+import posixpath
 import warnings
 from datetime import datetime
 
+from rclone_api import _json
 from rclone_api.dir_listing import DirListing
 from rclone_api.rclone_impl import RcloneImpl
 from rclone_api.types import (
@@ -12,6 +13,11 @@ from rclone_api.types import (
 )
 
 
+def info_json_path(parts_dir: str) -> str:
+    """The info.json of a parts dir, with or without a trailing slash."""
+    return (parts_dir[:-1] if parts_dir.endswith("/") else parts_dir) + "/info.json"
+
+
 def _fetch_all_names(
     self: RcloneImpl,
     src: str,
@@ -27,15 +33,13 @@ def _get_info_json(self: RcloneImpl, src: str | None, src_info: str) -> dict:
     from rclone_api.file import File
 
     data: dict
-    text: str
+    raw: bytes
     if src is None:
         # just try to load the file
-        text_or_err = self.read_text(src_info)
-        if isinstance(text_or_err, Exception):
-            raise FileNotFoundError(f"Could not load {src_info}: {text_or_err}")
-        assert isinstance(text_or_err, str)
-        text = text_or_err
-        data = json.loads(text)
+        raw_or_err = self.read_bytes(src_info)
+        if isinstance(raw_or_err, Exception):
+            raise FileNotFoundError(f"Could not load {src_info}: {raw_or_err}")
+        data = _json.loads(raw_or_err)
         return data
 
     src_stat: File | Exception = self.stat(src)
@@ -57,19 +61,14 @@ def _get_info_json(self: RcloneImpl, src: str | None, src_info: str) -> dict:
         "hash": None,
     }
 
-    text_or_err = self.read_text(src_info)
-    err: Exception | None = text_or_err if isinstance(text_or_err, Exception) else None
-    if isinstance(text_or_err, Exception):
-        warnings.warn(f"Failed to read {src_info}: {text_or_err}")
-        return new_data
-    assert isinstance(text_or_err, str)
-    text = text_or_err
-
-    if err is not None:
+    raw_or_err = self.read_bytes(src_info)
+    if isinstance(raw_or_err, Exception):
+        warnings.warn(f"Failed to read {src_info}: {raw_or_err}")
         return new_data
+    raw = raw_or_err
 
     try:
-        data = json.loads(text)
+        data = _json.loads(raw)
         return data
     except Exception as e:
         warnings.warn(f"Failed to parse JSON: {e} at {src_info}")
@@ -92,8 +91,7 @@ def _save_info_json(self: RcloneImpl, src: str, data: dict) -> None:
     str_data = "".join(data_vals)
     h.update(str_data.encode("utf-8"))
     data["hash"] = h.hexdigest()
-    json_str = json.dumps(data, indent=0)
-    self.write_text(dst=src, text=json_str)
+    self.write_bytes(dst=src, data=_json.dumps(data, indent=True))
 
 
 class InfoJson:
@@ -115,7 +113,7 @@ class InfoJson:
         self.rclone.print(self.src_info)
 
     def fetch_all_finished(self) -> list[str]:
-        parent_path = os.path.dirname(self.src_info)
+        parent_path = posixpath.dirname(self.src_info)
         out = _fetch_all_names(self.rclone, parent_path)
         return out
 
@@ -126,7 +124,8 @@ class InfoJson:
 
     @property
     def parts_dir(self) -> str:
-        parts_dir = os.path.dirname(self.src_info)
+        # rclone paths and s3 keys always use /, even on windows.
+        parts_dir = posixpath.dirname(self.src_info)
         if parts_dir.endswith("/"):
             parts_dir = parts_dir[:-1]
         return parts_dir
@@ -140,7 +139,7 @@ class InfoJson:
 
     @property
     def dst_name(self) -> str:
-        return os.path.basename(self.dst)
+        return posixpath.basename(self.dst)
 
     def compute_all_parts(self) -> list[PartInfo] | Exception:
         # full_part_infos: list[PartInfo] | Exception = PartInfo.split_parts(
@@ -153,12 +152,15 @@ class InfoJson:
             assert isinstance(chunk_size, SizeSuffix)
             first_part = self.data["first_part"]
             last_part = self.data["last_part"]
-            full_part_infos: list[PartInfo] = PartInfo.split_parts(src_size, chunk_size)
-            return full_part_infos[first_part : last_part + 1]
+            return PartInfo.split_parts(src_size, chunk_size, first_part, last_part)
         except Exception as e:
             return e
 
     def compute_all_part_numbers(self) -> list[int] | Exception:
+        first_part = self.data.get("first_part")
+        last_part = self.data.get("last_part")
+        if first_part is not None and last_part is not None:
+            return list(range(first_part, last_part + 1))
         all_parts: list[PartInfo] | Exception = self.compute_all_parts()
         if isinstance(all_parts, Exception):
             raise all_parts
@@ -186,6 +188,15 @@ class InfoJson:
     def new(self) -> bool:
         return self.data.get("new", False)
 
+    @property
+    def finished(self) -> bool:
+        """Set once every part is uploaded, saves listing the parts to know."""
+        return self.data.get("finished") is True
+
+    @finished.setter
+    def finished(self, value: bool) -> None:
+        self.data["finished"] = value
+
     @property
     def chunksize(self) -> SizeSuffix | None:
         chunksize_int: int | None = self.data.get("chunksize_int")
@@ -6,15 +6,16 @@ This module provides functionality for S3 multipart uploads, including copying p
 from existing S3 objects using upload_part_copy.
 """
 
-import json
 from dataclasses import dataclass
 from typing import Any
 
+from rclone_api import _json
 from rclone_api.rclone_impl import RcloneImpl
 from rclone_api.s3.multipart.finished_piece import FinishedPiece
 
 
-@dataclass
+# One per uploaded part, a merge can hold 10k of these and their pieces.
+@dataclass(slots=True)
 class Part:
     part_number: int
     s3_key: str
@@ -69,6 +70,10 @@ class MergeState:
     def on_finished(self, finished_piece: FinishedPiece) -> None:
         self.finished.append(finished_piece)
 
+    def add_part(self, part: Part) -> None:
+        """A part found after the merge began, while the parts are still listed."""
+        self.all_parts.append(part)
+
     def remaining_parts(self) -> list[Part]:
         finished_parts: set[int] = set([p.part_number for p in self.finished])
         remaining = [p for p in self.all_parts if p.part_number not in finished_parts]
@@ -116,9 +121,11 @@ class MergeState:
         }
 
     def to_json_str(self) -> str:
-        data = self.to_json()
-        out = json.dumps(data, indent=2)
-        return out
+        return self.to_json_bytes().decode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        # Uploaded again and again while merging, unindented it is ~25% smaller.
+        return _json.dumps(self.to_json())
 
     def __str__(self):
         return self.to_json_str()
@@ -130,17 +137,16 @@ class MergeState:
         from rclone_api.rclone_impl import RcloneImpl
 
         assert isinstance(rclone_impl, RcloneImpl)
-        json_str = self.to_json_str()
-        rclone_impl.write_text(dst, json_str)
+        rclone_impl.write_bytes(dst, self.to_json_bytes())
 
     def read(self, rclone_impl: Any, src: str) -> None:
         from rclone_api.rclone_impl import RcloneImpl
 
         assert isinstance(rclone_impl, RcloneImpl)
-        json_str = rclone_impl.read_text(src)
-        if isinstance(json_str, Exception):
-            raise json_str
-        json_dict = json.loads(json_str)
+        raw = rclone_impl.read_bytes(src)
+        if isinstance(raw, Exception):
+            raise raw
+        json_dict = _json.loads(raw)
         ok_or_err = FinishedPiece.from_json_array(json_dict["finished"])
         if isinstance(ok_or_err, Exception):
             raise ok_or_err
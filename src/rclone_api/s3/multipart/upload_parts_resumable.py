@@ -5,12 +5,13 @@ import shutil
 import threading
 import warnings
 from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
 
 from rclone_api.http_server import HttpServer
 from rclone_api.rclone_impl import RcloneImpl
-from rclone_api.s3.multipart.info_json import InfoJson
+from rclone_api.s3.multipart.info_json import InfoJson, info_json_path
 from rclone_api.types import (
     PartInfo,
     Range,
@@ -18,6 +19,10 @@ from rclone_api.types import (
 )
 
 _LOCK = threading.Lock()
+_PREAD_BLOCK_SIZE = 8 * 1024 * 1024
+# Parts that may sit downloaded and waiting for each upload thread. Together
+# with the parts being read this caps the chunks held in the tmp dir.
+_QUEUED_PARTS_PER_WRITER = 2
 
 
 def _log(msg: str) -> None:
@@ -95,8 +100,35 @@ def upload_task(self: RcloneImpl, upload_part: UploadPart) -> UploadPart:
         upload_part.dispose()
 
 
+def _open_local_src(src: str) -> int | None:
+    """Open a local source file once so every part can be read from the same fd.
+
+    Returns None for remote sources, or where os.pread is unavailable (Windows),
+    in which case parts are fetched through the rclone http server instead.
+    """
+    if not hasattr(os, "pread") or not os.path.isfile(src):
+        return None
+    return os.open(src, os.O_RDONLY)
+
+
+def _pread_to_file(fd: int, offset: int, length: int, dst: Path) -> None:
+    """Copy a byte range of an open file into dst with positional reads."""
+    if hasattr(os, "posix_fadvise"):
+        # Let the kernel start reading ahead the whole part in one go.
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    end = offset + length
+    with open(dst, "wb") as f:
+        while offset < end:
+            data = os.pread(fd, min(_PREAD_BLOCK_SIZE, end - offset), offset)
+            if not data:
+                raise EOFError(f"Unexpected end of file at offset {offset}")
+            f.write(data)
+            offset += len(data)
+
+
 def read_task(
-    http_server: HttpServer,
+    http_server: HttpServer | None,
     src_name: str,
     tmpdir: Path,
     offset: SizeSuffix,
@@ -105,16 +137,24 @@ def read_task(
     part_number: int,
     total_parts: int,
     total_size: SizeSuffix,
+    fd: int | None = None,
 ) -> UploadPart:
     outchunk: Path = tmpdir / f"{offset.as_int()}-{(offset + length).as_int()}.chunk"
     range = Range(offset.as_int(), (offset + length).as_int())
 
     try:
-        err = http_server.download(
-            path=src_name,
-            range=range,
-            dst=outchunk,
-        )
+        err: Exception | None = None
+        if fd is not None:
+            _pread_to_file(fd, offset.as_int(), length.as_int(), outchunk)
+        else:
+            assert http_server is not None
+            downloaded = http_server.download(
+                path=src_name,
+                range=range,
+                dst=outchunk,
+            )
+            if isinstance(downloaded, Exception):
+                err = downloaded
         if isinstance(err, Exception):
             out = UploadPart(
                 chunk=outchunk,
@@ -181,6 +221,24 @@ def collapse_runs(numbers: list[int]) -> list[str]:
 
 
 _MIN_PART_UPLOAD_SIZE = SizeSuffix("5MB")
+_GiB = 1024**3
+_MiB = 1024**2
+
+
+def choose_chunk_size(size: int | SizeSuffix | None) -> SizeSuffix:
+    """Default part size for a file of size bytes, 128MiB if unknown.
+
+    Small parts keep a failed part cheap to retry, but below ~32MiB the per
+    part latency starts to dominate, so the size grows with the file.
+    """
+    if size is None:
+        return SizeSuffix(128 * _MiB)
+    size = SizeSuffix(size).as_int()
+    if size < 5 * _GiB:
+        return SizeSuffix(64 * _MiB)
+    if size <= 50 * _GiB:
+        return SizeSuffix(128 * _MiB)
+    return SizeSuffix(256 * _MiB)
 
 
 def _check_part_size(parts: list[PartInfo]) -> Exception | None:
@@ -202,10 +260,24 @@ def upload_parts_resumable(
     part_infos: list[PartInfo] | None = None,
     threads: int = 1,
     verbose: bool | None = None,
+    read_threads: int | None = None,
+    chunk_size: SizeSuffix | None = None,
 ) -> Exception | None:
-    """Copy parts of a file from source to destination."""
+    """Copy parts of a file from source to destination.
+
+    chunk_size=None picks the part size with choose_chunk_size(). A resumed
+    upload always keeps the part size recorded in its info.json.
+
+    Reads run on read_threads (defaults to threads) and uploads on threads.
+    Reads keep going while uploads are busy until _QUEUED_PARTS_PER_WRITER
+    parts per upload thread are waiting, so throughput is bounded by the
+    slower side instead of by both in lock step.
+    """
     from rclone_api.util import random_str
 
+    if read_threads is None:
+        read_threads = threads
+
     def verbose_print(*args, **kwargs):
         if verbose:
             print(*args, **kwargs)
@@ -220,19 +292,38 @@ def upload_parts_resumable(
     part_info: PartInfo
     src_dir = os.path.dirname(src)
     src_name = os.path.basename(src)
-    http_server: HttpServer
+    http_server: HttpServer | None
+
+    src_info_json = info_json_path(dst_dir)
+    info_json = InfoJson(self, src, src_info_json)
+
+    loaded = info_json.load()
+    if not loaded:
+        verbose_print(f"New: {src_info_json}")
+        # info_json.save()
+    elif info_json.finished and info_json.size == src_size:
+        verbose_print(f"Already uploaded: {src_info_json}")
+        return None
+
+    # Parts already uploaded were cut with the recorded size, keep using it.
+    prev_chunk_size = info_json.chunksize if loaded else None
+    if prev_chunk_size is not None:
+        if chunk_size is not None and chunk_size != prev_chunk_size:
+            warnings.warn(
+                f"Resuming with the recorded chunk size {prev_chunk_size}, not {chunk_size}"
+            )
+        chunk_size = prev_chunk_size
+    elif chunk_size is None:
+        chunk_size = choose_chunk_size(src_size)
 
     full_part_infos: list[PartInfo] | Exception = PartInfo.split_parts(
-        src_size, SizeSuffix("96MB")
+        src_size, chunk_size
     )
     if isinstance(full_part_infos, Exception):
         return full_part_infos
     assert isinstance(full_part_infos, list)
 
     if part_infos is None:
-        src_size = self.size_file(src)
-        if isinstance(src_size, Exception):
-            return src_size
         part_infos = full_part_infos.copy()
 
     err = _check_part_size(part_infos)
@@ -240,12 +331,6 @@ def upload_parts_resumable(
         return err
 
     all_part_numbers: list[int] = [p.part_number for p in part_infos]
-    src_info_json = f"{dst_dir}/info.json"
-    info_json = InfoJson(self, src, src_info_json)
-
-    if not info_json.load():
-        verbose_print(f"New: {src_info_json}")
-        # info_json.save()
 
     all_numbers_already_done: set[int] = set(
         info_json.fetch_all_finished_part_numbers()
@@ -273,30 +358,38 @@ def upload_parts_resumable(
 
     if num_remaining_to_upload == 0:
         return None
-    chunk_size = SizeSuffix(part_infos[0].range.end - part_infos[0].range.start)
-
-    info_json.chunksize = chunk_size
+    # The size the file was split with, part_infos may only hold the short tail.
+    info_json.chunksize = SizeSuffix(chunk_size)
 
     info_json.first_part = first_part_number
     info_json.last_part = last_part_number
+    info_json.finished = False
     info_json.save()
 
     # We are now validated
     info_json.load()
-    info_json.print()
-
-    print(info_json)
+    verbose_print(info_json)
 
     finished_tasks: list[UploadPart] = []
     tmp_dir = str(Path("chunks") / random_str(12))
 
     atexit.register(lambda: shutil.rmtree(tmp_dir, ignore_errors=True))
 
-    with self.serve_http(src_dir, cache_mode="minimal") as http_server:
+    with ExitStack() as stack:
+        # Local sources are read straight from disk, remote ones through rclone.
+        local_fd: int | None = _open_local_src(src)
+        if local_fd is not None:
+            stack.callback(os.close, local_fd)
+            http_server = None
+        else:
+            http_server = stack.enter_context(
+                self.serve_http(src_dir, cache_mode="minimal")
+            )
         tmpdir: Path = Path(tmp_dir)
-        write_semaphore = threading.Semaphore(threads)
+        max_in_flight = read_threads + _QUEUED_PARTS_PER_WRITER * threads
+        write_semaphore = threading.Semaphore(max_in_flight)
         with ThreadPoolExecutor(max_workers=threads) as upload_executor:
-            with ThreadPoolExecutor(max_workers=threads) as read_executor:
+            with ThreadPoolExecutor(max_workers=read_threads) as read_executor:
                 for part_info in part_infos:
                     part_number: int = part_info.part_number
                     range: Range = part_info.range
@@ -313,6 +406,7 @@ def upload_parts_resumable(
                         offset=offset,
                         length=length,
                         part_dst=part_dst,
+                        part_number=part_number,
                     ) -> UploadPart:
                         return read_task(
                             src_name=src_name,
@@ -324,6 +418,7 @@ def upload_parts_resumable(
                             part_number=part_number,
                             total_parts=total_parts,
                             total_size=src_size,
+                            fd=local_fd,
                         )
 
                     read_fut: Future[UploadPart] = read_executor.submit(_read_task)
@@ -332,7 +427,12 @@ def upload_parts_resumable(
                     def queue_upload_task(
                         read_fut=read_fut,
                     ) -> None:
-                        upload_part = read_fut.result()
+                        try:
+                            upload_part = read_fut.result()
+                        except BaseException:
+                            # Never submitted, give the slot back or the loop stalls.
+                            write_semaphore.release()
+                            raise
                         upload_fut: Future[UploadPart] = upload_executor.submit(
                             upload_task, self, upload_part
                         )
@@ -361,7 +461,7 @@ def upload_parts_resumable(
         return Exception(msg, exceptions)
 
     finished_parts: list[int] = info_json.fetch_all_finished_part_numbers()
-    print(f"finished_names: {finished_parts}")
+    verbose_print(f"finished_parts: {collapse_runs(sorted(finished_parts))}")
 
     diff_set = set(all_part_numbers).symmetric_difference(set(finished_parts))
     all_part_numbers_done = len(diff_set) == 0
@@ -371,6 +471,8 @@ def upload_parts_resumable(
     if all_part_numbers_done:
         msg = f"Upload completed: {full_path} ({len(finished_parts)}/{len(all_part_numbers)})"
         _log(msg)
+        # The merge reads this instead of listing the parts again.
+        info_json.finished = True
         info_json.save()
     else:
         msg = f"Upload failed for {full_path} ({len(finished_parts)}/{len(all_part_numbers)})"
@@ -6,20 +6,26 @@ This module provides functionality for S3 multipart uploads, including copying p
 from existing S3 objects using upload_part_copy.
 """
 
-import json
 import os
+import posixpath
+import re
 import time
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cache
 from queue import Queue
-from threading import Semaphore, Thread
-from typing import Any, Callable
+from statistics import median
+from threading import Event, Lock, Semaphore, Thread
+from typing import Any, Callable, Generator, Iterable
 
+from rclone_api import _json
 from rclone_api.rclone_impl import RcloneImpl
+from rclone_api.s3.basic_ops import delete_objects, iter_object_pages
 from rclone_api.s3.create import (
     BaseClient,
     S3Config,
-    create_s3_client,
+    get_s3_client,
 )
 from rclone_api.s3.multipart.finished_piece import FinishedPiece
 from rclone_api.s3.multipart.info_json import InfoJson
@@ -27,8 +33,29 @@ from rclone_api.s3.multipart.merge_state import MergeState, Part
 from rclone_api.types import EndOfStream
 from rclone_api.util import locked_print
 
+# Hedging: a copy running longer than _HEDGE_FACTOR times the median copy
+# time (and at least _HEDGE_MIN_DELAY) gets a second, parallel attempt. At
+# most _HEDGE_BUDGET of the parts are hedged so the extra cost stays bounded.
+_HEDGE_FACTOR = 2.0
+_HEDGE_MIN_DELAY = 0.5
+_HEDGE_MIN_SAMPLES = 5
+_HEDGE_BUDGET = 0.05
+_HEDGE_POLL = 0.25
+_HEDGE_WORKERS = 2
+# Requests besides the copies that share the merge's connection pool: the
+# hedged attempts, the merge.json writer and the listing prefetch.
+_SIDE_CONNECTIONS = _HEDGE_WORKERS + 2
+
 DEFAULT_MAX_WORKERS = 5  # Backblaze can do 10 with exponential backoff, so let's try 5
 
+# Default merge concurrency, see finish_workers(). Throughput of parallel
+# UploadPartCopy calls flattens out at a few dozen, more only pays off when
+# every call waits on a slow round trip.
+_ENV_FINISH_WORKERS = "RCLONE_API_FINISH_WORKERS"
+_MIN_FINISH_WORKERS = 8
+_MAX_FINISH_WORKERS = 32
+_HIGH_LATENCY = 0.05
+
 _TIMEOUT_READ = 900
 _TIMEOUT_CONNECTION = 900
 
@@ -39,6 +66,9 @@ def _upload_part_copy_task(
     source_bucket: str,
     source_key: str,
     part_number: int,
+    verbose: bool = False,
+    retries: int = 9,
+    stop: Event | None = None,
 ) -> FinishedPiece | Exception:
     """
     Upload a part by copying from an existing S3 object.
@@ -48,8 +78,9 @@ def _upload_part_copy_task(
         source_bucket: Source bucket name
         source_key: Source object key
         part_number: Part number (1-10000)
-        byte_range: Optional byte range in format 'bytes=start-end'
-        retries: Number of retry attempts
+        verbose: Print every part, errors and retries are always printed
+        retries: Attempts after the first one, with exponential backoff
+        stop: Once set no further attempt is made and backoff sleeps end early
 
     Returns:
         FinishedPiece with ETag and part number
@@ -57,17 +88,19 @@ def _upload_part_copy_task(
     copy_source = {"Bucket": source_bucket, "Key": source_key}
 
     # from botocore.exceptions import NoSuchKey
-    default_retries = 9
-    retries = default_retries + 1  # Add one for the initial attempt
+    retries = retries + 1  # Add one for the initial attempt
     for retry in range(retries):
+        if stop is not None and stop.is_set():
+            return InterruptedError(f"Copy of part {part_number} stopped")
         params: dict = {}
         try:
             if retry > 0:
                 locked_print(f"Retrying part copy {part_number} for {state.dst_key}")
 
-            locked_print(
-                f"Copying part {part_number} for {state.dst_key} from {source_bucket}/{source_key}"
-            )
+            if verbose:
+                locked_print(
+                    f"Copying part {part_number} for {state.dst_key} from {source_bucket}/{source_key}"
+                )
 
             # Prepare the upload_part_copy parameters
             params = {
@@ -84,7 +117,8 @@ def _upload_part_copy_task(
             # Extract ETag from the response
             etag = part["CopyPartResult"]["ETag"]
             out = FinishedPiece(etag=etag, part_number=part_number)
-            locked_print(f"Finished part {part_number} for {state.dst_key}")
+            if verbose:
+                locked_print(f"Finished part {part_number} for {state.dst_key}")
             return out
 
         except Exception as e:
@@ -103,6 +137,10 @@ def _upload_part_copy_task(
                 # sleep
                 sleep_time = 2**retry
                 locked_print(f"Sleeping for {sleep_time} seconds")
+                if stop is not None:
+                    stop.wait(sleep_time)
+                else:
+                    time.sleep(sleep_time)
                 continue
 
     return Exception("Should not reach here")
@@ -148,78 +186,260 @@ def _complete_multipart_upload_from_parts(
     return None
 
 
+def _iter_finished_parts(
+    s3_client: BaseClient, bucket: str, parts_path: str, skip: set[int]
+) -> Generator[Part, None, None]:
+    """Yield the uploaded parts as each ListObjectsV2 page arrives.
+
+    The part number comes from the part name, part.00001_0-1000, so pages can
+    be consumed in any order. Part numbers in skip are already known.
+    """
+    prefix = f"{parts_path}/"
+    for page in iter_object_pages(s3_client, bucket, prefix):
+        for obj in page:
+            key: str = obj["Key"]
+            name = key[len(prefix) :]
+            if "/" in name or not name.startswith("part."):
+                continue
+            part_number = int(name.split("_")[0].split(".")[1])
+            if part_number not in skip:
+                yield Part(part_number=part_number, s3_key=key)
+
+
+def _pending_parts(
+    s3_client: BaseClient,
+    info: InfoJson,
+    bucket: str,
+    parts_path: str,
+    skip: set[int],
+) -> Iterable[Part]:
+    """The parts still to be merged, from info.json alone when it can be.
+
+    An upload that finished marks info.json, and its part names follow from
+    the size and chunk size, so only the first of them is checked to exist.
+    Otherwise, or if it is missing, the parts directory is listed.
+    """
+    if info.finished:
+        all_parts = info.compute_all_parts()
+        if not isinstance(all_parts, Exception):
+            prefix = f"{parts_path}/"
+            parts = [Part(p.part_number, prefix + p.name) for p in all_parts]
+            # The name holds the byte range, so a wrong chunk size shows here.
+            if parts and _object_exists(s3_client, bucket, parts[0].s3_key):
+                return [p for p in parts if p.part_number not in skip]
+            warnings.warn(f"Parts don't match {info.src_info}, listing them")
+        else:
+            warnings.warn(f"Can't compute the parts from {info.src_info}: {all_parts}")
+    return _iter_finished_parts(s3_client, bucket, parts_path, skip=skip)
+
+
+def _object_exists(s3_client: BaseClient, bucket: str, key: str) -> bool:
+    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=key, MaxKeys=1)
+    return any(obj["Key"] == key for obj in response.get("Contents", []))
+
+
+class _PartCopy:
+    """A part being copied by its first attempt and maybe a hedged second one.
+
+    future resolves with the first successful copy, or with the error once
+    every attempt has failed. on_done gets that result before the future
+    resolves, so whoever waits on the future also sees it reported. Both
+    attempts copy the same bytes to the same part number, so whichever lands
+    last leaves the same ETag. stop is set once the part is decided, so the
+    losing attempt gives up instead of retrying.
+    """
+
+    def __init__(
+        self,
+        part: Part,
+        on_done: Callable[["_PartCopy", FinishedPiece | Exception], None],
+    ) -> None:
+        self.part = part
+        self.on_done = on_done
+        self.future: Future[FinishedPiece | Exception] = Future()
+        self.started = time.monotonic()
+        self.hedged = False
+        self._running = 0
+        self._decided = False
+        self._lock = Lock()
+        self.stop = Event()
+
+    def run(
+        self, copy: Callable[[Part, int, Event], FinishedPiece | Exception]
+    ) -> None:
+        retries = 0 if self.hedged else 9  # the hedge is a single extra try
+        with self._lock:
+            self._running += 1
+        try:
+            out = copy(self.part, retries, self.stop)
+        except Exception as e:
+            out = e
+        with self._lock:
+            self._running -= 1
+            if self._decided:
+                return
+            if isinstance(out, Exception) and self._running > 0:
+                return  # the other attempt may still succeed
+            self._decided = True
+        self.stop.set()
+        try:
+            self.on_done(self, out)
+        finally:
+            self.future.set_result(out)
+
+
+def _hedge_slow_copies(
+    copies: Callable[[], list[_PartCopy]],
+    durations: deque[float],
+    budget: Callable[[], int],
+    run: Callable[[_PartCopy], None],
+    stop: Event,
+) -> None:
+    """Start a second attempt for copies that take far longer than usual."""
+    hedged = 0
+    while not stop.wait(_HEDGE_POLL):
+        if len(durations) < _HEDGE_MIN_SAMPLES or hedged >= budget():
+            continue
+        threshold = max(_HEDGE_MIN_DELAY, _HEDGE_FACTOR * median(durations))
+        now = time.monotonic()
+        for copy in copies():
+            if hedged >= budget():
+                break
+            if not copy.hedged and now - copy.started > threshold:
+                copy.hedged = True
+                hedged += 1
+                locked_print(f"Hedging slow copy of part {copy.part.part_number}")
+                run(copy)
+
+
 def _do_upload_task(
     s3_client: BaseClient,
     max_workers: int,
     merge_state: MergeState,
     on_finished: Callable[[FinishedPiece | EndOfStream], None],
+    new_parts: Iterable[Part] = (),
+    expected_parts: int | None = None,
+    verbose: bool = False,
 ) -> Exception | None:
-    futures: list[Future[FinishedPiece | Exception]] = []
-    parts = merge_state.remaining_parts()
-    source_bucket = merge_state.bucket
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        semaphore = Semaphore(max_workers)
-        for part in parts:
-            part_number, s3_key = part.part_number, part.s3_key
-
-            def task(
-                s3_client=s3_client,
-                state=merge_state,
-                source_bucket=source_bucket,
-                s3_key=s3_key,
-                part_number=part_number,
-            ):
-                out = _upload_part_copy_task(
-                    s3_client=s3_client,
-                    state=state,
-                    source_bucket=source_bucket,
-                    source_key=s3_key,
-                    part_number=part_number,
-                )
-                if isinstance(out, Exception):
-                    return out
-                # merge_state.on_finished(out)
-                on_finished(out)
-                return out
+    """Copy the remaining parts, then the new_parts as they are listed.
 
-            fut = executor.submit(task)
-            fut.add_done_callback(lambda x: semaphore.release())
-            futures.append(fut)
-
-            while not semaphore.acquire(blocking=False):
-                time.sleep(0.1)
-
-        final_fut = executor.submit(lambda: on_finished(EndOfStream()))
+    Copies of the first listed parts start while later pages are still being
+    fetched. If expected_parts is given and fewer parts were listed, the
+    upload is left open so a later run can resume once they are uploaded.
+    Copies stuck in the latency tail are hedged, see _PartCopy.
+    """
+    pending: set[_PartCopy] = set()
+    errors: list[Exception] = []
+    durations: deque[float] = deque(maxlen=256)
+    lock = Lock()
+
+    def all_parts() -> Generator[Part, None, None]:
+        yield from merge_state.remaining_parts()
+        for part in new_parts:
+            merge_state.add_part(part)
+            yield part
+
+    def copy_part(
+        part: Part, retries: int, part_stop: Event
+    ) -> FinishedPiece | Exception:
+        return _upload_part_copy_task(
+            s3_client=s3_client,
+            state=merge_state,
+            source_bucket=merge_state.bucket,
+            source_key=part.s3_key,
+            part_number=part.part_number,
+            verbose=verbose,
+            retries=retries,
+            stop=part_stop,
+        )
 
-        for fut in futures:
-            finished_part = fut.result()
-            if isinstance(finished_part, Exception):
-                executor.shutdown(wait=True, cancel_futures=True)
-                return finished_part
-        final_fut.result()
+    def on_done(copy: _PartCopy, out: FinishedPiece | Exception) -> None:
+        try:
+            with lock:
+                if isinstance(out, Exception):
+                    errors.append(out)
+                else:
+                    durations.append(time.monotonic() - copy.started)
+            if isinstance(out, FinishedPiece):
+                on_finished(out)
+        finally:
+            # Only now, so waiting on in_flight() also waits for the report.
+            with lock:
+                pending.discard(copy)
+            semaphore.release()
+
+    def in_flight() -> list[_PartCopy]:
+        with lock:
+            return list(pending)
+
+    def hedge_budget() -> int:
+        total = expected_parts or len(merge_state.all_parts)
+        return max(1, int(total * _HEDGE_BUDGET))
+
+    # At most max_workers copies in flight, the next part is only taken from
+    # the listing when a slot frees up.
+    semaphore = Semaphore(max_workers)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    hedge_executor = ThreadPoolExecutor(max_workers=_HEDGE_WORKERS)
+    stop = Event()
+    hedger = Thread(
+        target=_hedge_slow_copies,
+        args=(
+            in_flight,
+            durations,
+            hedge_budget,
+            lambda c: hedge_executor.submit(c.run, copy_part),
+            stop,
+        ),
+        daemon=True,
+    )
+    hedger.start()
+    try:
+        for part in all_parts():
+            semaphore.acquire()
+            if errors:
+                break
+            copy = _PartCopy(part, on_done)
+            with lock:
+                pending.add(copy)
+            executor.submit(copy.run, copy_part)
+
+        wait([copy.future for copy in in_flight()])
+        on_finished(EndOfStream())
+        if errors:
+            return errors[0]
+
+        if expected_parts is not None and len(merge_state.all_parts) < expected_parts:
+            return FileNotFoundError(
+                f"Only {len(merge_state.all_parts)} of {expected_parts} parts found "
+                f"for {merge_state.dst_key}, has the upload finished?"
+            )
 
         finished_parts = merge_state.finished
         try:
             assert len(finished_parts) == len(merge_state.all_parts)
         except Exception:
             return ValueError(
-                f"Finished parts mismatch: {len(finished_parts)} != {len(parts)}"
+                f"Finished parts mismatch: {len(finished_parts)} != {len(merge_state.all_parts)}"
             )
 
-        try:
-            # Complete the multipart upload
-            _complete_multipart_upload_from_parts(
-                s3_client=s3_client, state=merge_state, finished_parts=finished_parts
-            )
-        except Exception as e:
-            warnings.warn(f"Error completing multipart upload: {e}")
-            return e
-        return None
+        # Complete the multipart upload
+        return _complete_multipart_upload_from_parts(
+            s3_client=s3_client, state=merge_state, finished_parts=finished_parts
+        )
+    finally:
+        stop.set()
+        hedger.join()
+        for copy in in_flight():
+            copy.stop.set()
+        # Attempts still mid-request are left to finish on their own; the
+        # stop events keep them from retrying.
+        executor.shutdown(wait=False, cancel_futures=True)
+        hedge_executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _begin_upload(
     s3_client: BaseClient,
-    parts: list[Part],
     bucket: str,
     dst_key: str,
     verbose: bool,
@@ -229,12 +449,9 @@ def _begin_upload(
 
     Args:
         s3_client: Boto3 S3 client
-        source_bucket: Source bucket name
-        source_keys: List of source object keys to copy from
         bucket: Destination bucket name
         dst_key: Destination object key
-        retries: Number of retry attempts
-        byte_ranges: Optional list of byte ranges corresponding to source_keys
+        verbose: Print progress
 
     Returns:
         The upload id of the multipart upload
@@ -242,9 +459,7 @@ def _begin_upload(
 
     # Initiate multipart upload
     if verbose:
-        locked_print(
-            f"Creating multipart upload for {bucket}/{dst_key} from {len(parts)} source objects"
-        )
+        locked_print(f"Creating multipart upload for {bucket}/{dst_key}")
     create_params: dict[str, str] = {
         "Bucket": bucket,
         "Key": dst_key,
@@ -259,13 +474,22 @@ def _begin_upload(
 
 
 class WriteMergeStateThread(Thread):
-    def __init__(self, rclone_impl: RcloneImpl, merge_state: MergeState, verbose: bool):
+    def __init__(
+        self,
+        rclone_impl: RcloneImpl,
+        merge_state: MergeState,
+        verbose: bool,
+        s3_client: BaseClient | None = None,
+    ):
         super().__init__(daemon=True)
         assert isinstance(merge_state, MergeState)
         self.verbose = verbose
         self.merge_state = merge_state
         self.merge_path = merge_state.merge_path
         self.rclone_impl = rclone_impl
+        # merge.json is rewritten over and over, a PutObject on the merge's
+        # client is much cheaper than an rclone write each time.
+        self.s3_client = s3_client
         self.queue: Queue[FinishedPiece | EndOfStream] = Queue()
         self.start()
 
@@ -275,11 +499,12 @@ class WriteMergeStateThread(Thread):
             return item
         # see if there are more items in the queue, only write the last one
         while not self.queue.empty():
-            item = self.queue.get()
-            if isinstance(item, EndOfStream):
-                # put it back in for next time
-                self.queue.put(item)
+            next_item = self.queue.get()
+            if isinstance(next_item, EndOfStream):
+                # put it back in for next time, the pieces still get written
+                self.queue.put(next_item)
                 return item
+            item = next_item
         return item
 
     def verbose_print(self, msg: str) -> None:
@@ -296,12 +521,23 @@ class WriteMergeStateThread(Thread):
             assert isinstance(item, FinishedPiece)
             # piece: FinishedPiece = item
             # at this point just write out the whole json str
-            json_str = self.merge_state.to_json_str()
-            err = self.rclone_impl.write_text(self.merge_path, json_str)
+            json_bytes = self.merge_state.to_json_bytes()
+            err = self._write(json_bytes)
             if isinstance(err, Exception):
                 warnings.warn(f"Error writing merge state: {err}")
                 break
 
+    def _write(self, data: bytes) -> Exception | None:
+        if self.s3_client is None:
+            return self.rclone_impl.write_bytes(self.merge_path, data)
+        bucket = self.merge_state.bucket
+        try:
+            key = object_key(self.merge_path, bucket)
+            self.s3_client.put_object(Bucket=bucket, Key=key, Body=data)
+        except Exception as e:
+            return e
+        return None
+
     def add_finished(self, finished: FinishedPiece) -> None:
         self.queue.put(finished)
 
@@ -309,26 +545,91 @@ class WriteMergeStateThread(Thread):
         self.queue.put(EndOfStream())
 
 
-def _cleanup_merge(rclone: RcloneImpl, info: InfoJson) -> Exception | None:
+def _cleanup_merge(
+    rclone: RcloneImpl, info: InfoJson, s3_client: BaseClient, bucket: str
+) -> Exception | None:
     size = info.size
     dst = info.dst
     parts_dir = info.parts_dir
-    if not rclone.exists(dst):
-        return FileNotFoundError(f"Destination file not found: {dst}")
+    # One HeadObject on the client we already hold instead of an rclone
+    # exists and an rclone size, each a process and a listing.
+    try:
+        head = s3_client.head_object(Bucket=bucket, Key=object_key(dst, bucket))
+    except Exception as e:
+        if _is_not_found(e):
+            return FileNotFoundError(f"Destination file not found: {dst}")
+        return e
 
-    write_size = rclone.size_file(dst)
-    if write_size != size:
+    write_size = head["ContentLength"]
+    if size != write_size:
         return ValueError(f"Size mismatch: {write_size} != {size}")
 
     print(f"Upload complete: {dst}")
+    # DeleteObjects takes 1000 keys a request, a listing page at a time.
+    prefix = f"{object_key(parts_dir, bucket)}/"
+    keys = (
+        obj["Key"]
+        for page in iter_object_pages(s3_client, bucket, prefix)
+        for obj in page
+    )
+    err = delete_objects(s3_client, bucket, keys)
+    if err is None:
+        rclone._invalidate(parts_dir)
+        return None
+    warnings.warn(f"Bulk delete of {parts_dir} failed, purging with rclone: {err}")
     cp = rclone.purge(parts_dir)
     if cp.failed():
         return Exception(f"Failed to purge parts dir: {cp}")
     return None
 
 
+def _is_not_found(e: Exception) -> bool:
+    response = getattr(e, "response", None) or {}
+    code = str(response.get("Error", {}).get("Code", ""))
+    return code in ("404", "NoSuchKey", "NotFound")
+
+
+def _read_object(s3_client: BaseClient, bucket: str, key: str) -> bytes | Exception:
+    """GetObject on the merge's client, no rclone process for a small file."""
+    try:
+        return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+    except Exception as e:
+        return e
+
+
+def finish_workers(num_parts: int, rtt: float | None = None) -> int:
+    """Threads for the merge, RCLONE_API_FINISH_WORKERS if it is set.
+
+    Scales with the part count between 8 and 32, and uses the full 32 when
+    the measured round trip is over 50ms.
+    """
+    env = os.environ.get(_ENV_FINISH_WORKERS)
+    if env:
+        return max(1, int(env))
+    if rtt is not None and rtt > _HIGH_LATENCY:
+        return _MAX_FINISH_WORKERS
+    return min(_MAX_FINISH_WORKERS, max(_MIN_FINISH_WORKERS, num_parts // 4))
+
+
+@cache
+def _bucket_pattern(bucket: str) -> re.Pattern[str]:
+    return re.compile(rf"^(?:[^:/]*:)?/?{re.escape(bucket)}(?:/(.*))?$")
+
+
+def object_key(path: str, bucket: str) -> str:
+    """The key of an rclone path like dst:bucket/dir/file inside bucket.
+
+    Only a bucket right after the remote name matches, a directory further
+    down that happens to share the bucket's name is part of the key.
+    """
+    match = _bucket_pattern(bucket).match(path)
+    if match is None:
+        raise ValueError(f"{path} is not in bucket {bucket}")
+    return (match.group(1) or "").strip("/")
+
+
 def _get_merge_path(info_path: str) -> str:
-    par_dir = os.path.dirname(info_path)
+    par_dir = posixpath.dirname(info_path)
     merge_path = f"{par_dir}/merge.json"
     return merge_path
 
@@ -348,61 +649,55 @@ def _begin_or_resume_merge(
         )
 
         s3_bucket = merger.bucket
-        is_done = info.fetch_is_done()
-        assert is_done, f"Upload is not done: {info}"
+        first_part: int | None = info.first_part
+        last_part: int | None = info.last_part
+
+        # Not asserts, python -O would skip them.
+        if first_part is None or last_part is None:
+            return ValueError(
+                f"{info.src_info} has no first_part/last_part, has the upload started?"
+            )
+        merger.expected_parts = last_part - first_part + 1
+
+        parts_path = object_key(info.parts_dir, s3_bucket)
 
+        # The parts are listed while they are being copied, see _do_upload_task.
+        # A merge that stopped before the listing finished picks up the rest.
         merge_path = _get_merge_path(info_path=info.src_info)
-        merge_json_text = rclone.read_text(merge_path)
-        if isinstance(merge_json_text, str):
+        merge_json = _read_object(
+            merger.client, s3_bucket, object_key(merge_path, s3_bucket)
+        )
+        if isinstance(merge_json, Exception) and not _is_not_found(merge_json):
+            # Starting over would orphan the multipart upload being resumed.
+            return merge_json
+        if isinstance(merge_json, bytes):
             # Attempt to do a resume
-            merge_data = json.loads(merge_json_text)
+            merge_data = _json.loads(merge_json)
             merge_state = MergeState.from_json(rclone_impl=rclone, json=merge_data)
             if isinstance(merge_state, MergeState):
                 merger._begin_resume_merge(merge_state=merge_state)
+                if len(merge_state.all_parts) < merger.expected_parts:
+                    known = {p.part_number for p in merge_state.all_parts}
+                    merger.pending_parts = _pending_parts(
+                        merger.client, info, s3_bucket, parts_path, skip=known
+                    )
                 return merger
             warnings.warn(f"Failed to resume merge: {merge_state}, starting new merge")
 
-        parts_dir = info.parts_dir
-        source_keys = info.fetch_all_finished()
-
-        parts_path = parts_dir.split(s3_bucket)[1]
-        if parts_path.startswith("/"):
-            parts_path = parts_path[1:]
-
-        first_part: int | None = info.first_part
-        last_part: int | None = info.last_part
-
-        assert first_part is not None
-        assert last_part is not None
-
-        def _to_s3_key(name: str | None) -> str:
-            if name:
-                out = f"{parts_path}/{name}"
-                return out
-            out = f"{parts_path}"
-            return out
-
-        parts: list[Part] = []
-        part_num = first_part
-        for part_key in source_keys:
-            assert part_num <= last_part and part_num >= first_part
-            s3_key = _to_s3_key(name=part_key)
-            part = Part(part_number=part_num, s3_key=s3_key)
-            parts.append(part)
-            part_num += 1
-
-        dst_name = info.dst_name
-        dst_dir = os.path.dirname(parts_path)
-        dst_key = f"{dst_dir}/{dst_name}"
+        # The object next to its -parts dir, also right for one in the bucket root.
+        dst_key = object_key(info.dst, s3_bucket)
 
         err = merger._begin_new_merge(
             merge_path=merge_path,
-            parts=parts,
+            parts=[],
             bucket=merger.bucket,
             dst_key=dst_key,
         )
         if isinstance(err, Exception):
             return err
+        merger.pending_parts = _pending_parts(
+            merger.client, info, s3_bucket, parts_path, skip=set()
+        )
         return merger
     except Exception as e:
         return e
@@ -421,16 +716,14 @@ class S3MultiPartMerger:
         self.info = info
         self.s3_creds = rclone_impl.get_s3_credentials(remote=info.dst)
         self.verbose = verbose
-        s3_config = s3_config or S3Config(
-            verbose=verbose,
-            timeout_read=_TIMEOUT_READ,
-            timeout_connection=_TIMEOUT_CONNECTION,
-            max_pool_connections=max_workers,
-        )
-        self.max_workers = s3_config.max_pool_connections or DEFAULT_MAX_WORKERS
-        self.client = create_s3_client(s3_creds=self.s3_creds, s3_config=s3_config)
+        s3_config = s3_config or _merge_s3_config(verbose, max_workers)
+        self.max_workers = max_workers
+        self.client = get_s3_client(s3_creds=self.s3_creds, s3_config=s3_config)
         self.state: MergeState | None = None
         self.write_thread: WriteMergeStateThread | None = None
+        # Parts still to be listed and the total there should be.
+        self.pending_parts: Iterable[Part] = ()
+        self.expected_parts: int | None = None
 
     @staticmethod
     def create(
@@ -444,6 +737,17 @@ class S3MultiPartMerger:
     def bucket(self) -> str:
         return self.s3_creds.bucket_name
 
+    def probe_rtt(self) -> float | None:
+        """Seconds for one HeadObject of info.json, None if it failed."""
+        key = object_key(self.info.src_info, self.bucket)
+        start = time.monotonic()
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+        except Exception as e:
+            warnings.warn(f"Latency probe of {key} failed: {e}")
+            return None
+        return time.monotonic() - start
+
     def start_write_thread(self) -> None:
         assert self.state is not None
         assert self.write_thread is None
@@ -451,6 +755,7 @@ class S3MultiPartMerger:
             rclone_impl=self.rclone_impl,
             merge_state=self.state,
             verbose=self.verbose,
+            s3_client=self.client,
         )
 
     def _begin_new_merge(
@@ -463,7 +768,6 @@ class S3MultiPartMerger:
         try:
             upload_id: str = _begin_upload(
                 s3_client=self.client,
-                parts=parts,
                 bucket=bucket,
                 dst_key=dst_key,
                 verbose=self.verbose,
@@ -509,32 +813,88 @@ class S3MultiPartMerger:
             merge_state=state,
             max_workers=self.max_workers,
             on_finished=self._on_piece_finished,
+            new_parts=self.pending_parts,
+            expected_parts=self.expected_parts,
+            verbose=self.verbose,
         )
         if isinstance(err, Exception):
             return err
         return None
 
     def cleanup(self) -> Exception | None:
-        return _cleanup_merge(rclone=self.rclone_impl, info=self.info)
+        return _cleanup_merge(
+            rclone=self.rclone_impl,
+            info=self.info,
+            s3_client=self.client,
+            bucket=self.bucket,
+        )
+
+
+def _merge_s3_config(verbose: bool, max_workers: int) -> S3Config:
+    return S3Config(
+        verbose=verbose,
+        timeout_read=_TIMEOUT_READ,
+        timeout_connection=_TIMEOUT_CONNECTION,
+        max_pool_connections=max_workers + _SIDE_CONNECTIONS,
+        # Client side rate limiting when the provider starts throttling.
+        retry_mode="adaptive",
+    )
+
+
+def _prepare_s3_client(
+    rclone: RcloneImpl, info_path: str, max_workers: int, verbose: bool
+) -> None:
+    """Build the merger's S3 client ahead of time, it lands in get_s3_client's cache.
+
+    The destination follows from the info.json path alone. Errors are left
+    for the merger to hit and report when it asks for the client itself.
+    """
+    try:
+        dst = InfoJson(rclone, src=None, src_info=info_path).dst
+        s3_creds = rclone.get_s3_credentials(remote=dst)
+        get_s3_client(s3_creds, _merge_s3_config(verbose, max_workers))
+    except Exception:
+        pass
 
 
 def s3_server_side_multi_part_merge(
     rclone: RcloneImpl,
     info_path: str,
-    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_workers: int | None = None,
     verbose: bool = False,
 ) -> Exception | None:
-    info = InfoJson(rclone, src=None, src_info=info_path)
-    loaded = info.load()
+    """Merge the uploaded parts into the destination object.
+
+    max_workers=None picks the thread count with finish_workers().
+    """
+    # finish_workers() picks the count later, size the pool for the most it
+    # can pick, which is more than 32 when RCLONE_API_FINISH_WORKERS says so.
+    pool_size = max_workers or max(_MAX_FINISH_WORKERS, finish_workers(0))
+    # Creating a boto3 client takes about as long as fetching info.json,
+    # so both happen at once.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(_prepare_s3_client, rclone, info_path, pool_size, verbose)
+        info = InfoJson(rclone, src=None, src_info=info_path)
+        loaded = info.load()
     if not loaded:
         return FileNotFoundError(
             f"Info file not found, has the upload finished? {info_path}"
         )
     merger: S3MultiPartMerger | Exception = S3MultiPartMerger.create(
-        rclone=rclone, info=info, max_workers=max_workers, verbose=verbose
+        rclone=rclone,
+        info=info,
+        max_workers=pool_size,
+        verbose=verbose,
     )
     if isinstance(merger, Exception):
         return merger
+    if max_workers is None:
+        # The connection pool is sized for the most threads we'd pick.
+        num_parts = merger.expected_parts or 0
+        rtt = None if os.environ.get(_ENV_FINISH_WORKERS) else merger.probe_rtt()
+        merger.max_workers = finish_workers(num_parts, rtt)
+        if verbose:
+            locked_print(f"Merging {num_parts} parts with {merger.max_workers} threads")
 
     err = merger.merge()
     if isinstance(err, Exception):
@@ -1,4 +1,3 @@
-import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -6,6 +5,7 @@ from threading import Lock
 
 from botocore.client import BaseClient
 
+from rclone_api import _json
 from rclone_api.s3.multipart.finished_piece import FinishedPiece
 from rclone_api.s3.multipart.upload_info import UploadInfo
 from rclone_api.types import EndOfStream, SizeSuffix
@@ -102,7 +102,8 @@ class UploadState:
 
     def _save_no_lock(self) -> None:
         assert self.peristant is not None, "No path to save to"
-        self.peristant.write_text(self.to_json_str(), encoding="utf-8")
+        # Rewritten after every part, orjson keeps that cheap as the list grows.
+        self.peristant.write_bytes(self.to_json_bytes())
 
     @staticmethod
     def load(s3_client: BaseClient, path: Path) -> "UploadState":
@@ -149,13 +150,15 @@ class UploadState:
         # json.dumps(out_json)
         return out_json
 
+    def to_json_bytes(self) -> bytes:
+        return _json.dumps(self.to_json(), indent=True)
+
     def to_json_str(self) -> str:
-        return json.dumps(self.to_json(), indent=4)
+        return self.to_json_bytes().decode("utf-8")
 
     @staticmethod
     def from_json(s3_client: BaseClient, json_file: Path) -> "UploadState":
-        json_str = json_file.read_text(encoding="utf-8")
-        data = json.loads(json_str)
+        data = _json.loads(json_file.read_bytes())
         upload_info_json = data["upload_info"]
         finished_parts_json = data["finished_parts"]
         upload_info = UploadInfo.from_json(s3_client, upload_info_json)
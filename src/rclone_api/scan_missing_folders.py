@@ -1,16 +1,18 @@
 import random
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from queue import Empty, Queue
 from threading import Thread
 from typing import Generator
 
 from rclone_api import Dir
-from rclone_api.detail.walk import walk_runner_depth_first
 from rclone_api.dir_listing import DirListing
 from rclone_api.types import ListingOption, Order
 
 _MAX_OUT_QUEUE_SIZE = 50
+# The source and destination side of a pair are listed at the same time.
+DEFAULT_SCAN_STAT_THREADS = 2
 
 
 def _reorder_inplace(data: list, order: Order) -> None:
@@ -26,76 +28,98 @@ def _reorder_inplace(data: list, order: Order) -> None:
         raise ValueError(f"Invalid order: {order}")
 
 
+@dataclass
+class _PendingPair:
+    src: Dir
+    dst: Dir
+    depth: int
+    src_future: Future[DirListing]
+    dst_future: Future[DirListing]
+
+    def done(self) -> bool:
+        return self.src_future.done() and self.dst_future.done()
+
+
+def _ls_dirs(dir: Dir, order: Order, max_depth: int = 0) -> DirListing:
+    return dir.ls(
+        listing_option=ListingOption.DIRS_ONLY, order=order, max_depth=max_depth
+    )
+
+
 # ONLY Works from src -> dst diffing.
 def _async_diff_dir_walk_task(
-    src: Dir, dst: Dir, max_depth: int, out_queue: Queue[Dir | None], order: Order
+    src: Dir,
+    dst: Dir,
+    max_depth: int,
+    out_queue: Queue[Dir | None],
+    order: Order,
+    executor: ThreadPoolExecutor,
 ) -> None:
-    can_scan_two_deep = max_depth > 1 or max_depth == -1
-    ls_depth = 2 if can_scan_two_deep else 1
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        t1 = executor.submit(
-            src.ls,
-            listing_option=ListingOption.DIRS_ONLY,
-            order=order,
-            max_depth=ls_depth,
-        )
-        t2 = executor.submit(
-            dst.ls,
-            listing_option=ListingOption.DIRS_ONLY,
-            order=order,
-            max_depth=ls_depth,
+    """Lists matching src/dst directory pairs concurrently, one level at a time.
+
+    Both sides of a pair are submitted together and compared when both listings
+    have arrived. Directories missing on dst are emitted along with every directory
+    beneath them, matching directories are queued as new pairs.
+    """
+
+    def _submit_pair(src: Dir, dst: Dir, depth: int) -> _PendingPair:
+        return _PendingPair(
+            src=src,
+            dst=dst,
+            depth=depth,
+            src_future=executor.submit(_ls_dirs, src, order),
+            dst_future=executor.submit(_ls_dirs, dst, order),
         )
-        src_dir_listing: DirListing = t1.result()
-        dst_dir_listing: DirListing = t2.result()
-    next_depth = max_depth - ls_depth if max_depth > 0 else max_depth
-    dst_dirs: list[str] = [d.relative_to(src) for d in dst_dir_listing.dirs]
-    src_dirs: list[str] = [d.relative_to(dst) for d in src_dir_listing.dirs]
-    dst_files_set: set[str] = set(dst_dirs)
-    matching_dirs: list[str] = []
-    _reorder_inplace(src_dirs, order)
-    _reorder_inplace(dst_dirs, order)
-    for i, src_dir in enumerate(src_dirs):
-        src_dir_dir = src / src_dir
-        if src_dir not in dst_files_set:
-            queue_dir_listing: Queue[DirListing | None] = Queue()
-            if next_depth > 0 or next_depth == -1:
-                walk_runner_depth_first(
-                    dir=src_dir_dir,
-                    out_queue=queue_dir_listing,
-                    order=order,
-                    max_depth=next_depth,
-                )
-                out_queue.put(src)
-            while dirlisting := queue_dir_listing.get():
-                if dirlisting is None:
-                    break
-                # print(f"dirlisting: {dirlisting}")
-                for d in dirlisting.dirs:
-                    out_queue.put(d)
-        else:
-            matching_dirs.append(src_dir)
-
-    for matching_dir in matching_dirs:
-        # print(f"matching dir: {matching_dir}")
-        if next_depth > 0 or next_depth == -1:
-            src_next = src / matching_dir
-            dst_next = dst / matching_dir
-            _async_diff_dir_walk_task(
-                src=src_next,
-                dst=dst_next,
-                max_depth=next_depth,
-                out_queue=out_queue,
-                order=order,
-            )
+
+    pairs: list[_PendingPair] = [_submit_pair(src, dst, max_depth)]
+    subtrees: list[Future[DirListing]] = []
+    while pairs or subtrees:
+        futures = [f for p in pairs for f in (p.src_future, p.dst_future)]
+        wait(futures + subtrees, return_when=FIRST_COMPLETED)
+        for fut in [f for f in subtrees if f.done()]:
+            subtrees.remove(fut)
+            for d in fut.result().dirs:
+                out_queue.put(d)
+        ready = [p for p in pairs if p.done()]
+        pairs = [p for p in pairs if not p.done()]
+        for pair in ready:
+            src_listing: DirListing = pair.src_future.result()
+            dst_listing: DirListing = pair.dst_future.result()
+            next_depth = pair.depth - 1 if pair.depth > 0 else pair.depth
+            dst_dirs: set[str] = {d.relative_to(pair.dst) for d in dst_listing.dirs}
+            src_dirs: list[str] = [d.relative_to(pair.src) for d in src_listing.dirs]
+            _reorder_inplace(src_dirs, order)
+            for src_dir in src_dirs:
+                src_next = pair.src / src_dir
+                if src_dir not in dst_dirs:
+                    out_queue.put(src_next)
+                    if next_depth != 0:
+                        # Everything below a missing directory is missing too.
+                        subtree_depth = -1 if next_depth < 0 else next_depth
+                        subtrees.append(
+                            executor.submit(_ls_dirs, src_next, order, subtree_depth)
+                        )
+                elif next_depth != 0:
+                    pairs.append(_submit_pair(src_next, pair.dst / src_dir, next_depth))
 
 
 def async_diff_dir_walk_task(
-    src: Dir, dst: Dir, max_depth: int, out_queue: Queue[Dir | None], order: Order
+    src: Dir,
+    dst: Dir,
+    max_depth: int,
+    out_queue: Queue[Dir | None],
+    order: Order,
+    stat_threads: int = DEFAULT_SCAN_STAT_THREADS,
+    executor: ThreadPoolExecutor | None = None,
 ) -> None:
     try:
-        _async_diff_dir_walk_task(
-            src=src, dst=dst, max_depth=max_depth, out_queue=out_queue, order=order
-        )
+        if executor is not None:
+            _async_diff_dir_walk_task(src, dst, max_depth, out_queue, order, executor)
+        else:
+            with ThreadPoolExecutor(max_workers=stat_threads) as private_executor:
+                _async_diff_dir_walk_task(
+                    src, dst, max_depth, out_queue, order, private_executor
+                )
     except Exception:
         import _thread
 
@@ -105,17 +129,41 @@ def async_diff_dir_walk_task(
         out_queue.put(None)
 
 
+def scan_missing_folders_recursive(
+    src: Dir,
+    dst: Dir,
+    src_listing: DirListing,
+    dst_listing: DirListing,
+    order: Order = Order.NORMAL,
+) -> Generator[Dir, None, None]:
+    """Set difference of two recursive DIRS_ONLY listings of src and dst.
+
+    Every directory of src that has no counterpart in dst is yielded, parents
+    before children in NORMAL order.
+    """
+    dst_dirs: set[str] = {d.relative_to(dst) for d in dst_listing.dirs}
+    src_dirs: dict[str, Dir] = {d.relative_to(src): d for d in src_listing.dirs}
+    missing: list[str] = sorted(set(src_dirs) - dst_dirs)
+    _reorder_inplace(missing, order)
+    for rel in missing:
+        yield src_dirs[rel]
+
+
 def scan_missing_folders(
     src: Dir,
     dst: Dir,
     max_depth: int = -1,
     order: Order = Order.NORMAL,
+    stat_threads: int = DEFAULT_SCAN_STAT_THREADS,
+    executor: ThreadPoolExecutor | None = None,
 ) -> Generator[Dir, None, None]:
     """Walk through the given directory recursively.
 
     Args:
         dir: Directory or Remote to walk through
         max_depth: Maximum depth to traverse (-1 for unlimited)
+        stat_threads: Number of directory listings running concurrently
+        executor: Optional shared pool to run the listings on
 
     Yields:
         DirListing: Directory listing for each directory encountered
@@ -131,6 +179,8 @@ def scan_missing_folders(
                 max_depth=max_depth,
                 out_queue=out_queue,
                 order=order,
+                stat_threads=stat_threads,
+                executor=executor,
             )
 
         worker = Thread(
@@ -344,35 +344,21 @@ def _get_chunk_size(
 
 
 def _create_part_infos(
-    src_size: int | SizeSuffix, target_chunk_size: int | SizeSuffix
+    src_size: int | SizeSuffix,
+    target_chunk_size: int | SizeSuffix,
+    first_part: int = 1,
+    last_part: int | None = None,
 ) -> list["PartInfo"]:
-    # now break it up into 10 parts
-    target_chunk_size = SizeSuffix(target_chunk_size)
-    src_size = SizeSuffix(src_size)
-    chunk_size = _get_chunk_size(src_size=src_size, target_chunk_size=target_chunk_size)
-
-    part_infos: list[PartInfo] = []
-    curr_offset: int = 0
-    part_number: int = 0
-    while True:
-        part_number += 1
-        done = False
-        end = curr_offset + chunk_size
-        if end > src_size:
-            done = True
-            chunk_size = src_size - curr_offset
-        range: Range = Range(start=curr_offset, end=curr_offset + chunk_size)
-        part_info = PartInfo(
-            part_number=part_number,
-            range=range,
+    # Plain int arithmetic, only the parts asked for are built.
+    size = SizeSuffix(src_size).as_int()
+    chunk = _get_chunk_size(src_size, target_chunk_size).as_int()
+    stop = size if last_part is None else min(size, last_part * chunk)
+    return [
+        PartInfo(part_number=number, range=Range(start, min(start + chunk, size)))
+        for number, start in enumerate(
+            range((first_part - 1) * chunk, stop, chunk), start=first_part
         )
-        part_infos.append(part_info)
-        curr_offset += chunk_size.as_int()
-        if curr_offset >= src_size:
-            break
-        if done:
-            break
-    return part_infos
+    ]
 
 
 @dataclass
@@ -382,24 +368,24 @@ class PartInfo:
 
     @staticmethod
     def split_parts(
-        size: int | SizeSuffix, target_chunk_size: int | SizeSuffix
+        size: int | SizeSuffix,
+        target_chunk_size: int | SizeSuffix,
+        first_part: int = 1,
+        last_part: int | None = None,
     ) -> list["PartInfo"]:
-        out = _create_part_infos(size, target_chunk_size)
+        """Split size into parts, optionally only parts first_part..last_part."""
+        out = _create_part_infos(size, target_chunk_size, first_part, last_part)
         return out
 
     def __post_init__(self):
         assert self.part_number >= 0
         assert self.part_number <= 10000
-        assert self.range.start >= 0
-        assert self.range.end > self.range.start
+        assert self.range.start._size >= 0
+        assert self.range.end._size > self.range.start._size
 
     @property
     def name(self) -> str:
-        partnumber = f"{self.part_number:05d}"
-        offset = self.range.start.as_int()
-        end = SizeSuffix(self.range.end._size).as_int()
-        dst_name = f"part.{partnumber}_{offset}-{end}"
-        return dst_name
+        return f"part.{self.part_number:05d}_{self.range.start._size}-{self.range.end._size}"
 
     def __repr__(self) -> str:
         return f"PartInfo(part_number={self.part_number}, range={self.range})"
@@ -16,7 +16,6 @@ from appdirs import user_cache_dir
 
 from rclone_api.config import Config
 from rclone_api.dir import Dir
-from rclone_api.install import rclone_download
 from rclone_api.remote import Remote
 from rclone_api.rpath import RPath
 from rclone_api.types import S3PathInfo
@@ -161,17 +160,39 @@ def get_check(check: bool | None) -> bool:
     return bool(int(os.getenv("RCLONE_API_CHECK", "1")))
 
 
+_RCLONE_WHICH_CACHE: dict[str | None, Path] = {}
+_RCLONE_WHICH_LOCK = Lock()
+
+
+def _which_rclone() -> Path | None:
+    """shutil.which("rclone"), remembered per $PATH value."""
+    key = os.environ.get("PATH")
+    with _RCLONE_WHICH_LOCK:
+        cached = _RCLONE_WHICH_CACHE.get(key)
+        if cached is not None and cached.exists():
+            return cached
+        found = shutil.which("rclone")
+        if found is None:
+            return None
+        _RCLONE_WHICH_CACHE[key] = Path(found)
+        return _RCLONE_WHICH_CACHE[key]
+
+
 def get_rclone_exe(rclone_exe: Path | None) -> Path:
     if rclone_exe is None:
-        rclone_which_path = shutil.which("rclone")
+        rclone_which_path = _which_rclone()
         if rclone_which_path is not None:
-            return Path(rclone_which_path)
+            return rclone_which_path
+        from rclone_api.install import rclone_download
+
         rclone_download(out=_RCLONE_EXE, replace=False)
         return _RCLONE_EXE
     return rclone_exe
 
 
 def upgrade_rclone() -> Path:
+    from rclone_api.install import rclone_download
+
     rclone_download(out=_RCLONE_EXE, replace=True)
     return _RCLONE_EXE
 
@@ -183,7 +204,12 @@ def rclone_execute(
     check: bool,
     capture: bool | Path | None = None,
     verbose: bool | None = None,
+    stdin: str | None = None,
+    binary: bool = False,
 ) -> subprocess.CompletedProcess:
+    """Run rclone to completion. stdin, if given, is piped to the process,
+    e.g. the file list for `--files-from -`. With binary=True stdout and
+    stderr are returned as bytes instead of being decoded."""
     tmpfile: Path | None = None
     verbose = get_verbose(verbose)
 
@@ -212,10 +238,13 @@ def rclone_execute(
 
         # Prepare subprocess parameters.
         proc_kwargs: dict[str, Any] = {
-            "encoding": "utf-8",
             "shell": False,
             "stderr": subprocess.PIPE,
         }
+        if not binary:
+            proc_kwargs["encoding"] = "utf-8"
+        if stdin is not None:
+            proc_kwargs["stdin"] = subprocess.PIPE
         file_handle = None
         if output_file:
             # Open the file for writing.
@@ -225,7 +254,8 @@ def rclone_execute(
             proc_kwargs["stdout"] = subprocess.PIPE if capture else None
 
         # Start the process.
-        process = subprocess.Popen(full_cmd, **proc_kwargs)
+        # Text or bytes depending on binary, which the kwargs hide from type checkers.
+        process: subprocess.Popen[Any] = subprocess.Popen(full_cmd, **proc_kwargs)
 
         # Register an atexit callback that uses psutil to kill the process tree.
         proc_ref = weakref.ref(process)
@@ -268,7 +298,13 @@ def rclone_execute(
         atexit.register(cleanup)
 
         # Wait for the process to complete.
-        out, err = process.communicate()
+        # communicate() writes stdin while draining stdout/stderr so a large
+        # file list can't deadlock against a full output pipe.
+        if binary:
+            stdin_bytes = stdin.encode("utf-8") if stdin is not None else None
+            out, err = process.communicate(input=stdin_bytes)
+        else:
+            out, err = process.communicate(input=stdin)
         # Close the file handle if used.
         if file_handle:
             file_handle.close()
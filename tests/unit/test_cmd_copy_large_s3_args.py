@@ -0,0 +1,66 @@
+"""
+Unit test file.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from rclone_api.cmd import copy_large_s3, copy_large_s3_finish
+from rclone_api.s3.multipart.upload_parts_resumable import choose_chunk_size
+from rclone_api.types import SizeSuffix
+
+
+class CopyLargeS3ArgsTester(unittest.TestCase):
+    """Test the argument parsing of the large file copy commands."""
+
+    def test_copy_args(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rclone.conf"
+            config.write_text("")
+            args = copy_large_s3._parse_args(
+                ["src:a.bin", "dst:b/a.bin", "--config", str(config)]
+                + ["--resume-json", "state.json", "--read-threads", "2"]
+            )
+        self.assertEqual(Path("state.json"), args.save_state_json)
+        self.assertEqual(2, args.read_threads)
+        self.assertEqual(8, args.threads)
+        self.assertIsNone(args.chunk_size)  # auto
+
+    def test_choose_chunk_size(self) -> None:
+        gib = 1024**3
+        self.assertEqual(SizeSuffix("128MiB"), choose_chunk_size(None))
+        self.assertEqual(SizeSuffix("64MiB"), choose_chunk_size(gib))
+        self.assertEqual(SizeSuffix("128MiB"), choose_chunk_size(5 * gib))
+        self.assertEqual(SizeSuffix("128MiB"), choose_chunk_size(50 * gib))
+        self.assertEqual(SizeSuffix("256MiB"), choose_chunk_size(51 * gib))
+        self.assertEqual(SizeSuffix("1G"), copy_large_s3._choose_chunk("1G"))
+
+    def test_finish_args(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rclone.conf"
+            config.write_text("")
+            args = copy_large_s3_finish._parse_args(
+                ["dst:b/a.bin-parts/", "--config", str(config), "--max-workers", "16"]
+            )
+        self.assertEqual("dst:b/a.bin-parts/", args.src)
+        self.assertEqual(16, args.max_workers)
+        self.assertTrue(args.verbose)
+
+    def test_finish_batch_args(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rclone.conf"
+            config.write_text("")
+            batch = Path(tmpdir) / "batch.txt"
+            batch.write_text(
+                "dst:b/a.bin-parts/\n\n# done already\ndst:b/c.bin-parts/\n"
+            )
+            args = copy_large_s3_finish._parse_args(
+                ["--config", str(config), "--batch-from-file", str(batch)]
+            )
+        self.assertIsNone(args.src)
+        self.assertEqual(["dst:b/a.bin-parts/", "dst:b/c.bin-parts/"], args.srcs)
+
+
+if __name__ == "__main__":
+    unittest.main()
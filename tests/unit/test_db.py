@@ -3,11 +3,13 @@ UUnit test file for the DB class.
 """
 
 import os
+import tempfile
 import unittest
 from pathlib import Path
 
 from rclone_api import FileItem as DBFile
 from rclone_api.db import DB
+from rclone_api.file import FileBatch
 
 HERE = Path(__file__).parent
 DB_PATH = HERE / "test.db"
@@ -78,6 +80,97 @@ class RcloneDBTests(unittest.TestCase):
             self.assertIn(entry, new_files, f"Unexpected entry: {entry}")
 
 
+class RcloneDBBatchTests(unittest.TestCase):
+    """Test batch inserts, each test on its own database file."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DB("sqlite:///" + str(Path(self.tmpdir.name) / "test.db"))
+
+    def tearDown(self) -> None:
+        """Clean up after the test."""
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_insert_updates_existing(self) -> None:
+        """Test that re-inserting a path updates the row in place."""
+        repo = self.db.get_or_create_repo("dst:TorrentBooks")
+
+        def make(name: str, size: int) -> DBFile:
+            return DBFile(
+                remote="dst:TorrentBooks",
+                parent="",
+                name=name,
+                size=size,
+                mime_type="application/pdf",
+                mod_time="2025-03-03T12:00:00",
+            )
+
+        repo.insert_files([make("book1.pdf", 1), make("book2.pdf", 2)])
+        repo.insert_files([make("book1.pdf", 10), make("book3.pdf", 3)])
+
+        sizes = {entry.name: entry.size for entry in repo.get_all_files()}
+        self.assertEqual({"book1.pdf": 10, "book2.pdf": 2, "book3.pdf": 3}, sizes)
+
+    def test_add_batch(self) -> None:
+        """Test inserting a column-wise batch."""
+        batch = FileBatch("dst:TorrentBooks")
+        for name, size in [("book1.pdf", 1), ("book2.sql.gz", 2)]:
+            batch.append_json(
+                {"Path": f"dir/{name}", "Name": name, "Size": size, "IsDir": False}
+            )
+        self.db.add_batch(batch)
+        self.db.add_batch(batch)
+        files = self.db.query_all_files("dst:TorrentBooks")
+        self.assertEqual(
+            {("dir/book1.pdf", 1, "pdf"), ("dir/book2.sql.gz", 2, "sql")},
+            {(f.path_no_remote, f.size, f.real_suffix) for f in files},
+        )
+
+    def test_bulk_load_new_only(self) -> None:
+        """Test a first load into an empty table with deferred indexes."""
+        from sqlalchemy import inspect
+
+        repo = self.db.get_or_create_repo("dst:Bulk")
+        self.assertTrue(repo.is_empty())
+        batch = FileBatch("dst:Bulk")
+        for i in range(5):
+            batch.append_json({"Path": f"f{i}.txt", "Name": f"f{i}.txt", "Size": i})
+        with repo.deferred_indexes():
+            repo.insert_batch(batch, new_only=True)
+        self.assertFalse(repo.is_empty())
+        self.assertEqual(5, len(repo.get_all_files()))
+        names = {
+            ix["name"] for ix in inspect(self.db.engine).get_indexes(repo.table_name)
+        }
+        self.assertIn(f"ix_{repo.table_name}_suffix", names)
+
+    def test_insert_batch_presort(self) -> None:
+        """New rows of a batch are inserted in path order."""
+        from sqlmodel import Session, select
+
+        repo = self.db.get_or_create_repo("dst:Sorted")
+        batch = FileBatch("dst:Sorted")
+        for name in ["c.txt", "a.txt", "b/z.txt", "b.txt"]:
+            batch.append_json({"Path": name, "Name": name.split("/")[-1], "Size": 1})
+        repo.insert_batch(batch, new_only=True)
+        model = repo.FileEntryModel
+        with Session(self.db.engine) as session:
+            rows = session.exec(select(model.path).order_by(model.id)).all()  # type: ignore
+        self.assertEqual(["a.txt", "b.txt", "b/z.txt", "c.txt"], list(rows))
+
+    def test_sqlite_pragmas(self) -> None:
+        """New sqlite databases get large pages and a fixed size cache."""
+        from sqlalchemy import text
+
+        with self.db.engine.connect() as conn:
+            self.assertEqual(65536, conn.execute(text("PRAGMA page_size")).scalar())
+            self.assertEqual(-65536, conn.execute(text("PRAGMA cache_size")).scalar())
+            self.assertEqual("wal", conn.execute(text("PRAGMA journal_mode")).scalar())
+            self.assertEqual(2, conn.execute(text("PRAGMA temp_store")).scalar())
+
+
 #
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,48 @@
+"""
+Unit test file.
+"""
+
+import io
+import unittest
+from types import SimpleNamespace
+
+from rclone_api.diff import (
+    DiffOption,
+    DiffType,
+    diff_stream_from_running_process,
+    parse_combined_line,
+)
+
+
+class DiffParseTester(unittest.TestCase):
+    """Test parsing of `rclone check --combined -` output."""
+
+    def test_parse_combined_line(self) -> None:
+        self.assertEqual(
+            (DiffType.MISSING_ON_DST, b"dir/a b.txt"),
+            parse_combined_line(b"+ dir/a b.txt\n"),
+        )
+        self.assertEqual((DiffType.EQUAL, b"x"), parse_combined_line(b"= x\r\n"))
+        self.assertIsNone(parse_combined_line(b"2025/02/17 14:43:38 INFO : ok\n"))
+        self.assertIsNone(parse_combined_line(b"-\n"))
+        self.assertIsNone(parse_combined_line(b""))
+
+    def test_diff_stream(self) -> None:
+        output = (
+            b"= same.txt\n2025/02/17 NOTICE: noise\n* changed.txt\n- only_dst.txt\n"
+        )
+        process = SimpleNamespace(stdout=io.BytesIO(output))
+        items = list(
+            diff_stream_from_running_process(
+                process, "src:a", "dst:b", DiffOption.COMBINED  # type: ignore
+            )
+        )
+        self.assertEqual(
+            [DiffType.EQUAL, DiffType.DIFFERENT, DiffType.MISSING_ON_SRC],
+            [i.type for i in items],
+        )
+        self.assertEqual("dst:b/changed.txt", items[1].dst_path())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -56,6 +56,30 @@ class RcloneTestFileItem(unittest.TestCase):
         )
         self.assertEqual(file_item.real_suffix, "cbz")
 
+    def test_file_item_has_no_dict(self) -> None:
+        file_item: FileItem = FileItem(
+            remote="remote",
+            parent="parent",
+            name="name.txt",
+            size=1,
+            mime_type="text/plain",
+            mod_time="mod_time",
+        )
+        self.assertFalse(hasattr(file_item, "__dict__"))
+        self.assertEqual(file_item.real_suffix, "txt")
+
+    def test_file_item_from_json_parent(self) -> None:
+        data = {"Path": "a/b/c.txt", "Name": "c.txt", "Size": 1}
+        file_item = FileItem.from_json("dst:bucket", data)
+        assert file_item is not None
+        self.assertEqual("a/b", file_item.parent)
+        self.assertEqual("dst:bucket/a/b/c.txt", file_item.path)
+        data = {"Path": "c.txt", "Name": "c.txt", "Size": 1}
+        file_item = FileItem.from_json("dst:bucket", data)
+        assert file_item is not None
+        self.assertEqual(".", file_item.parent)
+        self.assertEqual("c.txt", file_item.path_no_remote)
+
 
 if __name__ == "__main__":
     unittest.main()
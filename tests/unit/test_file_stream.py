@@ -0,0 +1,117 @@
+"""
+Unit test file.
+"""
+
+import io
+import json
+import unittest
+from types import SimpleNamespace
+
+from rclone_api.file_stream import FilesStream, lsjson_entry
+
+
+def _lsjson_output(count: int) -> bytes:
+    lines = [b"["]
+    for i in range(count):
+        entry = {
+            "Path": f"dir/file{i}.txt",
+            "Name": f"file{i}.txt",
+            "Size": i,
+            "MimeType": "text/plain",
+            "ModTime": "2024-01-01T00:00:00Z",
+            "IsDir": False,
+        }
+        sep = b"," if i < count - 1 else b""
+        lines.append(json.dumps(entry).encode("utf-8") + sep)
+    lines.append(b"]")
+    return b"\n".join(lines) + b"\n"
+
+
+class FilesStreamTester(unittest.TestCase):
+    """Test parsing of streamed lsjson output."""
+
+    def _stream(self, count: int, maxsize: int = 0) -> FilesStream:
+        self.disposed = 0
+
+        def _dispose() -> None:
+            self.disposed += 1
+
+        process = SimpleNamespace(
+            stdout=io.BytesIO(_lsjson_output(count)), dispose=_dispose
+        )
+        return FilesStream("dst:bucket", process, maxsize=maxsize)  # type: ignore
+
+    def test_files(self) -> None:
+        files = list(self._stream(5).files())
+        self.assertEqual(5, len(files))
+        self.assertEqual("file4.txt", files[-1].name)
+        self.assertEqual(4, files[-1].size)
+        self.assertEqual("dst:bucket", files[0].remote)
+
+    def test_lsjson_entry(self) -> None:
+        self.assertIsNone(lsjson_entry(b"[\n"))
+        self.assertIsNone(lsjson_entry(b"]\n"))
+        self.assertEqual(b'{"Name":"a"}', lsjson_entry(b'{"Name":"a"},\n'))
+        self.assertEqual(b'{"Name":"b"}', lsjson_entry(b'{"Name":"b"}\n'))
+
+    def test_files_paged(self) -> None:
+        pages = list(self._stream(25).files_paged(page_size=10))
+        self.assertEqual([10, 10, 5], [len(p) for p in pages])
+
+    def test_iter_batches(self) -> None:
+        batches = list(self._stream(25).iter_batches(batch_size=10))
+        self.assertEqual([10, 10, 5], [len(b) for b in batches])
+        self.assertEqual(list(range(10, 20)), list(batches[1].sizes))
+        self.assertEqual("dir/file24.txt", batches[-1].paths[-1])
+        item = batches[-1][4]
+        self.assertEqual("file24.txt", item.name)
+        self.assertEqual("dir", item.parent)
+        self.assertEqual("dst:bucket", item.remote)
+        self.assertEqual(0, self.disposed)
+
+    def test_iter_batches_early_exit(self) -> None:
+        batches = self._stream(50).iter_batches(batch_size=10)
+        next(batches)
+        batches.close()
+        self.assertEqual(1, self.disposed)
+
+    def test_iter_batches_prefetch(self) -> None:
+        batches = list(self._stream(25).iter_batches(batch_size=10, prefetch=2))
+        self.assertEqual([10, 10, 5], [len(b) for b in batches])
+        self.assertEqual("dir/file24.txt", batches[-1].paths[-1])
+        self.assertEqual(0, self.disposed)
+        batches = self._stream(50).iter_batches(batch_size=10, prefetch=1)
+        next(batches)
+        batches.close()
+        self.assertEqual(1, self.disposed)
+
+    def test_files_bounded_queue(self) -> None:
+        names = [f.name for f in self._stream(50, maxsize=4).files()]
+        self.assertEqual([f"file{i}.txt" for i in range(50)], names)
+
+    def test_files_bounded_queue_early_exit(self) -> None:
+        files = self._stream(50, maxsize=2).files()
+        self.assertEqual("file0.txt", next(files).name)
+        files.close()  # type: ignore
+        self.assertEqual(1, self.disposed)
+
+    def test_early_exit_stops_process(self) -> None:
+        files = self._stream(50).files()
+        next(files)
+        files.close()  # type: ignore
+        self.assertEqual(1, self.disposed)
+
+    def test_exhausted_keeps_process(self) -> None:
+        list(self._stream(5).files())
+        self.assertEqual(0, self.disposed)
+
+    def test_missing_modtime(self) -> None:
+        line = b'{"Path":"a.txt","Name":"a.txt","Size":1,"IsDir":false}'
+        process = SimpleNamespace(stdout=io.BytesIO(b"[\n" + line + b"\n]\n"))
+        files = list(FilesStream("dst:bucket", process).files())  # type: ignore
+        self.assertEqual("", files[0].mod_time)
+        self.assertEqual("", files[0].mime_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
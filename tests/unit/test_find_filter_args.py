@@ -0,0 +1,24 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.rclone_impl import _find_filter_args
+
+
+class FindFilterArgsTester(unittest.TestCase):
+    """Test the rclone filter flags built for find."""
+
+    def test_no_filters(self) -> None:
+        self.assertEqual([], _find_filter_args(None, None, None))
+
+    def test_all_filters(self) -> None:
+        self.assertEqual(
+            ["--include", "*.mp4", "--min-size", "1024B", "--max-size", "1G"],
+            _find_filter_args("*.mp4", 1024, "1G"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.rclone_impl import _glob_to_include
+
+
+class GlobToIncludeTester(unittest.TestCase):
+    """Test which ls globs are pushed down to rclone as --include."""
+
+    def test_suffix(self) -> None:
+        self.assertEqual("*.txt", _glob_to_include("*.txt"))
+        self.assertEqual("*_final.csv", _glob_to_include("data/*_final.csv"))
+
+    def test_not_pushed_down(self) -> None:
+        self.assertIsNone(_glob_to_include("file.txt"))
+        self.assertIsNone(_glob_to_include("data/*"))
+        self.assertIsNone(_glob_to_include("*.tx?"))
+        self.assertIsNone(_glob_to_include("*/sub/file.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
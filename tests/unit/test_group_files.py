@@ -5,7 +5,7 @@ Unit test file.
 import unittest
 
 from rclone_api.group_files import group_files as _group_files
-from rclone_api.group_files import group_under_one_prefix
+from rclone_api.group_files import group_under_one_prefix, pack_groups
 
 
 def group_files(
@@ -156,6 +156,31 @@ class GroupFilestest(unittest.TestCase):
         self.assertIn(expected_files[1], grouped_files)
         print("done")
 
+    def test_nested_paths_keep_prefix(self) -> None:
+        files = [f"a/d{i}/f{j}.txt" for i in range(5) for j in range(3)]
+        files += ["b/x.txt", "c/y/z.txt"]
+        original = list(files)
+        groups: dict[str, list[str]] = group_files(files)
+        self.assertEqual(original, files)  # input is not modified
+        flattened = [f"{k}/{f}" if k else f for k, fs in groups.items() for f in fs]
+        self.assertEqual(sorted(original), sorted(flattened))
+
+    def test_pack_groups(self) -> None:
+        groups = {
+            "a/d0": ["f0.txt", "f1.txt"],
+            "a/d1": ["f0.txt"],
+            "b/c": ["q.txt"],
+        }
+        packed = pack_groups(groups, 2)
+        self.assertEqual(
+            {"a/d0": ["f0.txt", "f1.txt"], "": ["a/d1/f0.txt", "b/c/q.txt"]}, packed
+        )
+        self.assertEqual(
+            ["a/d0/f0.txt", "a/d0/f1.txt", "a/d1/f0.txt", "b/c/q.txt"],
+            pack_groups(groups, 1)[""],
+        )
+        self.assertIs(groups, pack_groups(groups, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unit test file.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from rclone_api.http_server import HttpServer
+from rclone_api.types import Range
+
+_DATA = os.urandom(1000)
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        start, last = self.headers["Range"].removeprefix("bytes=").split("-")
+        body = _DATA[int(start) : int(last) + 1]
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@unittest.skipUnless(hasattr(os, "pwrite"), "needs os.pwrite")
+class HttpDownloadTester(unittest.TestCase):
+    """Test parallel range downloads written in place."""
+
+    def setUp(self) -> None:
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        process = SimpleNamespace(dispose=lambda: None)
+        self.server = HttpServer(url, "", process)  # type: ignore
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmpdir.cleanup()
+
+    def test_download_multi_threaded(self) -> None:
+        dst = Path(self.tmpdir.name) / "out.bin"
+        out = self.server.download_multi_threaded(
+            "file.bin", dst, chunk_size=64, n_threads=4, range=Range(0, len(_DATA))
+        )
+        self.assertEqual(dst, out)
+        self.assertEqual(_DATA, dst.read_bytes())
+
+    def test_download_sub_range(self) -> None:
+        dst = Path(self.tmpdir.name) / "part.bin"
+        self.server.download_multi_threaded(
+            "file.bin", dst, chunk_size=100, n_threads=3, range=Range(250, 777)
+        )
+        self.assertEqual(_DATA[250:777], dst.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
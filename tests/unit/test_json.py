@@ -0,0 +1,32 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api import _json
+from rclone_api.file import FileItem
+
+
+class JsonTester(unittest.TestCase):
+    """Test the rclone json decoding helpers."""
+
+    def test_loads_str_and_bytes(self) -> None:
+        text = '[{"Path": "a/b.txt", "Size": 3}]'
+        self.assertEqual(_json.loads(text), _json.loads(text.encode("utf-8")))
+        self.assertEqual(3, _json.loads(text)[0]["Size"])
+
+    def test_dumps_round_trip(self) -> None:
+        data = {"finished": [{"PartNumber": 1, "ETag": "abc"}], "all": []}
+        self.assertEqual(data, _json.loads(_json.dumps(data)))
+        self.assertIn(b"\n", _json.dumps(data, indent=True))
+
+    def test_invalid_json(self) -> None:
+        with self.assertRaises(_json.JSONDecodeError):
+            _json.loads(b"{not json")
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(FileItem.from_json_str("dst:bucket", b"{not json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
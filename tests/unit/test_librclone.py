@@ -0,0 +1,74 @@
+"""
+Unit test file.
+"""
+
+import ctypes
+import json
+import os
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from rclone_api import librclone
+from rclone_api.librclone import LibRclone, _RcloneRPCResult
+
+
+def _fake_lib(replies: dict[str, tuple[int, dict]]) -> tuple[SimpleNamespace, list]:
+    calls: list = []
+    buffers: list = []  # keep the reply buffers alive
+
+    def RcloneInitialize() -> None:
+        calls.append(("init",))
+
+    def RcloneRPC(method: bytes, params: bytes) -> _RcloneRPCResult:
+        calls.append((method.decode(), json.loads(params)))
+        status, reply = replies.get(method.decode(), (200, {}))
+        buf = ctypes.create_string_buffer(json.dumps(reply).encode())
+        buffers.append(buf)
+        return _RcloneRPCResult(ctypes.addressof(buf), status)
+
+    def RcloneFreeString(ptr: int) -> None:
+        calls.append(("free",))
+
+    lib = SimpleNamespace(
+        RcloneInitialize=RcloneInitialize,
+        RcloneRPC=RcloneRPC,
+        RcloneFreeString=RcloneFreeString,
+    )
+    return lib, calls
+
+
+class LibRcloneTester(unittest.TestCase):
+    """Test the in-process rc call wrapper."""
+
+    def test_call(self) -> None:
+        lib, calls = _fake_lib({"operations/stat": (200, {"item": {"Size": 3}})})
+        rc = LibRclone(lib, Path("rclone.conf"), "key")  # type: ignore
+        self.assertEqual(("config/setpath", {"path": "rclone.conf"}), calls[1])
+        out = rc.call("operations/stat", {"fs": "dst:", "remote": "a.txt"})
+        self.assertEqual({"item": {"Size": 3}}, out)
+        self.assertEqual(("free",), calls[-1])
+
+    def test_call_error(self) -> None:
+        lib, _ = _fake_lib({"operations/stat": (404, {"error": "object not found"})})
+        rc = LibRclone(lib, Path("rclone.conf"), "key")  # type: ignore
+        out = rc.call_job("operations/stat")
+        self.assertIsInstance(out, Exception)
+        self.assertIn("object not found", str(out))
+
+    def test_load_missing_library(self) -> None:
+        old = os.environ.get("RCLONE_API_LIBRCLONE")
+        os.environ["RCLONE_API_LIBRCLONE"] = "/nonexistent/librclone.so"
+        librclone._LOADED, librclone._LOAD_FAILED = None, False
+        try:
+            self.assertIsNone(librclone.load(Path("rclone.conf")))
+        finally:
+            librclone._LOADED, librclone._LOAD_FAILED = None, False
+            if old is None:
+                del os.environ["RCLONE_API_LIBRCLONE"]
+            else:
+                os.environ["RCLONE_API_LIBRCLONE"] = old
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit test file.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rclone_api._listing_cache import ListingCache, MissingCache, overlaps
+from rclone_api.rclone_impl import RcloneImpl
+
+
+class ListingCacheTester(unittest.TestCase):
+    """Test the ttl/lru listing cache and its prefix invalidation."""
+
+    def test_overlaps(self) -> None:
+        self.assertTrue(overlaps("dst:bucket/dir", "dst:bucket/dir/file.txt"))
+        self.assertTrue(overlaps("dst:bucket/dir/sub", "dst:bucket/dir/"))
+        self.assertTrue(overlaps("dst:", "dst:bucket"))
+        self.assertFalse(overlaps("dst:bucket/dir", "dst:bucket/dir2"))
+        self.assertFalse(overlaps("dst:bucket", "src:bucket"))
+
+    def test_invalidate_prefix(self) -> None:
+        cache = ListingCache()
+        cache.put("a", "dst:bucket/a", [])
+        cache.put("b", "dst:bucket/b", [])
+        cache.invalidate("dst:bucket/a/file.txt")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual([], cache.get("b"))
+        cache.invalidate()
+        self.assertIsNone(cache.get("b"))
+
+    def test_ttl(self) -> None:
+        cache = ListingCache(ttl=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.put("a", "dst:a", [])
+        with mock.patch("time.monotonic", return_value=109.0):
+            self.assertEqual([], cache.get("a"))
+        with mock.patch("time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+
+    def test_lru_bounds(self) -> None:
+        cache = ListingCache(maxsize=2, max_items=3)
+        cache.put("a", "dst:a", [])
+        cache.put("b", "dst:b", [])
+        cache.get("a")
+        cache.put("c", "dst:c", [])
+        self.assertIsNone(cache.get("b"))
+        cache.put("d", "dst:d", [object()] * 3)  # type: ignore
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual([], cache.get("c"))
+        # over max_items, so the oldest entries go until it fits
+        cache.put("e", "dst:e", [object()])  # type: ignore
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(1, len(cache.get("e") or []))
+
+    def test_missing_cache(self) -> None:
+        missing = MissingCache(ttl=5)
+        with mock.patch("time.monotonic", return_value=100.0):
+            missing.add("dst:bucket/a/file.txt")
+            missing.add("dst:bucket/b")
+            self.assertIn("dst:bucket/a/file.txt", missing)
+        with mock.patch("time.monotonic", return_value=106.0):
+            self.assertNotIn("dst:bucket/a/file.txt", missing)
+        # a write under a missing directory means it may exist now
+        missing.invalidate("dst:bucket/b/new.txt")
+        self.assertNotIn("dst:bucket/b", missing)
+
+    def test_exists_caches_misses_only_when_enabled(self) -> None:
+        rclone = RcloneImpl.__new__(RcloneImpl)
+        rclone.use_rcd = False
+        rclone._listing_cache = None
+        rclone._missing = None
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "later.txt"
+            self.assertFalse(rclone.exists(str(path)))
+            path.write_text("now")
+            # without the cache a poll sees the file as soon as it shows up
+            self.assertTrue(rclone.exists(str(path)))
+            path.unlink()
+
+            rclone.enable_cache()
+            self.assertFalse(rclone.exists(str(path)))
+            path.write_text("now")
+            self.assertFalse(rclone.exists(str(path)))
+            rclone.refresh_cache(str(path))
+            self.assertTrue(rclone.exists(str(path)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit test file.
+"""
+
+import errno
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rclone_api import _local_copy
+from rclone_api._local_copy import copy_file, copy_range, local_path
+
+
+class LocalCopyTester(unittest.TestCase):
+    """Test copying between local paths without rclone."""
+
+    def test_local_path(self) -> None:
+        self.assertEqual(Path("/tmp/a.txt"), local_path("/tmp/a.txt"))
+        self.assertEqual(Path("a/b.txt"), local_path(":local:a/b.txt"))
+        self.assertIsNone(local_path("dst:bucket/a.txt"))
+
+    def test_copy_range(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.bin"
+            src.write_bytes(bytes(range(256)) * 4)
+            dst = Path(tmpdir) / "out" / "part.bin"
+            self.assertEqual(100, copy_range(src, dst, 10, 100))
+            self.assertEqual(src.read_bytes()[10:110], dst.read_bytes())
+            # A count past the end stops at the end, like rclone cat --count.
+            self.assertEqual(24, copy_range(src, dst, 1000, 100))
+            self.assertEqual(src.read_bytes()[1000:], dst.read_bytes())
+
+    @unittest.skipUnless(hasattr(os, "sendfile"), "no sendfile")
+    def test_copy_range_sendfile(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.bin"
+            src.write_bytes(bytes(range(256)) * 4)
+            dst = Path(tmpdir) / "part.bin"
+            with mock.patch.object(_local_copy, "_COPY_FILE_RANGE", False):
+                if _local_copy._SENDFILE:
+                    self.assertEqual(100, copy_range(src, dst, 10, 100))
+                    self.assertEqual(src.read_bytes()[10:110], dst.read_bytes())
+                # A sendfile that wants a socket, as on macOS, falls back.
+                with mock.patch.object(_local_copy, "_SENDFILE", True):
+                    with mock.patch.object(
+                        os, "sendfile", side_effect=OSError(errno.ENOTSOCK, "")
+                    ):
+                        self.assertEqual(100, copy_range(src, dst, 20, 100))
+            self.assertEqual(src.read_bytes()[20:120], dst.read_bytes())
+
+    def test_copy_file_keeps_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.txt"
+            src.write_text("hello")
+            os.utime(src, (1_000_000, 1_000_000))
+            dst = Path(tmpdir) / "dst.txt"
+            copy_file(src, dst)
+            self.assertEqual("hello", dst.read_text())
+            self.assertEqual(1_000_000, int(dst.stat().st_mtime))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Unit test file.
+"""
+
+import logging
+import unittest
+from unittest import mock
+
+from rclone_api import log
+
+
+class SetupDefaultLoggingTester(unittest.TestCase):
+    """Test that default logging never clobbers an existing configuration."""
+
+    def setUp(self) -> None:
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+
+    def tearDown(self) -> None:
+        self.root.handlers[:] = self.saved_handlers
+
+    def test_noop_when_configured(self) -> None:
+        handler = logging.NullHandler()
+        self.root.handlers[:] = [handler]
+        with mock.patch.object(log, "_INITIALISED", False):
+            log.setup_default_logging()
+        self.assertEqual([handler], self.root.handlers)
+
+    def test_runs_once(self) -> None:
+        self.root.handlers[:] = []
+        with mock.patch.object(log, "_INITIALISED", False):
+            log.setup_default_logging()
+            self.assertEqual(1, len(self.root.handlers))
+            self.root.handlers[:] = []
+            log.setup_default_logging()
+            self.assertEqual([], self.root.handlers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Unit test file.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from rclone_api.detail.manifest import (
+    compare_to_manifest,
+    load_manifest,
+    parse_hashsum,
+    write_manifest,
+)
+from rclone_api.diff import DiffType
+
+
+class ManifestTester(unittest.TestCase):
+    """Test diffing a listing against a destination manifest."""
+
+    def test_round_trip(self) -> None:
+        entries = {"a/b.txt": (3, "abc"), "c, d.txt": (0, "")}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "manifest.csv"
+            write_manifest(path, entries)
+            self.assertEqual(entries, load_manifest(path))
+
+    def test_compare(self) -> None:
+        manifest = {"same.txt": (1, "h"), "grown.txt": (1, ""), "gone.txt": (5, "")}
+        listing = [("same.txt", 1), ("grown.txt", 2), ("new.txt", 3)]
+        seen: dict[str, int] = {}
+        same_size: list[str] = []
+        diffs = list(compare_to_manifest(listing, manifest, seen, same_size))
+        self.assertEqual(
+            [(DiffType.DIFFERENT, "grown.txt"), (DiffType.MISSING_ON_DST, "new.txt")],
+            diffs,
+        )
+        self.assertEqual(["same.txt"], same_size)
+        self.assertEqual({"gone.txt"}, manifest.keys() - seen.keys())
+
+    def test_parse_hashsum(self) -> None:
+        text = "d41d8cd98f00b204e9800998ecf8427e  empty.txt\n0cc175b9c0f1b6a8  dir/a b.txt\n"
+        self.assertEqual(
+            {
+                "empty.txt": "d41d8cd98f00b204e9800998ecf8427e",
+                "dir/a b.txt": "0cc175b9c0f1b6a8",
+            },
+            parse_hashsum(text),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
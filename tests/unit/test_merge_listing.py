@@ -0,0 +1,401 @@
+"""
+Unit test file.
+"""
+
+import io
+import os
+import threading
+import time
+import unittest
+import warnings
+from typing import Callable
+from unittest import mock
+
+from rclone_api import _json
+from rclone_api.s3.basic_ops import iter_object_pages
+from rclone_api.s3.multipart.finished_piece import FinishedPiece
+from rclone_api.s3.multipart.info_json import InfoJson
+from rclone_api.s3.multipart.merge_state import MergeState, Part
+from rclone_api.s3.multipart.upload_parts_server_side_merge import (
+    WriteMergeStateThread,
+    _cleanup_merge,
+    _do_upload_task,
+    _is_not_found,
+    _iter_finished_parts,
+    _pending_parts,
+    _prepare_s3_client,
+    _read_object,
+    _upload_part_copy_task,
+    finish_workers,
+    object_key,
+)
+from rclone_api.types import EndOfStream, PartInfo, SizeSuffix
+
+
+class _PagedClient:
+    """list_objects_v2 over a fixed set of keys, page_size keys at a time."""
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = sorted(keys)
+        self.calls = 0
+
+    def list_objects_v2(self, **params) -> dict:
+        self.calls += 1
+        # Like S3 the token marks a key, not an index, so deletes don't shift it.
+        after = params.get("ContinuationToken", "")
+        keys = [k for k in self.keys if k.startswith(params["Prefix"]) and k > after]
+        page = keys[: params["MaxKeys"]]
+        out: dict = {"Contents": [{"Key": k} for k in page]}
+        if len(keys) > len(page):
+            out["IsTruncated"] = True
+            out["NextContinuationToken"] = page[-1]
+        return out
+
+
+class _CopyClient:
+    """upload_part_copy that records how many copies ran at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.completed: list[dict] = []
+
+    def upload_part_copy(self, **params) -> dict:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return {"CopyPartResult": {"ETag": f"etag{params['PartNumber']}"}}
+
+    def complete_multipart_upload(self, **params) -> dict:
+        self.completed = params["MultipartUpload"]["Parts"]
+        return {}
+
+
+class _SlowOnceClient(_CopyClient):
+    """The first copy of one part hangs until released, retries are fast."""
+
+    def __init__(self, slow_part: int) -> None:
+        super().__init__()
+        self.slow_part = slow_part
+        self.release = threading.Event()
+        self.calls: dict[int, int] = {}
+
+    def upload_part_copy(self, **params) -> dict:
+        number = params["PartNumber"]
+        with self.lock:
+            self.calls[number] = self.calls.get(number, 0) + 1
+            first = self.calls[number] == 1
+        if number == self.slow_part and first:
+            self.release.wait(10)
+        return super().upload_part_copy(**params)
+
+
+class _HeadClient(_PagedClient):
+    """head_object for a single object, a 404 ClientError style error otherwise."""
+
+    def __init__(self, key: str, size: int, keys: list[str] | None = None) -> None:
+        super().__init__(keys or [])
+        self.key = key
+        self.size = size
+        self.heads: list[str] = []
+        self.deletes: list[int] = []
+        self.lock = threading.Lock()
+
+    def head_object(self, **params) -> dict:
+        self.heads.append(params["Key"])
+        if params["Key"] != self.key:
+            err = Exception("Not Found")
+            err.response = {"Error": {"Code": "404"}}  # type: ignore
+            raise err
+        return {"ContentLength": self.size}
+
+    def get_object(self, **params) -> dict:
+        self.head_object(**params)
+        return {"Body": io.BytesIO(b"{}")}
+
+    def delete_objects(self, **params) -> dict:
+        batch = [o["Key"] for o in params["Delete"]["Objects"]]
+        with self.lock:
+            self.deletes.append(len(batch))
+            self.keys = [k for k in self.keys if k not in set(batch)]
+        return {}
+
+
+class _PurgeRclone:
+    def __init__(self) -> None:
+        self.purged: list[str] = []
+        self.invalidated: list[str] = []
+
+    def _invalidate(self, path: str) -> None:
+        self.invalidated.append(path)
+
+    def purge(self, path: str) -> mock.Mock:
+        self.purged.append(path)
+        return mock.Mock(failed=lambda: False)
+
+
+def _on_finished(state: MergeState) -> Callable[[FinishedPiece | EndOfStream], None]:
+    """Record finished pieces in state, like the merge's writer thread."""
+
+    def on_finished(piece: FinishedPiece | EndOfStream) -> None:
+        if isinstance(piece, FinishedPiece):
+            state.on_finished(piece)
+
+    return on_finished
+
+
+class MergeListingTester(unittest.TestCase):
+    """Test listing the uploaded parts page by page for the merge."""
+
+    def test_iter_object_pages(self) -> None:
+        client = _PagedClient([f"dir/{i:03d}" for i in range(25)])
+        pages = list(iter_object_pages(client, "bucket", "dir/", page_size=10))  # type: ignore
+        self.assertEqual([10, 10, 5], [len(p) for p in pages])
+        self.assertEqual(3, client.calls)
+
+    def test_iter_finished_parts(self) -> None:
+        keys = [
+            "a/f.bin-parts/info.json",
+            "a/f.bin-parts/part.00001_0-10",
+            "a/f.bin-parts/part.00002_10-20",
+            "a/f.bin-parts/part.00003_20-25",
+            "a/f.bin-parts/sub/part.00009_0-1",
+        ]
+        parts = list(_iter_finished_parts(_PagedClient(keys), "bucket", "a/f.bin-parts", skip={2}))  # type: ignore
+        self.assertEqual([1, 3], [p.part_number for p in parts])
+        self.assertEqual("a/f.bin-parts/part.00003_20-25", parts[1].s3_key)
+
+    def test_finish_workers(self) -> None:
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("RCLONE_API_FINISH_WORKERS", None)
+            self.assertEqual(8, finish_workers(10))
+            self.assertEqual(25, finish_workers(100, rtt=0.01))
+            self.assertEqual(32, finish_workers(10_000))
+            self.assertEqual(32, finish_workers(10, rtt=0.2))
+            os.environ["RCLONE_API_FINISH_WORKERS"] = "3"
+            self.assertEqual(3, finish_workers(10_000, rtt=0.2))
+
+    def test_upload_task_streams_parts(self) -> None:
+        client = _CopyClient()
+        state = MergeState(
+            rclone_impl=None,  # type: ignore
+            merge_path="dst:b/f-parts/merge.json",
+            upload_id="id",
+            bucket="b",
+            dst_key="f",
+            finished=[],
+            all_parts=[Part(part_number=1, s3_key="f-parts/part.00001")],
+        )
+        new_parts = (Part(part_number=i, s3_key=f"k{i}") for i in range(2, 21))
+        err = _do_upload_task(
+            s3_client=client,  # type: ignore
+            max_workers=3,
+            merge_state=state,
+            on_finished=_on_finished(state),
+            new_parts=new_parts,
+            expected_parts=20,
+        )
+        self.assertIsNone(err)
+        self.assertLessEqual(client.max_running, 3)
+        self.assertEqual(
+            list(range(1, 21)), [p["PartNumber"] for p in client.completed]
+        )
+
+    def test_upload_task_reports_before_end_of_stream(self) -> None:
+        client = _CopyClient()
+        state = MergeState(
+            rclone_impl=None,  # type: ignore
+            merge_path="dst:b/f-parts/merge.json",
+            upload_id="id",
+            bucket="b",
+            dst_key="f",
+            finished=[],
+            all_parts=[Part(part_number=i, s3_key=f"k{i}") for i in range(1, 9)],
+        )
+        events: list[FinishedPiece | EndOfStream] = []
+
+        def on_finished(piece: FinishedPiece | EndOfStream) -> None:
+            if isinstance(piece, FinishedPiece):
+                time.sleep(0.05)  # a slow report must not be overtaken
+                state.on_finished(piece)
+            events.append(piece)
+
+        err = _do_upload_task(
+            s3_client=client,  # type: ignore
+            max_workers=4,
+            merge_state=state,
+            on_finished=on_finished,
+        )
+        self.assertIsNone(err)
+        self.assertEqual(9, len(events))
+        self.assertIsInstance(events[-1], EndOfStream)
+
+    def test_pending_parts_from_finished_info(self) -> None:
+        info = InfoJson(None, None, "dst:b/a/f.bin-parts/info.json")  # type: ignore
+        info.data = {"size": 250, "first_part": 1, "last_part": 3, "finished": True}
+        info.chunksize = SizeSuffix(100)
+        names = [p.name for p in PartInfo.split_parts(250, 100)]
+        keys = [f"a/f.bin-parts/{name}" for name in names]
+        client = _PagedClient(keys)
+        parts = list(_pending_parts(client, info, "b", "a/f.bin-parts", skip={2}))  # type: ignore
+        self.assertEqual([keys[0], keys[2]], [p.s3_key for p in parts])
+        self.assertEqual(1, client.calls)  # one key checked, no full listing
+
+    def test_pending_parts_wrong_chunksize(self) -> None:
+        info = InfoJson(None, None, "dst:b/a/f.bin-parts/info.json")  # type: ignore
+        info.data = {"size": 250, "first_part": 1, "last_part": 3, "finished": True}
+        # Recorded from the short tail part instead of the real chunk size.
+        info.chunksize = SizeSuffix(50)
+        keys = [f"a/f.bin-parts/{p.name}" for p in PartInfo.split_parts(250, 100)]
+        client = _PagedClient(keys)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parts = list(_pending_parts(client, info, "b", "a/f.bin-parts", skip=set()))  # type: ignore
+        self.assertEqual(keys, [p.s3_key for p in parts])
+
+    def test_upload_task_hedges_slow_copy(self) -> None:
+        client = _SlowOnceClient(slow_part=7)
+        state = MergeState(
+            rclone_impl=None,  # type: ignore
+            merge_path="dst:b/f-parts/merge.json",
+            upload_id="id",
+            bucket="b",
+            dst_key="f",
+            finished=[],
+            all_parts=[Part(part_number=i, s3_key=f"k{i}") for i in range(1, 21)],
+        )
+        start = time.monotonic()
+        try:
+            err = _do_upload_task(
+                s3_client=client,  # type: ignore
+                max_workers=4,
+                merge_state=state,
+                on_finished=_on_finished(state),
+            )
+        finally:
+            client.release.set()
+        self.assertIsNone(err)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(2, client.calls[7])
+        self.assertEqual(
+            list(range(1, 21)), [p["PartNumber"] for p in client.completed]
+        )
+
+    def test_part_copy_stops_retrying(self) -> None:
+        """Once the part is decided elsewhere the failing attempt gives up."""
+        stop = threading.Event()
+        calls = []
+
+        class _FailingClient:
+            def upload_part_copy(self, **params) -> dict:
+                calls.append(params["PartNumber"])
+                stop.set()  # e.g. the hedge won and the upload was completed
+                raise RuntimeError("NoSuchUpload")
+
+        state = MergeState(
+            rclone_impl=None,  # type: ignore
+            merge_path="dst:b/f-parts/merge.json",
+            upload_id="id",
+            bucket="b",
+            dst_key="f",
+            finished=[],
+            all_parts=[],
+        )
+        start = time.monotonic()
+        out = _upload_part_copy_task(
+            s3_client=_FailingClient(),  # type: ignore
+            state=state,
+            source_bucket="b",
+            source_key="k7",
+            part_number=7,
+            stop=stop,
+        )
+        self.assertIsInstance(out, Exception)
+        self.assertEqual([7], calls)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_object_key(self) -> None:
+        self.assertEqual(
+            "data/f.bin-parts", object_key("dst:data/data/f.bin-parts/", "data")
+        )
+        self.assertEqual("x/info.json", object_key("dst:/data/x/info.json", "data"))
+        self.assertEqual("", object_key("dst:data", "data"))
+        with self.assertRaises(ValueError):
+            object_key("dst:database/x", "data")
+        # the merged object of a parts dir in the bucket root
+        info = InfoJson(None, None, "dst:data/f.bin-parts/info.json")  # type: ignore
+        self.assertEqual("f.bin", object_key(info.dst, "data"))
+
+    def test_cleanup_merge_heads_dst(self) -> None:
+        info = InfoJson(None, None, "dst:b/a/f.bin-parts/info.json")  # type: ignore
+        info.data = {"size": 25}
+        rclone = _PurgeRclone()
+        err = _cleanup_merge(rclone, info, _HeadClient("a/f.bin", 24), "b")  # type: ignore
+        self.assertIsInstance(err, ValueError)
+        err = _cleanup_merge(rclone, info, _HeadClient("other", 25), "b")  # type: ignore
+        self.assertIsInstance(err, FileNotFoundError)
+        self.assertEqual([], rclone.invalidated)
+
+    def test_cleanup_merge_bulk_deletes_parts(self) -> None:
+        info = InfoJson(None, None, "dst:b/a/f.bin-parts/info.json")  # type: ignore
+        info.data = {"size": 25}
+        parts = [f"a/f.bin-parts/part.{i:05d}_0-1" for i in range(1, 2501)]
+        keys = ["a/f.bin", "a/f.bin-parts/info.json", *parts]
+        client = _HeadClient("a/f.bin", 25, keys)
+        rclone = _PurgeRclone()
+        err = _cleanup_merge(rclone, info, client, "b")  # type: ignore
+        self.assertIsNone(err)
+        self.assertEqual(["a/f.bin"], client.keys)
+        self.assertEqual([1000, 1000, 501], client.deletes)
+        self.assertEqual([], rclone.purged)
+        self.assertEqual(["dst:b/a/f.bin-parts"], rclone.invalidated)
+
+    def test_read_object(self) -> None:
+        client = _HeadClient("a/merge.json", 2)
+        self.assertEqual(b"{}", _read_object(client, "b", "a/merge.json"))  # type: ignore
+        err = _read_object(client, "b", "a/missing.json")  # type: ignore
+        self.assertIsInstance(err, Exception)
+        self.assertTrue(_is_not_found(err))  # type: ignore
+        self.assertFalse(_is_not_found(Exception("timeout")))
+
+    def test_prepare_s3_client(self) -> None:
+        rclone = mock.Mock()
+        target = "rclone_api.s3.multipart.upload_parts_server_side_merge.get_s3_client"
+        with mock.patch(target) as get_s3_client:
+            _prepare_s3_client(rclone, "dst:b/a/f.bin-parts/info.json", 32, False)
+            rclone.get_s3_credentials.assert_called_once_with(remote="dst:b/a/f.bin")
+            config = get_s3_client.call_args.args[1]
+            self.assertEqual(36, config.max_pool_connections)
+            self.assertEqual("adaptive", config.retry_mode)
+            # failures are left for the merger to report
+            get_s3_client.side_effect = ValueError("no such remote")
+            _prepare_s3_client(rclone, "dst:b/a/f.bin-parts/info.json", 32, False)
+
+    def test_write_merge_state_puts_object(self) -> None:
+        state = MergeState(
+            rclone_impl=None,  # type: ignore
+            merge_path="dst:b/a/f.bin-parts/merge.json",
+            upload_id="id",
+            bucket="b",
+            dst_key="a/f.bin",
+            finished=[FinishedPiece(part_number=1, etag="e1")],
+            all_parts=[Part(part_number=1, s3_key="a/f.bin-parts/part.00001_0-1")],
+        )
+        client = mock.Mock()
+        thread = WriteMergeStateThread(None, state, False, s3_client=client)  # type: ignore
+        thread.add_finished(state.finished[0])
+        thread.add_eos()
+        thread.join(5)
+        params = client.put_object.call_args.kwargs
+        self.assertEqual(
+            ("b", "a/f.bin-parts/merge.json"), (params["Bucket"], params["Key"])
+        )
+        self.assertEqual("id", MergeState.from_json(None, _json.loads(params["Body"])).upload_id)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
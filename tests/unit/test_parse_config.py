@@ -0,0 +1,40 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.config import parse_rclone_config
+
+
+class ParseConfigTester(unittest.TestCase):
+    """Test parsing rclone.conf text."""
+
+    def test_parse(self) -> None:
+        text = (
+            "# leading comment\r\n"
+            "ignored = before any section\n"
+            "[ dst ]\n"
+            "type = s3\n"
+            "  endpoint=https://host/?a=b  \n"
+            "; comment = not a key\n"
+            "no equals sign\n"
+            "\n"
+            "[src]\n"
+            "type=local\n"
+            "[dst]\n"
+            "type = b2\n"
+        )
+        sections = parse_rclone_config(text).sections
+        self.assertEqual(["dst", "src"], list(sections))
+        # a repeated section replaces the earlier one
+        self.assertEqual({"type": "b2"}, sections["dst"].data)
+        self.assertEqual({"type": "local"}, sections["src"].data)
+        sections = parse_rclone_config(text.split("[src]")[0]).sections
+        self.assertEqual(
+            {"type": "s3", "endpoint": "https://host/?a=b"}, sections["dst"].data
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Unit test file.
+"""
+
+import inspect
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rclone_api import _PASS_THROUGH_METHODS, Rclone
+from rclone_api.rclone_impl import RcloneImpl
+
+
+def _params(func) -> list[tuple]:
+    return [
+        (p.name, p.kind, p.default) for p in inspect.signature(func).parameters.values()
+    ]
+
+
+class PassThroughTester(unittest.TestCase):
+    """Methods that forward to the impl must keep the impl's signature."""
+
+    def test_signatures_match(self) -> None:
+        for name in _PASS_THROUGH_METHODS:
+            with self.subTest(name=name):
+                self.assertEqual(
+                    _params(getattr(Rclone, name)), _params(getattr(RcloneImpl, name))
+                )
+
+    def test_class_level_overrides_apply(self) -> None:
+        class _Sub(Rclone):
+            def exists(self, src) -> bool:  # type: ignore
+                return True
+
+        with mock.patch("rclone_api.rclone_impl.RcloneImpl") as impl_cls:
+            rclone = _Sub(Path("rclone.conf"))
+        self.assertTrue(rclone.exists("dst:bucket/a.txt"))
+        with mock.patch.object(Rclone, "ls", return_value="patched"):
+            self.assertEqual("patched", rclone.ls("dst:bucket"))
+        impl_cls.return_value.exists.assert_not_called()
+        impl_cls.return_value.ls.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Unit test file.
+"""
+
+import threading
+import time
+import unittest
+
+from rclone_api._pools import get_io_pool, submit_io_tasks
+
+
+class PoolsTester(unittest.TestCase):
+    """Test the shared io pool."""
+
+    def test_reused_and_grown(self) -> None:
+        pool = get_io_pool(2)
+        self.assertIs(pool, get_io_pool(1))
+        self.assertIsNot(pool, get_io_pool(64))
+
+    def test_concurrency_is_bounded(self) -> None:
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def task() -> int:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return 1
+
+        futures = submit_io_tasks([task] * 20, max_workers=3)
+        self.assertEqual(20, sum(f.result() for f in futures))
+        self.assertLessEqual(peak, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Unit test file.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from rclone_api.s3.multipart.upload_parts_resumable import (
+    _open_local_src,
+    _pread_to_file,
+)
+
+
+class PreadToFileTester(unittest.TestCase):
+    """Test reading parts of a local file through a shared fd."""
+
+    def test_reads_ranges(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.bin"
+            data = os.urandom(100_000)
+            src.write_bytes(data)
+            fd = _open_local_src(str(src))
+            if fd is None:
+                self.skipTest("os.pread not available")
+            try:
+                for offset, length in [(0, 10), (12_345, 50_000), (99_990, 10)]:
+                    dst = Path(tmpdir) / "chunks" / f"{offset}.chunk"
+                    _pread_to_file(fd, offset, length, dst)
+                    self.assertEqual(data[offset : offset + length], dst.read_bytes())
+            finally:
+                os.close(fd)
+
+    def test_remote_src_is_not_opened(self) -> None:
+        self.assertIsNone(_open_local_src("dst:bucket/does/not/exist.bin"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit test file.
+"""
+
+import os
+import unittest
+from types import SimpleNamespace
+
+import httpx
+
+from rclone_api.rcd import RcdServer, split_fs_remote
+
+
+class RcdSplitFsRemoteTester(unittest.TestCase):
+    """Test conversion of rclone paths to rc api fs/remote pairs."""
+
+    def test_remote_path(self) -> None:
+        fs, remote = split_fs_remote("dst:bucket/path/file.txt")
+        self.assertEqual(fs, "dst:")
+        self.assertEqual(remote, "bucket/path/file.txt")
+
+    def test_remote_root(self) -> None:
+        fs, remote = split_fs_remote("dst:")
+        self.assertEqual(fs, "dst:")
+        self.assertEqual(remote, "")
+
+    def test_leading_slash_is_stripped(self) -> None:
+        fs, remote = split_fs_remote("dst:/bucket/file.txt")
+        self.assertEqual(fs, "dst:")
+        self.assertEqual(remote, "bucket/file.txt")
+
+    def test_relative_local_path(self) -> None:
+        fs, remote = split_fs_remote("dir/file.txt")
+        self.assertEqual(
+            os.path.abspath("dir/file.txt"), os.path.join(fs, *remote.split("/"))
+        )
+        self.assertEqual(fs, os.path.abspath(os.sep))
+
+
+class RcdServerBytesTester(unittest.TestCase):
+    """Test read/write of bytes against a fake rc endpoint."""
+
+    def setUp(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                self.assertEqual("/operations/uploadfile", request.url.path)
+                fs = request.url.params["fs"]
+                remote = request.url.params["remote"]
+                body = request.read()
+                self.assertIn(b'filename="file.txt"', body)
+                self.store[f"/[{fs}]/{remote}/file.txt"] = b"hello"
+                return httpx.Response(200, json={})
+            data = self.store.get(request.url.path)
+            if data is None:
+                return httpx.Response(404, text="not found")
+            return httpx.Response(200, content=data)
+
+        process = SimpleNamespace(dispose=lambda: None)
+        self.server = RcdServer("http://localhost:0", "u", "p", process)  # type: ignore
+        assert self.server.client is not None
+        self.server.client.close()
+        self.server.client = httpx.Client(
+            base_url="http://localhost:0", transport=httpx.MockTransport(handler)
+        )
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+
+    def test_write_then_read(self) -> None:
+        err = self.server.write_bytes("dst:bucket/dir/file.txt", b"hello")
+        self.assertIsNone(err)
+        self.assertEqual(b"hello", self.server.read_bytes("dst:bucket/dir/file.txt"))
+
+    def test_read_missing(self) -> None:
+        out = self.server.read_bytes("dst:bucket/missing.txt")
+        self.assertIsInstance(out, FileNotFoundError)
+
+
+if __name__ == "__main__":
+    unittest.main()
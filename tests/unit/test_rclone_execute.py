@@ -0,0 +1,43 @@
+"""
+Unit test file.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from rclone_api.util import rclone_execute
+
+
+class RcloneExecuteTester(unittest.TestCase):
+    """Test piping stdin to the executed process."""
+
+    def test_stdin_is_piped(self) -> None:
+        files = [f"dir/file{i}.txt" for i in range(10000)]
+        # Stand in for rclone with the python interpreter so no binary is needed.
+        cmd = ["-c", "import sys; sys.stdout.write(sys.stdin.read())"]
+        cp = rclone_execute(
+            cmd,
+            rclone_conf=None,
+            rclone_exe=Path(sys.executable),
+            check=True,
+            stdin="\n".join(files) + "\n",
+        )
+        self.assertEqual(0, cp.returncode)
+        self.assertEqual(files, cp.stdout.splitlines())
+
+    def test_binary_stdout(self) -> None:
+        payload = bytes(range(256))
+        cmd = ["-c", "import sys; sys.stdout.buffer.write(bytes(range(256)))"]
+        cp = rclone_execute(
+            cmd,
+            rclone_conf=None,
+            rclone_exe=Path(sys.executable),
+            check=True,
+            binary=True,
+        )
+        self.assertEqual(payload, cp.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.s3.create import S3Config, get_s3_client
+from rclone_api.s3.types import S3Credentials, S3Provider
+
+
+def _creds(bucket: str) -> S3Credentials:
+    return S3Credentials(
+        bucket_name=bucket,
+        provider=S3Provider.S3,
+        access_key_id="key",
+        secret_access_key="secret",
+        endpoint_url="https://s3.example.com",
+    )
+
+
+class S3ClientCacheTester(unittest.TestCase):
+    """Test that s3 clients are shared between jobs with the same settings."""
+
+    def test_shared_client(self) -> None:
+        a = get_s3_client(_creds("a"), S3Config(max_pool_connections=7))
+        b = get_s3_client(_creds("b"), S3Config(max_pool_connections=7))
+        self.assertIs(a, b)
+        c = get_s3_client(_creds("a"), S3Config(max_pool_connections=8))
+        self.assertIsNot(a, c)
+        d = get_s3_client(_creds("a"), S3Config(retry_mode="adaptive"))
+        self.assertEqual("adaptive", d.meta.config.retries["mode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.rclone_impl import _split_parent
+
+
+class SplitParentTester(unittest.TestCase):
+    """Test how stat_many groups paths by parent directory."""
+
+    def test_split_parent(self) -> None:
+        self.assertEqual(
+            ("dst:bucket/dir", "a.txt"), _split_parent("dst:bucket/dir/a.txt")
+        )
+        self.assertEqual(("dst:", "a.txt"), _split_parent("dst:a.txt"))
+        self.assertEqual(("/tmp", "a.txt"), _split_parent("/tmp/a.txt"))
+        self.assertEqual((".", "a.txt"), _split_parent("a.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
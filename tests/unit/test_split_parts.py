@@ -0,0 +1,33 @@
+"""
+Unit test file.
+"""
+
+import unittest
+
+from rclone_api.types import PartInfo
+
+
+def _ranges(parts: list[PartInfo]) -> list[tuple[int, int, int]]:
+    return [
+        (p.part_number, p.range.start.as_int(), p.range.end.as_int()) for p in parts
+    ]
+
+
+class SplitPartsTester(unittest.TestCase):
+    """Test splitting a file into upload parts."""
+
+    def test_split(self) -> None:
+        self.assertEqual(
+            [(1, 0, 100), (2, 100, 200), (3, 200, 250)],
+            _ranges(PartInfo.split_parts(250, 100)),
+        )
+        self.assertEqual([(1, 0, 100)], _ranges(PartInfo.split_parts(100, 100)))
+
+    def test_split_subrange(self) -> None:
+        parts = PartInfo.split_parts(450, 100, first_part=3, last_part=9)
+        self.assertEqual([(3, 200, 300), (4, 300, 400), (5, 400, 450)], _ranges(parts))
+        self.assertEqual("part.00005_400-450", parts[-1].name)
+
+
+if __name__ == "__main__":
+    unittest.main()
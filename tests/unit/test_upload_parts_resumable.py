@@ -0,0 +1,84 @@
+"""
+Unit test file.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from rclone_api.s3.multipart.upload_parts_resumable import upload_parts_resumable
+from rclone_api.types import SizeSuffix
+
+_CHUNK = 5 * 1024 * 1024
+
+
+class _FakeRclone:
+    """Just enough of RcloneImpl to upload parts into a dict."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    def size_file(self, src: str) -> SizeSuffix:
+        return SizeSuffix(os.path.getsize(src))
+
+    def stat(self, src: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            size=os.path.getsize(src), mod_time=lambda: "2024-01-01T00:00:00"
+        )
+
+    def read_bytes(self, src: str) -> bytes | Exception:
+        if src not in self.store:
+            return FileNotFoundError(src)
+        return self.store[src]
+
+    def write_bytes(self, dst: str, data: bytes) -> None:
+        self.store[dst] = data
+
+    def ls(self, src: str) -> SimpleNamespace:
+        names = [k[len(src) + 1 :] for k in self.store if k.startswith(src + "/")]
+        return SimpleNamespace(files=[SimpleNamespace(name=n) for n in names])
+
+    def copy_to(self, src: str, dst: str) -> None:
+        self.store[dst] = Path(src).read_bytes()
+
+
+class UploadPartsResumableTester(unittest.TestCase):
+    """Test resuming a parts upload."""
+
+    def test_resume_tail_part_keeps_chunk_size(self) -> None:
+        rclone = _FakeRclone()
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                src = Path(tmpdir) / "big.bin"
+                data = os.urandom(2 * _CHUNK + 1000)
+                src.write_bytes(data)
+                dst_dir = "dst:bucket/big.bin-parts"
+                chunk_size = SizeSuffix(_CHUNK)
+                upload = upload_parts_resumable
+                err = upload(rclone, str(src), dst_dir, chunk_size=chunk_size)  # type: ignore
+                self.assertIsNone(err)
+                tail = [k for k in rclone.store if "/part.00003_" in k]
+                self.assertEqual(1, len(tail))
+                # Lose the short last part and resume with only it left.
+                del rclone.store[tail[0]]
+                info = rclone.store[f"{dst_dir}/info.json"].replace(
+                    b'"finished": true', b'"finished": false'
+                )
+                rclone.store[f"{dst_dir}/info.json"] = info
+                self.assertIsNone(upload(rclone, str(src), dst_dir))  # type: ignore
+                self.assertIn(tail[0], rclone.store)
+                self.assertEqual(data[2 * _CHUNK :], rclone.store[tail[0]])
+                self.assertIn(
+                    f'"chunksize_int": {_CHUNK}'.encode(),
+                    rclone.store[f"{dst_dir}/info.json"],
+                )
+            finally:
+                os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    unittest.main()
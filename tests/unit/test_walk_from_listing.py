@@ -0,0 +1,147 @@
+"""
+Unit test file.
+"""
+
+import subprocess
+import unittest
+from unittest import mock
+
+from rclone_api.detail.walk import walk_from_listing
+from rclone_api.dir import Dir
+from rclone_api.dir_listing import DirListing
+from rclone_api.rclone_impl import RcloneImpl
+from rclone_api.remote import Remote
+from rclone_api.rpath import RPath
+from rclone_api.scan_missing_folders import scan_missing_folders_recursive
+from rclone_api.types import Order
+
+
+def _rpath(path: str, is_dir: bool) -> RPath:
+    rpath = RPath(
+        remote=None,  # type: ignore
+        path=path,
+        name=path.rsplit("/", 1)[-1],
+        size=0 if is_dir else 1,
+        mime_type="inode/directory" if is_dir else "text/plain",
+        mod_time="",
+        is_dir=is_dir,
+    )
+    rpath.rclone = object()  # type: ignore # never called in these tests
+    return rpath
+
+
+def _listing(dirs: list[str], files: list[str]) -> DirListing:
+    return DirListing(
+        [_rpath(d, True) for d in dirs] + [_rpath(f, False) for f in files]
+    )
+
+
+class WalkFromListingTester(unittest.TestCase):
+    """Test splitting one recursive listing into per directory listings."""
+
+    def setUp(self) -> None:
+        self.root = Dir(_rpath("bucket/root", True))
+        self.listing = _listing(
+            dirs=["bucket/root/a", "bucket/root/b", "bucket/root/a/c"],
+            files=[
+                "bucket/root/first.txt",
+                "bucket/root/a/x.txt",
+                "bucket/root/a/c/y.txt",
+            ],
+        )
+
+    def test_breadth_first(self) -> None:
+        listings = list(walk_from_listing(self.root, self.listing, True))
+        self.assertEqual(4, len(listings))
+        self.assertEqual(["first.txt"], [f.name for f in listings[0].files])
+        self.assertEqual(["a", "b"], [d.name for d in listings[0].dirs])
+        self.assertEqual(["y.txt"], [f.name for f in listings[-1].files])
+
+    def test_depth_first(self) -> None:
+        # Children before their parent, like walk()
+        listings = list(walk_from_listing(self.root, self.listing, False))
+        files = [[f.name for f in d.files] for d in listings]
+        self.assertEqual([["y.txt"], ["x.txt"], [], ["first.txt"]], files)
+
+    def test_entries_and_order(self) -> None:
+        entries = iter(self.listing.dirs + self.listing.files)
+        listings = list(
+            walk_from_listing(
+                self.root,
+                (item.path for item in entries),
+                True,
+                order=Order.REVERSE,
+            )
+        )
+        self.assertEqual(["b", "a"], [d.name for d in listings[0].dirs])
+        self.assertEqual(["y.txt"], [f.name for f in listings[-1].files])
+
+    def test_max_depth(self) -> None:
+        listings = list(walk_from_listing(self.root, self.listing, True, 1))
+        self.assertEqual(3, len(listings))
+
+
+class _FakeProcess:
+    def __init__(self, lines: list[bytes], returncode: int) -> None:
+        self.stdout = iter(lines)
+        self.returncode = returncode
+
+    def __enter__(self) -> "_FakeProcess":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+class IterLsTreeTester(unittest.TestCase):
+    """Test parsing a recursive lsjson with rclone log lines mixed in."""
+
+    def _run(self, returncode: int) -> list[RPath]:
+        entry = (
+            b'{"Path":"a/x.txt","Name":"x.txt","Size":1,"MimeType":"text/plain",'
+            b'"ModTime":"","IsDir":false},'
+        )
+        lines = [
+            b"[\n",
+            b"2024/01/01 00:00:00 NOTICE: some log line\n",
+            entry + b"\n",
+            b"2024/01/01 00:00:01 ERROR : a/broken: failed\n",
+            b"]\n",
+        ]
+        rclone = RcloneImpl.__new__(RcloneImpl)
+        root_path = _rpath("bucket/root", True)
+        root_path.remote = Remote("dst", rclone)
+        root = Dir(root_path)
+        with mock.patch.object(
+            rclone, "_launch_process", return_value=_FakeProcess(lines, returncode)
+        ):
+            return list(rclone._iter_ls_tree(root, -1, False))
+
+    def test_skips_log_lines(self) -> None:
+        paths = self._run(0)
+        self.assertEqual(["bucket/root/a/x.txt"], [p.path for p in paths])
+
+    def test_error_has_log(self) -> None:
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            self._run(3)
+        self.assertEqual(3, ctx.exception.returncode)
+        self.assertIn("ERROR : a/broken", ctx.exception.stderr)
+
+
+class ScanMissingFoldersRecursiveTester(unittest.TestCase):
+    """Test the set difference used for recursive missing folder scans."""
+
+    def test_missing(self) -> None:
+        src = Dir(_rpath("src/root", True))
+        dst = Dir(_rpath("dst/other", True))
+        src_listing = _listing(["src/root/a", "src/root/b", "src/root/b/c"], [])
+        dst_listing = _listing(["dst/other/a"], [])
+        missing = scan_missing_folders_recursive(src, dst, src_listing, dst_listing)
+        self.assertEqual(["src/root/b", "src/root/b/c"], [d.path.path for d in missing])
+
+
+if __name__ == "__main__":
+    unittest.main()
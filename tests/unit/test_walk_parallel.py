@@ -0,0 +1,88 @@
+"""
+Unit test file.
+"""
+
+import unittest
+from dataclasses import dataclass, field
+from queue import Queue
+
+from rclone_api.detail.walk import (
+    walk,
+    walk_runner_breadth_first_parallel,
+    walk_runner_depth_first_parallel,
+)
+from rclone_api.types import Order
+
+
+@dataclass
+class _FakeListing:
+    name: str
+    dirs: list["_FakeDir"]
+
+
+@dataclass
+class _FakeDir:
+    name: str
+    children: list["_FakeDir"] = field(default_factory=list)
+
+    def ls(
+        self, max_depth: int | None = None, order: Order = Order.NORMAL
+    ) -> _FakeListing:
+        assert not max_depth
+        return _FakeListing(name=self.name, dirs=list(self.children))
+
+
+def _make_tree() -> _FakeDir:
+    leaves_a = [_FakeDir(f"a/{i}") for i in range(5)]
+    leaves_b = [_FakeDir(f"b/{i}") for i in range(5)]
+    return _FakeDir(
+        "root", [_FakeDir("a", leaves_a), _FakeDir("b", leaves_b), _FakeDir("c")]
+    )
+
+
+def _run(
+    max_depth: int, stat_threads: int, runner=walk_runner_breadth_first_parallel
+) -> list[str]:
+    out_queue: Queue = Queue()
+    runner(
+        _make_tree(), max_depth, out_queue, stat_threads=stat_threads  # type: ignore
+    )
+    names: list[str] = []
+    while (item := out_queue.get()) is not None:
+        names.append(item.name)
+    return names
+
+
+class WalkParallelTester(unittest.TestCase):
+    """Test the concurrent breadth first walk runner."""
+
+    def test_visits_every_dir_once(self) -> None:
+        names = _run(max_depth=-1, stat_threads=8)
+        self.assertEqual("root", names[0])
+        self.assertEqual(14, len(names))
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_max_depth(self) -> None:
+        names = _run(max_depth=1, stat_threads=8)
+        self.assertEqual(["a", "b", "c"], sorted(names[1:]))
+
+    def test_depth_first_order(self) -> None:
+        names = _run(-1, 8, runner=walk_runner_depth_first_parallel)
+        expected = [f"a/{i}" for i in range(5)] + ["a"]
+        expected += [f"b/{i}" for i in range(5)] + ["b", "c", "root"]
+        self.assertEqual(expected, names)
+
+    def test_depth_first_max_depth(self) -> None:
+        names = _run(1, 8, runner=walk_runner_depth_first_parallel)
+        self.assertEqual(["a", "b", "c", "root"], names)
+
+    def test_default_walk_is_level_order(self) -> None:
+        # Serial by default, so breadth first is strictly level by level.
+        names = [d.name for d in walk(_make_tree(), breadth_first=True)]  # type: ignore
+        expected = ["root", "a", "b", "c"]
+        expected += [f"a/{i}" for i in range(5)] + [f"b/{i}" for i in range(5)]
+        self.assertEqual(expected, names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Unit test file.
+"""
+
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rclone_api.util import _which_rclone
+
+
+class WhichRcloneTester(unittest.TestCase):
+    """Test the cached rclone executable lookup."""
+
+    def test_cached_per_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            name = "rclone.exe" if os.name == "nt" else "rclone"
+            exe = Path(tmpdir) / name
+            exe.write_text("")
+            exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+            with mock.patch.dict(os.environ, {"PATH": tmpdir}):
+                self.assertEqual(exe, _which_rclone())
+                with mock.patch("shutil.which") as which:
+                    self.assertEqual(exe, _which_rclone())
+                    which.assert_not_called()
+                # A stale entry is dropped once the file disappears.
+                exe.unlink()
+                self.assertIsNone(_which_rclone())
+
+
+if __name__ == "__main__":
+    unittest.main()